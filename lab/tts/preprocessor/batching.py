@@ -0,0 +1,77 @@
+"""
+길이 버킷 배치 구성 (ByT5 generate용)
+
+입력 순서대로 batch_size씩 자르면 배치 안의 가장 긴 입력에 맞춰 패딩하므로,
+긴 문구 하나("red willow county")가 섞인 배치는 짧은 단어도 인코딩과 beam search에서 패딩 비용을 냅니다.
+입력을 길이(바이트 수)순으로 정렬해 비슷한 길이끼리 배치를 만들고, 결과는 원래 순서로 돌려놓습니다.
+
+배치 크기 기준:
+    - batch_size: 배치당 최대 입력 수 (기본)
+    - max_tokens: 배치당 최대 패딩 포함 바이트 수 (가장 긴 입력 길이 × 입력 수)
+                  짧은 입력은 많이, 긴 입력은 적게 묶음. batch_size 제한도 함께 적용
+
+사용 예:
+    results = run_bucketed(texts, generate_batch, batch_size=32, max_tokens=2048)
+"""
+from typing import Callable, Optional
+
+
+def byte_length(text: str) -> int:
+    """ByT5 입력 길이 (UTF-8 바이트 + EOS)"""
+    return len(text.encode("utf-8")) + 1
+
+
+def bucketed_batches(
+    lengths: list[int],
+    batch_size: int = 32,
+    max_tokens: Optional[int] = None,
+    sort_by_length: bool = True
+) -> list[list[int]]:
+    """
+    입력 길이 목록으로 배치(원래 인덱스 리스트)들을 만듭니다.
+
+    Args:
+        lengths: 입력별 길이
+        batch_size: 배치당 최대 입력 수
+        max_tokens: 배치당 최대 패딩 포함 길이 (None이면 batch_size만 사용)
+        sort_by_length: False면 입력 순서대로 자름 (비교용)
+    """
+    order = list(range(len(lengths)))
+    if sort_by_length:
+        order.sort(key=lengths.__getitem__)
+
+    batches = []
+    batch = []
+    longest = 0
+    for index in order:
+        length = lengths[index]
+        padded = max(longest, length) * (len(batch) + 1)
+        if batch and (len(batch) >= batch_size or (max_tokens is not None and padded > max_tokens)):
+            batches.append(batch)
+            batch = []
+            longest = 0
+        batch.append(index)
+        longest = max(longest, length)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def run_bucketed(
+    texts: list[str],
+    generate_batch: Callable[[list[str]], list[str]],
+    batch_size: int = 32,
+    max_tokens: Optional[int] = None,
+    sort_by_length: bool = True,
+    length_fn: Callable[[str], int] = byte_length
+) -> list[str]:
+    """
+    texts를 길이 버킷 배치로 나눠 generate_batch를 호출하고, 결과를 texts 순서로 반환합니다.
+    """
+    lengths = [length_fn(text) for text in texts]
+    results = [None] * len(texts)
+    for batch in bucketed_batches(lengths, batch_size, max_tokens, sort_by_length):
+        outputs = generate_batch([texts[i] for i in batch])
+        for i, output in zip(batch, outputs):
+            results[i] = output
+    return results
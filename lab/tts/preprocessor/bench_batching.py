@@ -0,0 +1,84 @@
+"""
+Eng2KorTransliterator.transliterate_batch 배치 구성 방식별 처리량 비교
+
+train/test_data.json의 영어 입력으로
+    - arrival : 입력 순서대로 batch_size씩 (기존 방식)
+    - bucketed: 길이순 정렬 후 batch_size씩
+    - budget  : 길이순 정렬 후 배치당 max_tokens 바이트까지 (입력 수 제한은 --max-batch-size)
+의 처리량, 패딩 비율, 정답 일치율을 출력합니다.
+
+사용 방법:
+    python bench_batching.py
+    python bench_batching.py --limit 2000 --batch-size 64 --max-tokens 2048
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+from batching import bucketed_batches, byte_length
+from inference_byt5 import Eng2KorTransliterator
+from resources import TRANSLITERATION_KWARGS
+
+
+TEST_DATA_PATH = Path(__file__).parent / "train" / "test_data.json"
+MODEL_PATH = Path(__file__).parent / "train" / "models" / "byt5-eng2kor"
+TASK_PREFIX = "transliterate: "
+
+
+def load_test_data(limit: int) -> tuple[list[str], list[str]]:
+    inputs, targets = [], []
+    with open(TEST_DATA_PATH, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                row = json.loads(line)
+                inputs.append(row["input_text"].replace(TASK_PREFIX, ""))
+                targets.append(row["target_text"])
+    return inputs[:limit], targets[:limit]
+
+
+def padding_ratio(lengths: list[int], batches: list[list[int]]) -> float:
+    """패딩 포함 전체 길이 중 패딩이 차지하는 비율"""
+    padded = sum(max(lengths[i] for i in batch) * len(batch) for batch in batches)
+    return 1 - sum(lengths) / padded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="길이 버킷 배치 처리량 비교")
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--max-tokens", type=int, default=1024)
+    parser.add_argument("--max-batch-size", type=int, default=128, help="budget 모드의 배치당 최대 입력 수")
+    args = parser.parse_args()
+
+    inputs, targets = load_test_data(args.limit)
+    lengths = [byte_length(TASK_PREFIX + text.lower()) for text in inputs]
+    transliterator = Eng2KorTransliterator(str(MODEL_PATH))
+
+    modes = {
+        "arrival": {"batch_size": args.batch_size, "sort_by_length": False},
+        "bucketed": {"batch_size": args.batch_size},
+        "budget": {"batch_size": args.max_batch_size, "max_tokens": args.max_tokens},
+    }
+
+    print("=" * 80)
+    print(f"samples: {len(inputs)}, batch_size: {args.batch_size}, max_tokens: {args.max_tokens}, "
+          f"{TRANSLITERATION_KWARGS}")
+    print(f"{'mode':10} {'batches':>8} {'padding':>8} {'accuracy':>9} {'words/s':>9}")
+    for mode, options in modes.items():
+        batches = bucketed_batches(
+            lengths, options["batch_size"], options.get("max_tokens"), options.get("sort_by_length", True)
+        )
+        start = time.perf_counter()
+        outputs = transliterator.transliterate_batch(
+            inputs, **options, **TRANSLITERATION_KWARGS
+        )
+        elapsed = time.perf_counter() - start
+        accuracy = sum(o == t for o, t in zip(outputs, targets)) / len(targets)
+        print(f"{mode:10} {len(batches):8} {padding_ratio(lengths, batches):8.1%} "
+              f"{accuracy:9.2%} {len(inputs) / elapsed:9.1f}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
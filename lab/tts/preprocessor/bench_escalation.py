@@ -0,0 +1,62 @@
+"""
+신뢰도 기반 단계적 디코딩 정확도 및 지연 시간 비교
+
+train/test_data_arpabet.json (ARPABET 입력 → 한글 정답)으로
+    - 항상 beam search (기존)
+    - greedy → (신뢰도 < threshold) beam search
+를 비교하고, threshold별 정답 일치율, beam 결과와의 일치율, 단계별 사용 비율, 단어당 평균 지연 시간을 출력합니다.
+
+사용 방법:
+    python bench_escalation.py
+    python bench_escalation.py --limit 500 --thresholds 0.8 0.9 0.95
+    python bench_escalation.py --draft-model ./train/models/byt5-small-arpabet2kor
+"""
+import argparse
+import time
+from bench_onnx import load_test_data
+from inference_arpabet_pipeline import Eng2KorTransliteratorPipeline
+from resources import TRANSLITERATOR_MODEL_PATH, TRANSLITERATION_KWARGS
+
+
+def accuracy(outputs: list[str], targets: list[str]) -> float:
+    return sum(o == t for o, t in zip(outputs, targets)) / len(targets)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="신뢰도 기반 단계적 디코딩 비교")
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.8, 0.9, 0.95])
+    parser.add_argument("--draft-model", default=None, help="greedy 단계에 쓸 작은 모델")
+    args = parser.parse_args()
+
+    inputs, targets = load_test_data(args.limit)
+    pipeline = Eng2KorTransliteratorPipeline(
+        str(TRANSLITERATOR_MODEL_PATH), draft_model_path=args.draft_model
+    )
+
+    start = time.perf_counter()
+    beam_outputs = pipeline.arpabet_to_korean_batch(inputs, batch_size=args.batch_size, **TRANSLITERATION_KWARGS)
+    beam_ms = (time.perf_counter() - start) / len(inputs) * 1000
+
+    print("=" * 90)
+    print(f"samples: {len(inputs)}, batch_size: {args.batch_size}, draft: {args.draft_model}, {TRANSLITERATION_KWARGS}")
+    print(f"{'mode':18} {'accuracy':>9} {'parity':>8} {'ms/word':>9}  tiers")
+    print(f"{'beam':18} {accuracy(beam_outputs, targets):9.2%} {1:8.2%} {beam_ms:9.2f}")
+
+    for threshold in args.thresholds:
+        pipeline.confidence_threshold = threshold
+        pipeline.tier_counts.clear()
+        pipeline.tier_time.clear()
+        pipeline.escalated_words = 0
+
+        outputs = pipeline.arpabet_to_korean_escalating(inputs, batch_size=args.batch_size, **TRANSLITERATION_KWARGS)
+        stats = pipeline.escalation_stats()
+        tiers = ", ".join(f"{tier} {info['rate']:.1%}" for tier, info in stats["tiers"].items())
+        print(f"{f'escalate@{threshold}':18} {accuracy(outputs, targets):9.2%} "
+              f"{accuracy(outputs, beam_outputs):8.2%} {stats['avg_latency_ms']:9.2f}  {tiers}")
+    print("=" * 90)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+g2p_en.G2p vs g2p_fast.FastG2p 결과 일치 여부 및 단어당 지연 시간 비교
+
+train/test_data.json의 영어 단어를 사용합니다.
+
+사용 방법:
+    python bench_g2p.py
+"""
+import json
+import time
+from pathlib import Path
+from g2p_en import G2p
+from g2p_fast import FastG2p
+
+
+TEST_DATA_PATH = Path(__file__).parent / "train" / "test_data.json"
+WORD_LIMIT = 1000
+
+
+def load_words(limit: int = WORD_LIMIT) -> list[str]:
+    words = []
+    with open(TEST_DATA_PATH, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                text = json.loads(line)["input_text"].replace("transliterate: ", "")
+                words.extend(text.lower().split())
+    return list(dict.fromkeys(words))[:limit]
+
+
+def per_word_us(fn, words: list[str]) -> float:
+    start = time.perf_counter()
+    for word in words:
+        fn(word)
+    return (time.perf_counter() - start) / len(words) * 1e6
+
+
+def main():
+    words = load_words()
+
+    start = time.perf_counter()
+    g2p = G2p()
+    print(f"G2p load      : {time.perf_counter() - start:.2f}s")
+    start = time.perf_counter()
+    fast = FastG2p()
+    fast("warmup")
+    print(f"FastG2p load  : {time.perf_counter() - start:.2f}s (CMUdict only)")
+
+    mismatches = [w for w in words if g2p(w) != fast(w)]
+    fast.clear_cache()
+
+    print("-" * 60)
+    print(f"words: {len(words)}, mismatches: {len(mismatches)} {mismatches[:5]}")
+    print(f"G2p               : {per_word_us(g2p, words):10.1f} us/word")
+    print(f"FastG2p (cold)    : {per_word_us(fast, words):10.1f} us/word "
+          f"(dict {fast.dict_hits}, fallback {fast.fallbacks})")
+    print(f"FastG2p (cached)  : {per_word_us(fast, words):10.1f} us/word")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+hgtk vs hangul 모듈 속도 비교
+
+사용 방법:
+    python bench_hangul.py
+"""
+import timeit
+import hgtk
+from hangul import is_hangul, is_hangul_batch, has_jongseong
+from resources import get_mecab
+from demo import TEST_CASES
+
+
+def hgtk_has_final(ch: str) -> bool:
+    return hgtk.letter.decompose(ch)[2] != ''
+
+
+def main():
+    mecab = get_mecab()
+    tokens = [m[0] for text in TEST_CASES for m in mecab.pos(text)]
+    syllables = [ch for token in tokens for ch in token if is_hangul(ch)]
+    number = 200
+
+    print(f"tokens: {len(tokens)}, hangul letters: {len(syllables)}, repeat: {number}")
+    print("-" * 60)
+
+    cases = [
+        ("is_hangul (hgtk)", lambda: [hgtk.checker.is_hangul(t) for t in tokens]),
+        ("is_hangul (hangul)", lambda: [is_hangul(t) for t in tokens]),
+        ("is_hangul_batch (hangul)", lambda: is_hangul_batch(tokens)),
+        ("jongseong (hgtk decompose)", lambda: [hgtk_has_final(ch) for ch in syllables]),
+        ("jongseong (hangul)", lambda: [has_jongseong(ch) for ch in syllables]),
+    ]
+
+    baseline = {}
+    for name, fn in cases:
+        elapsed = timeit.timeit(fn, number=number)
+        key = name.split(" (")[0].replace("_batch", "")
+        baseline.setdefault(key, elapsed)
+        speedup = baseline[key] / elapsed
+        print(f"{name:30} {elapsed * 1000 / number:8.3f} ms/iter   x{speedup:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+한글 바이트 제약 디코딩 on/off, beam 수, max_length별 정확도 및 처리량 비교
+
+train/test_data_arpabet.json으로 설정마다
+    - 정답 일치율
+    - 한글 음절/공백/하이픈 외 문자가 섞였거나, 하이픈이 음절 사이가 아닌 곳에 있는 출력 비율 (invalid)
+    - 배치 처리량
+을 출력합니다. 제약을 켜고 beam 수나 max_length를 줄여도 정확도가 유지되는지 확인하는 용도입니다.
+
+사용 방법:
+    python bench_hangul_constraint.py
+    python bench_hangul_constraint.py --beams 1 2 4 --max-lengths 48 64
+"""
+import argparse
+import re
+import time
+from transformers import LogitsProcessorList
+from bench_onnx import load_test_data
+from hangul_constraint import ALLOWED_PUNCTUATION, HangulByteLogitsProcessor
+from inference_arpabet_pipeline import Eng2KorTransliteratorPipeline
+from resources import TRANSLITERATOR_MODEL_PATH
+
+
+VALID_OUTPUT = re.compile(f"[가-힣{re.escape(ALLOWED_PUNCTUATION)}]+")
+# 연속 하이픈, 하이픈으로 시작/끝, 하이픈 앞뒤 공백
+MISPLACED_HYPHEN = re.compile(r"--|^-|-$| -|- ")
+
+
+def is_valid(output: str) -> bool:
+    return bool(VALID_OUTPUT.fullmatch(output)) and not MISPLACED_HYPHEN.search(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="한글 바이트 제약 디코딩 비교")
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--beams", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--max-lengths", type=int, nargs="+", default=[48, 64])
+    args = parser.parse_args()
+
+    inputs, targets = load_test_data(args.limit)
+    pipeline = Eng2KorTransliteratorPipeline(str(TRANSLITERATOR_MODEL_PATH))
+    constraint = LogitsProcessorList([HangulByteLogitsProcessor()])
+
+    print("=" * 80)
+    print(f"samples: {len(inputs)}, batch_size: {args.batch_size}")
+    print(f"{'constraint':>10} {'beams':>6} {'max_len':>8} {'accuracy':>9} {'invalid':>8} {'words/s':>9}")
+    for use_constraint in (False, True):
+        pipeline.logits_processor = constraint if use_constraint else None
+        for num_beams in args.beams:
+            for max_length in args.max_lengths:
+                start = time.perf_counter()
+                outputs = pipeline.arpabet_to_korean_batch(
+                    inputs, num_beams=num_beams, max_length=max_length, batch_size=args.batch_size
+                )
+                elapsed = time.perf_counter() - start
+                accuracy = sum(o == t for o, t in zip(outputs, targets)) / len(targets)
+                invalid = sum(not is_valid(o) for o in outputs) / len(outputs)
+                print(f"{'on' if use_constraint else 'off':>10} {num_beams:6} {max_length:8} "
+                      f"{accuracy:9.2%} {invalid:8.2%} {len(inputs) / elapsed:9.1f}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+numerals 모듈 검증 및 속도 비교
+
+readutils의 기존 숫자 읽기 구현(자리수 단위 반복)과 numerals 테이블 구현이
+겹치는 범위(0 ~ 10^16 - 1, 음수)에서 같은 결과를 내는지 전수/샘플 비교하고 속도를 잽니다.
+
+사용 방법:
+    python bench_numerals.py
+"""
+import random
+import time
+from decimal import Decimal
+import numerals
+from lexicon import _SINO_DIGITS, _SINO_SMALL_UNITS, _NATIVE_ONES, _NATIVE_TENS
+
+
+# --- 기존 구현 (비교 기준) ---
+_LEGACY_BIG_UNITS = ["", "만", "억", "조", "경"]
+
+
+def legacy_read_sino_kor(n: int) -> str:
+    if n == 0:
+        return "영"
+    if n < 0:
+        return "마이너스 " + legacy_read_sino_kor(-n)
+    if n > 9999999999999999:
+        return str(n)
+
+    parts = []
+    group_index = 0
+    while n > 0:
+        group = n % 10000
+        n //= 10000
+        if group == 0:
+            group_index += 1
+            continue
+        small_parts = []
+        pos = 0
+        while group > 0:
+            digit = group % 10
+            group //= 10
+            if digit != 0:
+                if pos > 0 and digit == 1:
+                    small_parts.append(_SINO_SMALL_UNITS[pos])
+                else:
+                    small_parts.append(_SINO_DIGITS[digit] + _SINO_SMALL_UNITS[pos])
+            pos += 1
+        parts.append("".join(reversed(small_parts)) + _LEGACY_BIG_UNITS[group_index])
+        group_index += 1
+    return "".join(reversed(parts))
+
+
+def legacy_read_native_kor(n: int) -> str:
+    if n >= 100:
+        return legacy_read_sino_kor(n)
+    if n == 20:
+        return "스무"
+    tens = n // 10
+    ones = n % 10
+    if tens == 0:
+        return _NATIVE_ONES.get(ones, legacy_read_sino_kor(n))
+    if ones == 0:
+        return _NATIVE_TENS.get(tens, legacy_read_sino_kor(n))
+    tens_str = _NATIVE_TENS.get(tens, "")
+    ones_str = _NATIVE_ONES.get(ones, "")
+    if tens_str and ones_str:
+        return tens_str + ones_str
+    return legacy_read_sino_kor(n)
+
+
+def legacy_read_only_num(n) -> str:
+    nums = '영일이삼사오육칠팔구'
+    return ''.join(nums[int(z)] for z in str(n))
+
+
+# --- 검증 ---
+EXHAUSTIVE_MAX = 1_000_000
+SAMPLE_COUNT = 200_000
+SEED = 42
+
+
+def sample_numbers() -> list[int]:
+    rng = random.Random(SEED)
+    numbers = list(range(EXHAUSTIVE_MAX))
+    # 큰 수: 자리수를 고르게 뽑고, 만/억/조 묶음이 0인 경우도 섞음
+    for _ in range(SAMPLE_COUNT):
+        n = rng.randint(0, 10 ** rng.randint(7, 16) - 1)
+        if rng.random() < 0.3:
+            n -= n % (10 ** (4 * rng.randint(1, 3)))
+        numbers.append(n)
+    numbers += [10 ** k for k in range(16)] + [10 ** 16 - 1]
+    return numbers
+
+
+def check(name: str, new, legacy, values) -> int:
+    mismatches = [v for v in values if new(v) != legacy(v)]
+    print(f"{name:12} {len(values):>9} cases, mismatches: {len(mismatches)}"
+          + (f"  e.g. {mismatches[:3]}" if mismatches else ""))
+    return len(mismatches)
+
+
+def timed(fn, values) -> float:
+    start = time.perf_counter()
+    for v in values:
+        fn(v)
+    return time.perf_counter() - start
+
+
+def main():
+    numbers = sample_numbers()
+    negatives = list(range(-10_000, 0))
+    native_range = list(range(-1000, 10_000))
+
+    print("=" * 70)
+    failures = 0
+    failures += check("sino", numerals.sino, legacy_read_sino_kor, numbers + negatives)
+    failures += check("native", numerals.native, legacy_read_native_kor, native_range)
+    failures += check("digits", numerals.digits, legacy_read_only_num, numbers)
+
+    print("-" * 70)
+    for name, new, legacy in [
+        ("sino", numerals.sino, legacy_read_sino_kor),
+        ("native", numerals.native, legacy_read_native_kor),
+        ("digits", numerals.digits, legacy_read_only_num),
+    ]:
+        values = native_range if name == "native" else numbers
+        legacy_time = timed(legacy, values)
+        new_time = timed(new, values)
+        print(f"{name:12} legacy {legacy_time * 1000:8.1f} ms   numerals {new_time * 1000:8.1f} ms"
+              f"   x{legacy_time / new_time:.2f}")
+
+    start = time.perf_counter()
+    numerals.read_batch(numbers)
+    print(f"{'read_batch':12} {(time.perf_counter() - start) * 1000:8.1f} ms ({len(numbers)} values)")
+
+    print("-" * 70)
+    for value in [10 ** 16, 10 ** 20 + 7, 10 ** 48, 123456789012345678901234]:
+        print(f"{value} → {numerals.sino(value)}")
+    for value in ["3.14", "-0.5", "12.05", "100", 1e-05, 1e20, -2.5, Decimal("1E+3")]:
+        print(f"{value} → {numerals.decimal(value)}")
+    print("=" * 70)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,87 @@
+"""
+torch / onnx / onnx-int8 백엔드 정확도 및 지연 시간 비교
+
+train/test_data_arpabet.json (ARPABET 입력 → 한글 정답)으로
+    - 정답 일치율 (exact match)
+    - torch 결과와의 일치율 (parity)
+    - 단어별(batch 1) 지연 시간, 배치 처리량
+을 출력합니다.
+
+사용 방법:
+    python bench_onnx.py
+    python bench_onnx.py --limit 500 --backends torch onnx-int8
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+from inference_arpabet_pipeline import Eng2KorTransliteratorPipeline
+from onnx_backend import BACKENDS
+from resources import TRANSLITERATOR_MODEL_PATH, TRANSLITERATION_KWARGS
+
+
+TEST_DATA_PATH = Path(__file__).parent / "train" / "test_data_arpabet.json"
+LATENCY_SAMPLES = 100
+
+
+def load_test_data(limit: int) -> tuple[list[str], list[str]]:
+    inputs, targets = [], []
+    with open(TEST_DATA_PATH, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                row = json.loads(line)
+                inputs.append(row["input_text"])
+                targets.append(row["target_text"])
+    return inputs[:limit], targets[:limit]
+
+
+def run_backend(backend: str, inputs: list[str], batch_size: int) -> dict:
+    pipeline = Eng2KorTransliteratorPipeline(str(TRANSLITERATOR_MODEL_PATH), backend=backend)
+
+    samples = inputs[:LATENCY_SAMPLES]
+    latencies = []
+    for arpabet in samples:
+        start = time.perf_counter()
+        pipeline.arpabet_to_korean(arpabet, **TRANSLITERATION_KWARGS)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+
+    start = time.perf_counter()
+    outputs = pipeline.arpabet_to_korean_batch(inputs, batch_size=batch_size, **TRANSLITERATION_KWARGS)
+    batch_time = time.perf_counter() - start
+
+    return {
+        "outputs": outputs,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "throughput": len(inputs) / batch_time,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ONNX 백엔드 정확도/지연 시간 비교")
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=BACKENDS)
+    args = parser.parse_args()
+
+    inputs, targets = load_test_data(args.limit)
+    results = {backend: run_backend(backend, inputs, args.batch_size) for backend in args.backends}
+    reference = results.get("torch", {}).get("outputs")
+
+    print("=" * 90)
+    print(f"samples: {len(inputs)}, batch_size: {args.batch_size}, {TRANSLITERATION_KWARGS}")
+    print(f"{'backend':10} {'accuracy':>9} {'parity':>8} {'p50 ms':>9} {'p99 ms':>9} {'words/s':>9}")
+    for backend, result in results.items():
+        outputs = result["outputs"]
+        accuracy = sum(o == t for o, t in zip(outputs, targets)) / len(targets)
+        parity = (sum(o == r for o, r in zip(outputs, reference)) / len(reference)
+                  if reference is not None else float("nan"))
+        print(f"{backend:10} {accuracy:9.2%} {parity:8.2%} {result['p50_ms']:9.1f} "
+              f"{result['p99_ms']:9.1f} {result['throughput']:9.1f}")
+    print("=" * 90)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+CPU 런타임 프로파일별 정확도 / 지연 시간 비교 및 호스트에 맞는 프로파일 저장
+
+train/test_data_arpabet.json으로 프로파일마다 모델을 새로 로드(warmup 포함)해서
+    - 정답 일치율, default(fp32) 결과와의 일치율 (parity)
+    - 단어별(batch 1) p50 지연 시간, 배치 처리량
+을 출력합니다. parity가 --min-parity 이상인 프로파일 중 배치 처리량이 가장 높은 것을
+cache/runtime_profile.json에 저장하면, 이후 runtime_profile=None으로 만든 파이프라인이 이를 사용합니다.
+
+사용 방법:
+    python bench_runtime_profile.py
+    python bench_runtime_profile.py --profiles default int8 bf16 --no-save
+"""
+import argparse
+import time
+from bench_onnx import load_test_data
+from inference_arpabet_pipeline import Eng2KorTransliteratorPipeline
+from resources import TRANSLITERATOR_MODEL_PATH, TRANSLITERATION_KWARGS
+import runtime_profile as rp
+
+
+LATENCY_SAMPLES = 100
+
+
+def run_profile(name: str, inputs: list[str], batch_size: int) -> dict:
+    start = time.perf_counter()
+    pipeline = Eng2KorTransliteratorPipeline(str(TRANSLITERATOR_MODEL_PATH), device="cpu", runtime_profile=name)
+    load_time = time.perf_counter() - start
+
+    latencies = []
+    for arpabet in inputs[:LATENCY_SAMPLES]:
+        start = time.perf_counter()
+        pipeline.arpabet_to_korean(arpabet, **TRANSLITERATION_KWARGS)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+
+    start = time.perf_counter()
+    outputs = pipeline.arpabet_to_korean_batch(inputs, batch_size=batch_size, **TRANSLITERATION_KWARGS)
+    batch_time = time.perf_counter() - start
+
+    return {
+        "outputs": outputs,
+        "load_s": load_time,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "throughput": len(inputs) / batch_time,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CPU 런타임 프로파일 비교")
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--profiles", nargs="+", default=list(rp.PROFILES), choices=list(rp.PROFILES))
+    parser.add_argument("--min-parity", type=float, default=0.99, help="default 결과와의 최소 일치율")
+    parser.add_argument("--no-save", action="store_true", help="선택 결과를 저장하지 않음")
+    args = parser.parse_args()
+
+    profiles = ["default"] + [name for name in args.profiles if name != "default"]
+    inputs, targets = load_test_data(args.limit)
+    results = {name: run_profile(name, inputs, args.batch_size) for name in profiles}
+    reference = results["default"]["outputs"]
+
+    print("=" * 90)
+    print(f"samples: {len(inputs)}, batch_size: {args.batch_size}, cpus: {rp.available_cpus()}, "
+          f"bf16: {rp.supports_bf16()}, {TRANSLITERATION_KWARGS}")
+    print(f"{'profile':14} {'accuracy':>9} {'parity':>8} {'load s':>8} {'p50 ms':>9} {'words/s':>9}")
+    summary = {}
+    for name, result in results.items():
+        outputs = result.pop("outputs")
+        result["accuracy"] = sum(o == t for o, t in zip(outputs, targets)) / len(targets)
+        result["parity"] = sum(o == r for o, r in zip(outputs, reference)) / len(reference)
+        summary[name] = result
+        print(f"{name:14} {result['accuracy']:9.2%} {result['parity']:8.2%} {result['load_s']:8.1f} "
+              f"{result['p50_ms']:9.1f} {result['throughput']:9.1f}")
+    print("=" * 90)
+
+    candidates = [name for name, result in summary.items() if result["parity"] >= args.min_parity]
+    best = max(candidates, key=lambda name: summary[name]["throughput"])
+    print(f"선택: {best}")
+    if not args.no_save:
+        rp.save_profile(best, summary)
+        print(f"저장: {rp.PROFILE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
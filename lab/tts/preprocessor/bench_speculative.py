@@ -0,0 +1,69 @@
+"""
+speculative decoding (byt5-small 초안 → byt5-base 검증) vs byt5-base greedy 비교 (CPU)
+
+train/test_data_arpabet.json으로 단어 하나씩(batch 1)
+    - base greedy (generate, KV cache 사용)
+    - speculative (제안 토큰 수 k별)
+를 실행해서 greedy 결과와의 일치율(100%여야 함), 정답 일치율, 제안 토큰 수락률,
+단어당 지연 시간, greedy 대비 속도 향상을 출력합니다.
+
+사용 방법:
+    python bench_speculative.py
+    python bench_speculative.py --limit 200 --draft-tokens 2 4 8
+"""
+import argparse
+import time
+from bench_onnx import load_test_data
+from inference_arpabet_pipeline import Eng2KorTransliteratorPipeline
+from resources import TRANSLITERATOR_MODEL_PATH, TRANSLITERATOR_DRAFT_MODEL_PATH
+
+
+MAX_LENGTH = 64
+
+
+def timed(fn, inputs: list[str]) -> tuple[list[str], float]:
+    outputs = []
+    start = time.perf_counter()
+    for arpabet in inputs:
+        outputs.append(fn(arpabet))
+    return outputs, (time.perf_counter() - start) / len(inputs) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="speculative decoding 비교")
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--draft-tokens", type=int, nargs="+", default=[2, 4, 6])
+    args = parser.parse_args()
+
+    inputs, targets = load_test_data(args.limit)
+    pipeline = Eng2KorTransliteratorPipeline(
+        str(TRANSLITERATOR_MODEL_PATH), device="cpu",
+        draft_model_path=str(TRANSLITERATOR_DRAFT_MODEL_PATH), speculative=True
+    )
+
+    pipeline.speculative = False
+    greedy, greedy_ms = timed(
+        lambda arpabet: pipeline.arpabet_to_korean(arpabet, num_beams=1, max_length=MAX_LENGTH), inputs
+    )
+    pipeline.speculative = True
+
+    print("=" * 90)
+    print(f"samples: {len(inputs)}, device: cpu, batch 1")
+    print(f"{'mode':16} {'parity':>8} {'accuracy':>9} {'accept':>8} {'tok/call':>9} {'ms/word':>9} {'speedup':>8}")
+    accuracy = sum(o == t for o, t in zip(greedy, targets)) / len(targets)
+    print(f"{'greedy':16} {1:8.2%} {accuracy:9.2%} {'-':>8} {'-':>9} {greedy_ms:9.2f} {1:8.2f}")
+
+    for k in args.draft_tokens:
+        pipeline.num_draft_tokens = k
+        pipeline.speculative_counts.clear()
+        outputs, ms = timed(lambda arpabet: pipeline.arpabet_to_korean(arpabet, max_length=MAX_LENGTH), inputs)
+        stats = pipeline.speculative_stats()
+        parity = sum(o == g for o, g in zip(outputs, greedy)) / len(greedy)
+        accuracy = sum(o == t for o, t in zip(outputs, targets)) / len(targets)
+        print(f"{f'speculative k={k}':16} {parity:8.2%} {accuracy:9.2%} {stats['acceptance_rate']:8.2%} "
+              f"{stats['tokens_per_target_call']:9.2f} {ms:9.2f} {greedy_ms / ms:8.2f}")
+    print("=" * 90)
+
+
+if __name__ == "__main__":
+    main()
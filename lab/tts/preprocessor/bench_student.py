@@ -0,0 +1,85 @@
+"""
+ByT5 교사 모델 vs 증류한 학생 모델 정확도 및 지연 시간 비교
+
+held-out train/test_data_arpabet.json (ARPABET 입력 → 한글 정답, 증류 라벨링에서 제외됨)으로
+    - 정답 일치율 (exact match), 교사 결과와의 일치율 (agreement)
+    - 단어별(batch 1) p50 / p99 지연 시간, 배치 처리량
+    - 파라미터 수
+를 출력합니다.
+
+사용 방법:
+    python bench_student.py
+    python bench_student.py --limit 500 --student-beams 1 4
+"""
+import argparse
+import time
+from pathlib import Path
+from bench_onnx import load_test_data
+from inference_arpabet_pipeline import Eng2KorTransliteratorPipeline
+from student_model import STUDENT_BACKEND
+
+
+MODELS_DIR = Path(__file__).parent / "train" / "models"
+TEACHER_MODEL_PATH = MODELS_DIR / "byt5-arpabet2kor"
+STUDENT_MODEL_PATH = MODELS_DIR / "student-arpabet2kor"
+LATENCY_SAMPLES = 100
+MAX_LENGTH = 64
+
+
+def run(pipeline, inputs: list[str], num_beams: int, batch_size: int) -> dict:
+    latencies = []
+    for arpabet in inputs[:LATENCY_SAMPLES]:
+        start = time.perf_counter()
+        pipeline.arpabet_to_korean(arpabet, num_beams=num_beams, max_length=MAX_LENGTH)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+
+    start = time.perf_counter()
+    outputs = pipeline.arpabet_to_korean_batch(inputs, num_beams=num_beams, max_length=MAX_LENGTH,
+                                               batch_size=batch_size)
+    batch_time = time.perf_counter() - start
+
+    return {
+        "outputs": outputs,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "throughput": len(inputs) / batch_time,
+    }
+
+
+def count_parameters(pipeline) -> int:
+    model = pipeline.model.model if pipeline.backend == STUDENT_BACKEND else pipeline.model
+    return sum(p.numel() for p in model.parameters())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="교사 vs 학생 모델 비교")
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--teacher-beams", type=int, default=4)
+    parser.add_argument("--student-beams", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    inputs, targets = load_test_data(args.limit)
+
+    teacher = Eng2KorTransliteratorPipeline(str(TEACHER_MODEL_PATH), device="cpu")
+    rows = {f"teacher (beam {args.teacher_beams})": (teacher, run(teacher, inputs, args.teacher_beams, args.batch_size))}
+    student = Eng2KorTransliteratorPipeline(str(STUDENT_MODEL_PATH), device="cpu", backend=STUDENT_BACKEND)
+    for num_beams in args.student_beams:
+        rows[f"student (beam {num_beams})"] = (student, run(student, inputs, num_beams, args.batch_size))
+    reference = next(iter(rows.values()))[1]["outputs"]
+
+    print("=" * 100)
+    print(f"samples: {len(inputs)}, batch_size: {args.batch_size}, device: cpu")
+    print(f"{'model':20} {'params':>12} {'accuracy':>9} {'agreement':>10} {'p50 ms':>9} {'p99 ms':>9} {'words/s':>9}")
+    for name, (pipeline, result) in rows.items():
+        outputs = result["outputs"]
+        accuracy = sum(o == t for o, t in zip(outputs, targets)) / len(targets)
+        agreement = sum(o == r for o, r in zip(outputs, reference)) / len(reference)
+        print(f"{name:20} {count_parameters(pipeline):12,} {accuracy:9.2%} {agreement:10.2%} "
+              f"{result['p50_ms']:9.1f} {result['p99_ms']:9.1f} {result['throughput']:9.1f}")
+    print("=" * 100)
+
+
+if __name__ == "__main__":
+    main()
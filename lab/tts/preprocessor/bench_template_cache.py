@@ -0,0 +1,50 @@
+"""
+템플릿 캐시 on/off 속도 및 hit rate 비교 (숫자 위주 문장)
+
+사용 방법:
+    python bench_template_cache.py
+"""
+import contextlib
+import io
+import time
+import normalizer
+from template_cache import TemplateCache
+from golden_corpus import synthetic_cases
+
+
+SENTENCE_COUNT = 5000
+
+
+def run(sentences: list[str], cache: TemplateCache) -> tuple[list[str], float]:
+    normalizer.template_cache = cache
+    outputs = []
+    # trans_bundle의 디버그 출력 억제
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for sentence in sentences:
+            outputs.append(normalizer.trans_sentence(sentence, True))
+        elapsed = time.perf_counter() - start
+    return outputs, elapsed
+
+
+def main():
+    normalizer.warmup(load_model=False)
+    sentences = synthetic_cases(SENTENCE_COUNT)
+
+    baseline, baseline_time = run(sentences, TemplateCache(maxsize=0))
+    cache = TemplateCache(maxsize=4096)
+    cached, cached_time = run(sentences, cache)
+
+    mismatches = sum(1 for a, b in zip(baseline, cached) if a != b)
+    stats = cache.stats()
+
+    print(f"sentences: {len(sentences)}, unique: {len(set(sentences))}")
+    print(f"no cache : {baseline_time * 1000:8.1f} ms")
+    print(f"cache    : {cached_time * 1000:8.1f} ms   x{baseline_time / cached_time:.2f}")
+    print(f"hit rate : {stats['hit_rate'] * 100:.1f}% ({stats['hits']} hits, {stats['misses']} misses, "
+          f"{stats['size']} templates)")
+    print(f"mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
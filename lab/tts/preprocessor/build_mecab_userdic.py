@@ -0,0 +1,238 @@
+"""
+영한 사전 키, 단위명사(counter), 단위 기호를 mecab-ko 사용자 사전으로 만드는 스크립트
+
+Mecab은 "e-mail", "x-ray", "korea.com" 같은 키를 기호 기준으로 쪼개고,
+"시간", "학년" 같은 단위는 NNBC가 아닌 NNG로 분석합니다.
+사용자 사전에 등록하면 하나의 토큰 + 올바른 품사로 나오므로
+trans_bundle에서 처리할 토큰 수와 count_exceptions 예외 처리가 줄어듭니다.
+
+- 영한 사전 키 (공백 없는 것): SL
+    기본값은 Mecab이 쪼개는 키(하이픈, 점, 아포스트로피 등 포함)만 등록,
+    --all-keys를 주면 알파벳으로만 된 키도 등록
+- lexicon._get_counter_reader 단위명사: NNBC
+    시스템 사전이 숫자 뒤에서 이미 NNBC로 분석하는 단위는 제외
+    (예: "3시간" → 시간/NNG, "3위안" → 위/NNBC + 안/NNG 인 것만 등록)
+- sign2kor_dict.json 단위 기호: SL (한 글자 단위는 Mecab이 이미 따로 분리하므로 제외)
+- normalizer.ENGLISH_PLACEHOLDER: SL (영어 연속열 자리표시자가 항상 한 토큰으로 분석되도록)
+
+사용 방법:
+    # CSV 생성 + (mecab-dict-index가 있으면) 컴파일
+    python build_mecab_userdic.py
+
+    # 사용자 사전 적용 전/후 토큰 수 비교 (golden corpus 기준)
+    python build_mecab_userdic.py --measure
+
+컴파일된 user.dic이 있으면 resources.get_mecab()이 자동으로 사용합니다.
+"""
+import argparse
+import json
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+from readutils import load_eng2kor_dict
+from lexicon import _get_counter_reader
+from hangul import has_jongseong, is_hangul_syllable
+from resources import MECAB_USER_DIC_PATH
+from normalizer import ENGLISH_PLACEHOLDER
+
+
+USERDIC_PATH = MECAB_USER_DIC_PATH
+USERDIC_DIR = USERDIC_PATH.parent
+USERDIC_CSV = USERDIC_DIR / "user.csv"
+SIGN_DICT_PATH = Path(__file__).parent / "dataset" / "sign2kor_dict.json"
+
+# 비용이 낮을수록 우선 선택됨 (mecab-ko-dic 일반 명사는 대략 0~5000)
+# 단위명사는 "포기", "말"처럼 일반 명사와 겹치므로 문맥(연접 비용)이 결정하도록 중간값 사용
+ENGLISH_COST = 1000
+COUNTER_COST = 2000
+SIGN_COST = 1000
+PLACEHOLDER_COST = 0
+
+_ALPHA_ONLY = re.compile(r'[A-Za-z]+')
+
+# mecab-ko-dic은 NNBC 문맥 ID를 표기(읽기)별로 정의하므로, 시스템 사전에 없는 단위명사는
+# 같은 종성 유무의 대표 단위명사 문맥을 빌려 씀 (없으면 mecab-dict-index가 LEFT-ID를 찾지 못함)
+CONTEXT_PROXY_COUNTERS = {'F': '개', 'T': '명'}
+
+MECAB_DICT_INDEX_CANDIDATES = [
+    "/usr/local/libexec/mecab/mecab-dict-index",
+    "/usr/libexec/mecab/mecab-dict-index",
+    "/usr/lib/mecab/mecab-dict-index",
+    "/opt/homebrew/libexec/mecab/mecab-dict-index",
+]
+
+
+def jong_flag(word: str) -> str:
+    """mecab-ko-dic 종성 유무 필드 (T/F, 한글이 아니면 *)"""
+    last = word[-1]
+    if not is_hangul_syllable(last):
+        return '*'
+    return 'T' if has_jongseong(last) else 'F'
+
+
+def make_row(surface: str, cost: int, pos: str, reading: str = None) -> str:
+    """
+    mecab-ko-dic CSV 형식:
+    표층형,좌문맥ID,우문맥ID,비용,품사,의미부류,종성유무,읽기,타입,첫번째품사,마지막품사,표현
+    문맥 ID는 비워두면 mecab-dict-index가 rewrite.def 기준으로 채움 (NNBC는 읽기까지 사용)
+    """
+    if reading is None:
+        reading = surface if pos == 'NNBC' else '*'
+    return f"{surface},,,{cost},{pos},*,{jong_flag(surface)},{reading},*,*,*,*"
+
+
+def nnbc_context_readings() -> set[str]:
+    """시스템 사전 left-id.def에 문맥 ID가 정의된 NNBC 읽기"""
+    readings = set()
+    with open(Path(system_dicdir()) / "left-id.def", 'r', encoding='utf-8') as f:
+        for line in f:
+            feature = line.rstrip('\n').split(' ', 1)[-1].split(',')
+            if feature[0] == 'NNBC':
+                readings.add(feature[3])
+    return readings
+
+
+def case_variants(key: str) -> list[str]:
+    """Mecab 사전은 대소문자를 구분하므로 흔한 표기를 함께 등록"""
+    variants = [key, key.lower(), key.capitalize(), key.upper()]
+    return list(dict.fromkeys(variants))
+
+
+def collect_rows(all_keys: bool = False) -> list[str]:
+    rows = {}
+
+    for key in load_eng2kor_dict():
+        if ' ' in key or ',' in key or '"' in key:
+            continue
+        # 알파벳으로만 된 키는 Mecab이 이미 하나의 SL 토큰으로 분석함
+        if not all_keys and _ALPHA_ONLY.fullmatch(key):
+            continue
+        for surface in case_variants(key):
+            rows.setdefault(surface, make_row(surface, ENGLISH_COST, 'SL'))
+
+    if SIGN_DICT_PATH.exists():
+        with open(SIGN_DICT_PATH, 'r', encoding='utf-8') as f:
+            for key in json.load(f):
+                if len(key) < 2:
+                    continue
+                # 단위 기호는 대소문자가 의미를 가지므로(MB/Mb) 원래 표기만 등록
+                rows[key] = make_row(key, SIGN_COST, 'SL')
+
+    context_readings = nnbc_context_readings()
+    for counter in missing_counters():
+        reading = counter if counter in context_readings else CONTEXT_PROXY_COUNTERS[jong_flag(counter)]
+        rows[counter] = make_row(counter, COUNTER_COST, 'NNBC', reading)
+
+    # 원래 영어 연속열과 같은 SL (mecab-ko-dic에는 종성 유무가 없는 NNP 문맥 ID가 없음)
+    rows[ENGLISH_PLACEHOLDER] = make_row(ENGLISH_PLACEHOLDER, PLACEHOLDER_COST, 'SL')
+
+    return list(rows.values())
+
+
+def missing_counters() -> list[str]:
+    """시스템 사전만으로는 숫자 뒤에서 NNBC 한 토큰으로 분석되지 않는 단위명사"""
+    from resources import MecabWrapper
+    mecab = MecabWrapper()
+    missing = []
+    for counter in _get_counter_reader():
+        morphs = mecab.pos(f"3{counter}")
+        if not (len(morphs) == 2 and morphs[1] == (counter, 'NNBC')):
+            missing.append(counter)
+    return missing
+
+
+def find_mecab_dict_index() -> str | None:
+    found = shutil.which("mecab-dict-index")
+    if found:
+        return found
+
+    mecab_config = shutil.which("mecab-config")
+    if mecab_config:
+        libexec = subprocess.run(
+            [mecab_config, "--libexecdir"], capture_output=True, text=True
+        ).stdout.strip()
+        candidate = Path(libexec) / "mecab-dict-index"
+        if candidate.exists():
+            return str(candidate)
+
+    for candidate in MECAB_DICT_INDEX_CANDIDATES:
+        if Path(candidate).exists():
+            return candidate
+    return None
+
+
+def system_dicdir() -> str:
+    import mecab_ko_dic
+    return mecab_ko_dic.DICDIR
+
+
+def build(all_keys: bool = False):
+    rows = collect_rows(all_keys)
+    USERDIC_DIR.mkdir(parents=True, exist_ok=True)
+    with open(USERDIC_CSV, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(rows) + '\n')
+    print(f"{len(rows)}개 항목 저장: {USERDIC_CSV}")
+
+    dict_index = find_mecab_dict_index()
+    command = [
+        dict_index or "mecab-dict-index",
+        "-d", system_dicdir(),
+        "-u", str(USERDIC_PATH),
+        "-f", "utf-8",
+        "-t", "utf-8",
+        str(USERDIC_CSV),
+    ]
+    if dict_index is None:
+        print("경고: mecab-dict-index를 찾을 수 없습니다. mecab을 설치한 뒤 아래 명령으로 컴파일하세요.")
+        print("      " + ' '.join(command))
+        return
+
+    subprocess.run(command, check=True)
+    print(f"사용자 사전 컴파일 완료: {USERDIC_PATH}")
+
+
+def measure():
+    """golden corpus 문장으로 사용자 사전 적용 전/후 토큰 수를 비교합니다."""
+    from resources import MecabWrapper
+    from normalizer import check_typos
+    from readutils import correction_exception
+    from golden_corpus import collect_cases
+
+    if not USERDIC_PATH.exists():
+        print(f"경고: {USERDIC_PATH} 가 없습니다. 먼저 build를 실행하세요.")
+        return
+
+    texts = sorted({case["text"] for case in collect_cases()})
+    texts = [correction_exception(check_typos(text)) for text in texts]
+
+    for name, mecab in [("system", MecabWrapper()), ("system+user", MecabWrapper(USERDIC_PATH))]:
+        tokens = 0
+        counters = 0
+        for text in texts:
+            morphs = mecab.pos(text)
+            tokens += len(morphs)
+            # 숫자 바로 뒤 단위명사(NNBC)로 분석된 경우 (count_exceptions 없이 처리 가능)
+            counters += sum(
+                1 for prev, cur in zip(morphs, morphs[1:])
+                if prev[1] == 'SN' and cur[1].startswith('NNBC')
+            )
+        print(f"{name:12} tokens/sentence: {tokens / len(texts):.2f}  "
+              f"(total {tokens}), number+NNBC: {counters}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="mecab-ko 사용자 사전 생성")
+    parser.add_argument("--all-keys", action="store_true", help="알파벳으로만 된 사전 키도 등록")
+    parser.add_argument("--measure", action="store_true", help="적용 전/후 토큰 수 비교")
+    args = parser.parse_args()
+
+    if args.measure:
+        measure()
+    else:
+        build(args.all_keys)
+
+
+if __name__ == "__main__":
+    main()
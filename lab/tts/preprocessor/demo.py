@@ -63,12 +63,13 @@ TEST_CASES = [
 ]
 
 
-for text in TEST_CASES:
-    start_time = time.time()
-    new_text = normalizer.trans_sentence(text)
+if __name__ == "__main__":
+    for text in TEST_CASES:
+        start_time = time.time()
+        new_text = normalizer.trans_sentence(text)
 
-    end_time = time.time()
-    print('original:{}'.format(text))
-    print('normalized:{}'.format(new_text))
-    print(f"Time taken: {end_time - start_time} seconds")
-    print("-"*100)
\ No newline at end of file
+        end_time = time.time()
+        print('original:{}'.format(text))
+        print('normalized:{}'.format(new_text))
+        print(f"Time taken: {end_time - start_time} seconds")
+        print("-"*100)
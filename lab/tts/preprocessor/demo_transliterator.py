@@ -1,9 +1,10 @@
 from inference_byt5 import Eng2KorTransliterator
 from inference_arpabet_pipeline import Eng2KorTransliteratorPipeline
+from resources import get_eng2kor_dict
 import time
 
 
-pipeline = Eng2KorTransliteratorPipeline("./train/models/byt5-arpabet2kor")
+BATCH_SIZE = 32
 TEST_CASES = [
     "strawberry",
     "philosophy",
@@ -107,11 +108,60 @@ TEST_CASES = [
     "wireless"
 ]
 
-for case in TEST_CASES:
-    start_time = time.time()
-    result = pipeline.transliterate(case)
-    end_time = time.time()
-    print('original:{}'.format(case))
-    print('transliterated:{}'.format(result))
-    print(f"Time taken: {end_time - start_time} seconds")
-    print("-"*100)
+
+
+def main():
+    # 합성어 파트 중 단어 사전(단위 기호 제외)에 있는 것은 모델 없이 사전 표기 사용
+    load_start = time.time()
+    pipeline = Eng2KorTransliteratorPipeline(
+        "./train/models/byt5-arpabet2kor",
+        dictionary_lookup=lambda term: get_eng2kor_dict().lookup_word(term)
+    )
+    time_to_ready = time.time() - load_start
+
+    # 단어별 변환
+    single_results = []
+    first_time = None
+    single_start = time.time()
+    for case in TEST_CASES:
+        start_time = time.time()
+        result = pipeline.transliterate(case)
+        end_time = time.time()
+        single_results.append(result)
+        if first_time is None:
+            first_time = end_time - start_time
+        print('original:{}'.format(case))
+        print('transliterated:{}'.format(result))
+        print(f"Time taken: {end_time - start_time} seconds")
+        print("-"*100)
+    single_time = time.time() - single_start
+    segment_counts = dict(pipeline.segment_counts)
+
+    # 배치 변환 (패딩 + batch_size 단위 generate)
+    batch_start = time.time()
+    batch_results = pipeline.transliterate_batch(TEST_CASES, batch_size=BATCH_SIZE)
+    batch_time = time.time() - batch_start
+
+    mismatches = [
+        (case, single, batch)
+        for case, single, batch in zip(TEST_CASES, single_results, batch_results)
+        if single != batch
+    ]
+    for case, single, batch in mismatches:
+        print(f"mismatch: {case} single={single} batch={batch}")
+
+    print("=" * 100)
+    print(f"words: {len(TEST_CASES)}, batch_size: {BATCH_SIZE}")
+    # cold start = 로드 + 첫 요청 (pipeline.startup_times에 단계별 시간)
+    print(f"time to ready: {time_to_ready:.2f}s, first request: {first_time:.2f}s, "
+          f"cold start: {time_to_ready + first_time:.2f}s")
+    print(f"single : {single_time:.2f}s ({len(TEST_CASES) / single_time:.1f} words/s)")
+    print(f"batch  : {batch_time:.2f}s ({len(TEST_CASES) / batch_time:.1f} words/s)   x{single_time / batch_time:.2f}")
+    print(f"mismatches: {len(mismatches)}")
+    # 사전 조회 없이는 단어마다 모델 입력 1개
+    print(f"model inputs: {segment_counts.get('model', 0)} / {len(TEST_CASES)} "
+          f"(dictionary parts: {segment_counts.get('dict', 0)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+대소문자를 구분하는 영한 사전 색인
+
+사전 키에는 "macOS", "MB", "Mb", "kHz", "mL"처럼 대소문자가 섞인 키가 있어서
+term.lower()로만 조회하면 이런 항목은 절대 찾을 수 없습니다.
+로드 시점에 두 개의 표를 만들고 아래 순서로 조회합니다.
+
+    1. exact  : 원래 표기 그대로 ("MB" → MB 항목, "Mb" → Mb 항목)
+    2. folded : casefold 표기. 같은 casefold 키가 여러 개면
+                소문자 키 > 대문자 키 > 나머지(사전 로드 순서) 순으로 우선
+                ("Macos" → macOS 항목, "Pb" → pb 항목)
+                단, 전부 대문자인 입력은 대소문자가 섞인 키로 찾지 않음
+                (약어로 읽어야 하므로: "PA" → Pa(파스칼) 아님, "MACOS" → macOS 아님)
+
+words를 주면 단위 기호를 뺀 단어 사전 색인도 함께 만들어 lookup_word로 조회합니다.
+(reload 시 두 색인이 한 객체로 함께 교체됨)
+"""
+from collections.abc import Mapping
+from typing import Iterator, Optional
+
+
+def _fold_rank(key: str) -> int:
+    """casefold 충돌 시 우선순위 (작을수록 우선)"""
+    if key == key.lower():
+        return 0
+    if key == key.upper():
+        return 1
+    return 2
+
+
+class Eng2KorIndex(Mapping):
+    """
+    영한 사전(dict)을 감싼 읽기 전용 색인.
+    in / [] / get은 대소문자 규칙에 따라 조회하고, 순회/len은 원래 사전 키 기준.
+    """
+    __slots__ = ("entries", "exact", "folded", "mixed", "words")
+
+    def __init__(self, entries: dict[str, str], words: Optional[dict[str, str]] = None):
+        self.entries = entries
+        self.words = Eng2KorIndex(words) if words is not None else None
+        self.exact = entries
+        folded: dict[str, str] = {}
+        ranks: dict[str, int] = {}
+        for key, value in entries.items():
+            fold = key.casefold()
+            rank = _fold_rank(key)
+            if fold not in ranks or rank < ranks[fold]:
+                folded[fold] = value
+                ranks[fold] = rank
+        self.folded = folded
+        # 대소문자가 섞인 키가 선택된 casefold 키
+        self.mixed = {fold for fold, rank in ranks.items() if rank == 2}
+
+    def lookup(self, term: str) -> Optional[str]:
+        value = self.exact.get(term)
+        if value is None:
+            fold = term.casefold()
+            if term.isupper() and fold in self.mixed:
+                return None
+            value = self.folded.get(fold)
+        return value
+
+    def lookup_word(self, term: str) -> Optional[str]:
+        """단위 기호를 뺀 단어 사전에서 조회 (words가 없으면 lookup과 같음)"""
+        return (self.words or self).lookup(term)
+
+    def __getitem__(self, term: str) -> str:
+        value = self.lookup(term)
+        if value is None:
+            raise KeyError(term)
+        return value
+
+    def __contains__(self, term) -> bool:
+        return isinstance(term, str) and self.lookup(term) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
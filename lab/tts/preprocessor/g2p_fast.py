@@ -0,0 +1,129 @@
+"""
+CMUdict 우선 G2P (영어 단어 → ARPABET)
+
+g2p_en.G2p는 사전에 있는 단어도 매번 텍스트 정규화, NLTK 품사 태깅을 거칩니다.
+FastG2p는 한 단어(소문자 알파벳)에 대해 G2p와 같은 규칙으로 바로 결과를 냅니다.
+
+    1. 동형이의어(homograph): 품사에 따라 발음이 달라지므로 G2p에 맡김
+    2. G2p의 토크나이저가 나누는 단어 (g2p_en 버전에 따라 cannot → can not, gonna → gon na 등):
+       G2p가 토큰별 발음을 " "로 이어 반환하므로 G2p에 맡김
+    3. CMUdict에 있는 단어: 첫 번째 발음
+    4. 그 외(OOV, 알파벳 외 문자 포함): G2p (신경망 예측)
+
+결과는 크기 제한이 있는 LRU 캐시에 저장하고, G2p는 처음 필요할 때 로드합니다.
+추론 파이프라인(inference_arpabet_pipeline.py)과 데이터셋 변환(train/convert_dataset_to_arpabet.py)이 함께 사용합니다.
+
+사용 예:
+    from g2p_fast import word_to_arpabet
+    word_to_arpabet("psychology")  # "S AY0 K AA1 L AH0 JH IY0"
+"""
+import re
+import threading
+from functools import lru_cache
+from typing import Optional
+
+
+_WORD_RE = re.compile(r'[a-z]+')
+
+
+class FastG2p:
+    def __init__(self, cache_size: int = 65536):
+        self._cmu = None
+        self._homographs = None
+        self._tokenize = None
+        self._g2p = None
+        self._lock = threading.Lock()
+        self.dict_hits = 0
+        self.fallbacks = 0
+        self._convert_cached = lru_cache(maxsize=cache_size)(self._convert)
+
+    def _load_tables(self):
+        # g2p_en import 시 nltk cmudict/tagger 데이터가 없으면 다운로드됨
+        from g2p_en.g2p import construct_homograph_dictionary, word_tokenize
+        from nltk.corpus import cmudict
+        with self._lock:
+            if self._cmu is None:
+                self._homographs = construct_homograph_dictionary()
+                # G2p가 쓰는 토크나이저 (버전마다 다름: TweetTokenizer 또는 nltk word_tokenize)
+                self._tokenize = word_tokenize
+                self._cmu = cmudict.dict()
+
+    def preload(self, background: bool = False, extra=None) -> Optional[threading.Thread]:
+        """
+        CMUdict 표와 G2p(신경망)를 미리 로드합니다.
+        background=True면 데몬 스레드에서 로드하고 스레드를 반환합니다. (모델 로드와 병렬로)
+        extra: 같은 스레드에서 함께 실행할 추가 로드 함수
+        """
+        def load():
+            try:
+                if self._cmu is None:
+                    self._load_tables()
+                self._get_g2p()
+                if extra is not None:
+                    extra()
+            except Exception as e:
+                # 실패하면 처음 사용할 때 다시 로드 (그때 오류가 드러남)
+                print(f"경고: G2P 미리 로드 실패: {e}")
+
+        if not background:
+            load()
+            return None
+        thread = threading.Thread(target=load, name="g2p-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def _get_g2p(self):
+        if self._g2p is None:
+            with self._lock:
+                if self._g2p is None:
+                    from g2p_en import G2p
+                    self._g2p = G2p()
+        return self._g2p
+
+    def _convert(self, word: str) -> tuple[str, ...]:
+        if self._cmu is None:
+            self._load_tables()
+
+        if (_WORD_RE.fullmatch(word) and word not in self._homographs
+                and self._tokenize(word) == [word]):
+            prons = self._cmu.get(word)
+            if prons:
+                self.dict_hits += 1
+                return tuple(prons[0])
+
+        self.fallbacks += 1
+        return tuple(self._get_g2p()(word))
+
+    def __call__(self, word: str) -> list[str]:
+        """G2p(word)와 같은 phoneme 리스트"""
+        return list(self._convert_cached(word.lower()))
+
+    def cache_info(self):
+        return self._convert_cached.cache_info()
+
+    def clear_cache(self):
+        self._convert_cached.cache_clear()
+        self.dict_hits = 0
+        self.fallbacks = 0
+
+
+# --- 기본 인스턴스 (지연 생성) ---
+_default_g2p = None
+_default_lock = threading.Lock()
+
+
+def get_g2p() -> FastG2p:
+    global _default_g2p
+    if _default_g2p is None:
+        with _default_lock:
+            if _default_g2p is None:
+                _default_g2p = FastG2p()
+    return _default_g2p
+
+
+def word_to_arpabet(word: str) -> str:
+    """
+    영어 단어를 ARPABET 발음기호로 변환합니다.
+    예: "psychology" → "S AY0 K AA1 L AH0 JH IY0"
+    """
+    return ' '.join(get_g2p()(word))
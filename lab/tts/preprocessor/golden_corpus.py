@@ -0,0 +1,357 @@
+"""
+Golden corpus 기반 차분(differential) 검증 스크립트
+
+trans_sentence, correction_exception, 숫자 읽기 등을 빠르게 바꿀 때
+출력이 달라지지 않았는지 확인하기 위한 도구입니다.
+
+코퍼스 구성:
+    - demo.py의 TEST_CASES
+    - train/test_data.json의 영어 입력 (문장 템플릿에 끼워 넣음)
+    - 숫자/단위/기호/시간/날짜 합성 문장 (seed 고정)
+    - 리뷰에서 회귀가 발견된 문장 (REGRESSION_CASES)
+
+모델 출력은 설치 환경마다 다르므로 기본적으로 모델 fallback을 끄고
+(영어 단어는 사전/약어 규칙만 적용) 결정적인 경로만 비교합니다.
+
+사용 방법:
+    # 현재 normalizer로 기준 출력 생성
+    python golden_corpus.py build
+
+    # 후보 엔진과 기준 출력 비교 (module:function 형식)
+    python golden_corpus.py diff --candidate normalizer:trans_sentence
+
+    # 다른 엔진과 나란히 실행해서 속도까지 비교
+    python golden_corpus.py diff --candidate fast_normalizer:trans_sentence --baseline normalizer:trans_sentence
+
+    # 영한 사전의 모든 키가 모델 호출 없이 읽히는지 확인
+    python golden_corpus.py dict
+"""
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import random
+import sys
+import time
+from multiprocessing import Pool
+from pathlib import Path
+
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+CORPUS_PATH = GOLDEN_DIR / "golden_corpus.json"
+REFERENCE_ENGINE = "normalizer:trans_sentence"
+
+TEST_DATA_PATH = Path(__file__).parent / "train" / "test_data.json"
+TEST_DATA_LIMIT = 300
+SYNTHETIC_COUNT = 600
+SEED = 42
+
+ENGLISH_TEMPLATES = [
+    "{}",
+    "오늘 {}에 대해 이야기했어요.",
+    "그 {}가 정말 좋았습니다.",
+    "{}를 다시 확인해 주세요.",
+]
+
+COUNTERS = ["개", "명", "권", "대", "번", "시", "시간", "분", "초", "일", "년", "개월",
+            "원", "달러", "학년", "분기", "층", "위", "등", "살", "마리", "킬로그램"]
+UNITS = ["kg", "km", "cm", "mm", "g", "ml", "MB", "GB", "kHz", "%", "℃", "$"]
+NUMBER_TEMPLATES = [
+    "사과 {n}{c}가 남았습니다.",
+    "{n}{c} 동안 기다렸어요.",
+    "총 {n}{c}입니다.",
+    "{n} {c}",
+    "무게는 {n}{u}이에요.",
+    "{n}.{m}{u} 정도",
+    "가격은 {n},{m3}원입니다.",
+    "버전 {n}.{m}.{k} 배포",
+    "{h}:{mm} 에 만나요.",
+    "{y}.{mo}.{d}. 에 시작했어요.",
+    "{n}+{m}={k}",
+    "{n}/{m} 비율",
+    "{n}-{m} 구간",
+    "({n}) 항목",
+    "#{n} 이슈",
+    "{n}*{m} 크기",
+    "{n}{u}와 {m}{c}",
+    "{n}",
+    "-{n}도",
+    "{big}원",
+]
+
+# 읽기 규칙을 바꿀 때 회귀가 있었던 문장 (영어+숫자 혼합 토큰 등)
+REGRESSION_CASES = [
+    "갤럭시S24 샀어요.",
+    "S24 울트라 가격이 얼마예요?",
+    "COVID19 검사를 받았습니다.",
+    "Win10 업데이트가 끝났어요.",
+    "iPhone15 출시일",
+    "A4 용지 두 장",
+    "mp3 파일로 저장했어요.",
+    "5G 요금제로 바꿨어요.",
+    "GPT4 써봤어요.",
+    "B2B 사업부",
+    "3D 프린터",
+    "PA 시스템을 점검했어요.",
+    "MACOS 업데이트",
+    "macOS 업데이트",
+]
+
+
+def load_engine(spec: str):
+    """'module:function' 형식 문자열에서 함수를 가져옵니다."""
+    module_name, func_name = spec.split(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, func_name)
+
+
+def disable_model():
+    """모델 fallback과 결과 저장소를 꺼서 출력이 설치 환경과 무관하도록 함"""
+    import resources
+    resources.disable_transliterator()
+
+
+def demo_cases() -> list[str]:
+    from demo import TEST_CASES
+    return list(TEST_CASES)
+
+
+def test_data_cases(limit: int = TEST_DATA_LIMIT) -> list[str]:
+    if not TEST_DATA_PATH.exists():
+        return []
+    rng = random.Random(SEED)
+    words = []
+    with open(TEST_DATA_PATH, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                words.append(json.loads(line)["input_text"].replace("transliterate: ", ""))
+    words = words[:limit]
+    return [rng.choice(ENGLISH_TEMPLATES).format(word) for word in words]
+
+
+def synthetic_cases(count: int = SYNTHETIC_COUNT) -> list[str]:
+    rng = random.Random(SEED)
+    cases = []
+    for _ in range(count):
+        template = rng.choice(NUMBER_TEMPLATES)
+        cases.append(template.format(
+            n=rng.choice([0, 1, 2, 3, 5, 7, 10, 11, 15, 20, 21, 32, 99, 100, 101, 999, 1000,
+                          1592, 10000, 12345, rng.randint(0, 10 ** rng.randint(1, 9))]),
+            m=rng.randint(0, 99),
+            m3=f"{rng.randint(0, 999):03d}",
+            k=rng.randint(0, 20),
+            c=rng.choice(COUNTERS),
+            u=rng.choice(UNITS),
+            h=f"{rng.randint(0, 24):02d}",
+            mm=f"{rng.randint(0, 59):02d}",
+            y=rng.randint(1900, 2099),
+            mo=rng.randint(1, 12),
+            d=rng.randint(1, 31),
+            big=rng.randint(10 ** 8, 10 ** 16),
+        ))
+    return cases
+
+
+def collect_cases() -> list[dict]:
+    sources = [
+        ("demo", demo_cases()),
+        ("test_data", test_data_cases()),
+        ("synthetic", synthetic_cases()),
+        ("regression", REGRESSION_CASES),
+    ]
+    cases = []
+    for source, texts in sources:
+        for text in texts:
+            for if_sym in (False, True):
+                cases.append({
+                    "id": len(cases),
+                    "source": source,
+                    "text": text,
+                    "if_sym": if_sym,
+                })
+    return cases
+
+
+# --- 병렬 실행 (worker 프로세스 전역 상태) ---
+_worker_engines = {}
+
+
+def _init_worker(engine_specs: dict[str, str], with_model: bool):
+    if not with_model:
+        disable_model()
+    for name, spec in engine_specs.items():
+        _worker_engines[name] = load_engine(spec)
+        # Mecab/사전 로딩이 첫 케이스 시간에 섞이지 않도록 한 번 실행
+        with contextlib.redirect_stdout(io.StringIO()):
+            _worker_engines[name]("준비 1개 test", True)
+
+
+def _run_chunk(cases: list[dict]) -> list[dict]:
+    results = []
+    for case in cases:
+        row = {"id": case["id"]}
+        for name, engine in _worker_engines.items():
+            # trans_bundle의 디버그 출력 억제
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                try:
+                    output = engine(case["text"], case["if_sym"])
+                except Exception as e:
+                    output = f"<error: {type(e).__name__}: {e}>"
+                elapsed = time.perf_counter() - start
+            row[name] = output
+            row[name + "_time"] = elapsed
+        results.append(row)
+    return results
+
+
+def run_engines(cases: list[dict], engine_specs: dict[str, str], with_model: bool,
+                workers: int) -> dict[int, dict]:
+    chunk_size = max(1, len(cases) // (workers * 8))
+    chunks = [cases[i:i + chunk_size] for i in range(0, len(cases), chunk_size)]
+    results = {}
+    with Pool(workers, initializer=_init_worker, initargs=(engine_specs, with_model)) as pool:
+        for chunk_results in pool.imap_unordered(_run_chunk, chunks):
+            for row in chunk_results:
+                results[row["id"]] = row
+    return results
+
+
+def build(args):
+    cases = collect_cases()
+    results = run_engines(cases, {"reference": args.engine}, args.with_model, args.workers)
+
+    for case in cases:
+        case["expected"] = results[case["id"]]["reference"]
+
+    GOLDEN_DIR.mkdir(parents=True, exist_ok=True)
+    corpus = {
+        "engine": args.engine,
+        "with_model": args.with_model,
+        "reference_time": sum(row["reference_time"] for row in results.values()),
+        "cases": cases,
+    }
+    with open(args.corpus, 'w', encoding='utf-8') as f:
+        json.dump(corpus, f, ensure_ascii=False, indent=1)
+
+    print(f"{len(cases)}개 케이스 저장: {args.corpus}")
+
+
+def diff(args):
+    with open(args.corpus, 'r', encoding='utf-8') as f:
+        corpus = json.load(f)
+    cases = corpus["cases"]
+
+    engine_specs = {"candidate": args.candidate}
+    if args.baseline:
+        engine_specs["baseline"] = args.baseline
+
+    start = time.perf_counter()
+    results = run_engines(cases, engine_specs, corpus["with_model"], args.workers)
+    wall_time = time.perf_counter() - start
+
+    diffs = [case for case in cases if results[case["id"]]["candidate"] != case["expected"]]
+
+    print("=" * 100)
+    print(f"corpus: {args.corpus} ({len(cases)} cases, reference: {corpus['engine']})")
+    print(f"candidate: {args.candidate}")
+    print("=" * 100)
+    for case in diffs[:args.max_diffs]:
+        print(f"[{case['source']}#{case['id']}] if_sym={case['if_sym']} {case['text']}")
+        print(f"  expected : {case['expected']}")
+        print(f"  candidate: {results[case['id']]['candidate']}")
+    if len(diffs) > args.max_diffs:
+        print(f"... 외 {len(diffs) - args.max_diffs}개")
+
+    by_source = {}
+    for case in diffs:
+        by_source[case["source"]] = by_source.get(case["source"], 0) + 1
+
+    candidate_time = sum(row["candidate_time"] for row in results.values())
+    if args.baseline:
+        baseline_name = args.baseline
+        baseline_time = sum(row["baseline_time"] for row in results.values())
+    else:
+        baseline_name = f"{corpus['engine']} (build 시점 기록)"
+        baseline_time = corpus["reference_time"]
+
+    print("-" * 100)
+    print(f"diffs: {len(diffs)} / {len(cases)} {by_source if by_source else ''}")
+    print(f"baseline  {baseline_name:50} {baseline_time * 1000:10.1f} ms")
+    print(f"candidate {args.candidate:50} {candidate_time * 1000:10.1f} ms")
+    print(f"speedup: x{baseline_time / candidate_time:.2f}   (wall {wall_time:.1f}s, workers {args.workers})")
+
+    return 1 if diffs else 0
+
+
+def dict_check(args):
+    """
+    영한 사전의 모든 키를 trans_eng2kor / trans_eng2kor_batch로 읽어서
+    모델 fallback(read_engbymodel, read_engbymodel_batch) 호출이 0인지 확인합니다.
+    """
+    disable_model()
+    import normalizer
+    from resources import get_eng2kor_dict
+
+    model_calls = []
+    read_engbymodel = normalizer.read_engbymodel
+    read_engbymodel_batch = normalizer.read_engbymodel_batch
+
+    def count_single(term):
+        model_calls.append(term)
+        return read_engbymodel(term)
+
+    def count_batch(terms):
+        model_calls.extend(terms)
+        return read_engbymodel_batch(terms)
+
+    keys = list(get_eng2kor_dict())
+    normalizer.read_engbymodel, normalizer.read_engbymodel_batch = count_single, count_batch
+    try:
+        for key in keys:
+            normalizer.trans_eng2kor(key)
+        normalizer.trans_eng2kor_batch(keys)
+    finally:
+        normalizer.read_engbymodel, normalizer.read_engbymodel_batch = read_engbymodel, read_engbymodel_batch
+
+    print(f"dictionary keys: {len(keys)}, model calls: {len(model_calls)}")
+    for term in list(dict.fromkeys(model_calls))[:args.max_diffs]:
+        print(f"  {term}")
+    return 1 if model_calls else 0
+
+
+def main():
+    # 엔진 모듈을 이 디렉토리 기준으로 import
+    sys.path.insert(0, str(Path(__file__).parent))
+
+    parser = argparse.ArgumentParser(description="Golden corpus 차분 검증")
+    parser.add_argument("--corpus", default=str(CORPUS_PATH))
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="기준 출력 생성")
+    build_parser.add_argument("--engine", default=REFERENCE_ENGINE)
+    build_parser.add_argument("--with-model", action="store_true", help="모델 fallback 사용")
+
+    diff_parser = subparsers.add_parser("diff", help="후보 엔진과 기준 출력 비교")
+    diff_parser.add_argument("--candidate", default=REFERENCE_ENGINE)
+    diff_parser.add_argument("--baseline", default=None, help="나란히 실행할 비교 엔진")
+    diff_parser.add_argument("--max-diffs", type=int, default=30)
+
+    dict_parser = subparsers.add_parser("dict", help="사전 키가 모델 없이 읽히는지 확인")
+    dict_parser.add_argument("--max-diffs", type=int, default=30)
+
+    args = parser.parse_args()
+    if args.command == "build":
+        build(args)
+        return 0
+    if args.command == "dict":
+        return dict_check(args)
+    return diff(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
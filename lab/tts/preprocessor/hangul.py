@@ -0,0 +1,47 @@
+"""
+normalizer hot path용 한글 판별/분해 함수
+
+hgtk.checker.is_hangul, hgtk.letter.decompose와 같은 결과를 내지만
+유니코드 산술((ord(c) - 0xAC00) % 28)과 미리 컴파일한 범위 정규식만 사용합니다.
+"""
+import re
+
+
+HANGUL_FIRST = 0xAC00  # '가'
+HANGUL_LAST = 0xD7A3   # '힣'
+NUM_JONG = 28
+
+# hgtk.checker.is_hangul: 완성형 음절 + 호환 자모(ㄱ-ㅣ, 0x3131-0x3163)
+# 빈 문자열도 True로 판정하는 hgtk 동작을 그대로 따름
+_HANGUL_RE = re.compile('[가-힣ㄱ-ㅣ]*')
+_is_hangul_match = _HANGUL_RE.fullmatch
+
+# 초성으로 쓸 수 없는 겹자음(종성 전용): hgtk.letter.decompose가 종성으로 분해함
+_JONG_ONLY_JAMO = frozenset('ㄳㄵㄶㄺㄻㄼㄽㄾㄿㅀㅄ')
+
+
+def is_hangul(text: str) -> bool:
+    """문자열이 한글(음절/자모)로만 이루어져 있는지 여부 (hgtk.checker.is_hangul 호환)"""
+    return _is_hangul_match(text) is not None
+
+
+def is_hangul_batch(terms: list[str]) -> list[bool]:
+    """여러 토큰을 한 번에 판정합니다. 문장의 전체 토큰을 미리 판정할 때 사용."""
+    match = _is_hangul_match
+    return [match(term) is not None for term in terms]
+
+
+def is_hangul_syllable(ch: str) -> bool:
+    """한 글자가 완성형 한글 음절(가-힣)인지 여부"""
+    return HANGUL_FIRST <= ord(ch) <= HANGUL_LAST
+
+
+def has_jongseong(ch: str) -> bool:
+    """
+    한 글자에 받침(종성)이 있는지 여부.
+    hgtk.letter.decompose(ch)[2] != '' 와 같은 결과 (한글이 아니면 False).
+    """
+    code = ord(ch) - HANGUL_FIRST
+    if 0 <= code <= HANGUL_LAST - HANGUL_FIRST:
+        return code % NUM_JONG != 0
+    return ch in _JONG_ONLY_JAMO
@@ -0,0 +1,128 @@
+"""
+한글 음절 바이트 제약 디코딩 (ByT5)
+
+ByT5는 UTF-8 바이트를 하나씩 생성하므로 beam search가 올바른 UTF-8이 아니거나
+한글 음절/공백이 아닌 바이트열에 hypothesis를 낭비할 수 있습니다.
+HangulByteLogitsProcessor는 매 스텝 지금까지 생성한 바이트로 상태를 정하고,
+완성된 한글 음절(U+AC00~U+D7A3), 공백, 허용한 문장 부호, EOS로 이어질 수 있는 토큰만 남깁니다.
+
+ByT5 토큰 id: pad 0, eos 1, unk 2, 바이트 b → b + 3
+
+한글 음절의 UTF-8 (3바이트):
+    첫 바이트  EA~ED
+    둘째 바이트 EA → B0~BF, EB/EC → 80~BF, ED → 80~9E
+    셋째 바이트 80~BF (ED 9E 다음은 80~A3)
+
+공백/문장 부호/EOS는 음절 경계에서만 허용하고, 출력 맨 앞의 공백/EOS와 연속 공백은 막습니다.
+하이픈은 두 한글 음절 사이에만 올 수 있습니다 (연속 하이픈, 공백 옆 하이픈, 끝의 하이픈 차단).
+
+generate()의 logits_processor로 쓰며, ONNX 백엔드(optimum)도 같은 generate를 쓰므로 그대로 적용됩니다.
+generate를 쓰지 않는 디코딩 루프는 allowed_token_ids(생성한 토큰 id)로 같은 규칙을 쓸 수 있습니다.
+
+사용 예:
+    pipeline = Eng2KorTransliteratorPipeline(hangul_constraint=True)
+"""
+import torch
+from transformers import LogitsProcessor
+
+
+PAD_TOKEN_ID, EOS_TOKEN_ID = 0, 1
+BYTE_OFFSET = 3
+
+# 학습 데이터 정답에 나오는 한글 외 문자
+ALLOWED_PUNCTUATION = " -"
+SPACE = 0x20
+HYPHEN = 0x2D
+
+# 상태
+BOUNDARY, START, AFTER_SPACE, LEAD_EA, LEAD_EB_EC, LEAD_ED, SECOND, SECOND_ED_9E, AFTER_HYPHEN = range(9)
+
+
+def _byte_ranges(*ranges) -> list[int]:
+    tokens = []
+    for low, high in ranges:
+        tokens.extend(b + BYTE_OFFSET for b in range(low, high + 1))
+    return tokens
+
+
+def _build_allowed(punctuation: str) -> dict[int, list[int]]:
+    leads = _byte_ranges((0xEA, 0xED))
+    punctuation_tokens = [ord(ch) + BYTE_OFFSET for ch in punctuation]
+    # 공백 다음에는 공백/하이픈이 올 수 없음 (하이픈은 음절 사이에만)
+    after_space = [token for token in punctuation_tokens if token not in (SPACE + BYTE_OFFSET, HYPHEN + BYTE_OFFSET)]
+    return {
+        START: leads,
+        BOUNDARY: leads + punctuation_tokens + [EOS_TOKEN_ID],
+        AFTER_SPACE: leads + after_space,
+        AFTER_HYPHEN: leads,
+        LEAD_EA: _byte_ranges((0xB0, 0xBF)),
+        LEAD_EB_EC: _byte_ranges((0x80, 0xBF)),
+        LEAD_ED: _byte_ranges((0x80, 0x9E)),
+        SECOND: _byte_ranges((0x80, 0xBF)),
+        SECOND_ED_9E: _byte_ranges((0x80, 0xA3)),
+    }
+
+
+def _byte(token_id: int) -> int:
+    return token_id - BYTE_OFFSET if token_id >= BYTE_OFFSET else -1
+
+
+def decode_state(generated: list[int]) -> int:
+    """
+    생성한 토큰 id(decoder start 토큰 제외)로 다음 토큰의 상태를 정합니다.
+    제약 아래에서 생성된 바이트열이라고 가정하고 마지막 두 바이트만 봅니다.
+    """
+    if not generated:
+        return START
+    last = _byte(generated[-1])
+    if 0xEA <= last <= 0xED:
+        return LEAD_EA if last == 0xEA else LEAD_ED if last == 0xED else LEAD_EB_EC
+    if 0x80 <= last <= 0xBF:
+        previous = _byte(generated[-2]) if len(generated) >= 2 else -1
+        if 0xEA <= previous <= 0xED:
+            return SECOND_ED_9E if (previous == 0xED and last == 0x9E) else SECOND
+        return BOUNDARY
+    if last == SPACE:
+        return AFTER_SPACE
+    if last == HYPHEN:
+        return AFTER_HYPHEN
+    return BOUNDARY
+
+
+_default_allowed = _build_allowed(ALLOWED_PUNCTUATION)
+
+
+def allowed_token_ids(generated: list[int], punctuation: str = ALLOWED_PUNCTUATION) -> list[int]:
+    """다음에 올 수 있는 토큰 id 목록"""
+    allowed = _default_allowed if punctuation == ALLOWED_PUNCTUATION else _build_allowed(punctuation)
+    return allowed[decode_state(generated)]
+
+
+class HangulByteLogitsProcessor(LogitsProcessor):
+    """한글 음절/공백/허용 문장 부호로 이어지지 않는 바이트 토큰의 점수를 -inf로 만듭니다."""
+
+    def __init__(self, punctuation: str = ALLOWED_PUNCTUATION, prefix_length: int = 1):
+        """
+        Args:
+            punctuation: 음절 경계에서 허용할 문자 (기본: 공백, 하이픈)
+            prefix_length: input_ids 앞의 생성하지 않은 토큰 수 (T5 decoder start 토큰 1개)
+        """
+        self.allowed = _build_allowed(punctuation)
+        self.prefix_length = prefix_length
+        self._masks = {}
+
+    def _state_masks(self, vocab_size: int, device) -> torch.Tensor:
+        """[상태 수, vocab] 허용 마스크 (vocab 크기/디바이스별로 한 번만 생성)"""
+        key = (vocab_size, str(device))
+        if key not in self._masks:
+            masks = torch.zeros(len(self.allowed), vocab_size, dtype=torch.bool)
+            for state, token_ids in self.allowed.items():
+                masks[state, token_ids] = True
+            self._masks[key] = masks.to(device)
+        return self._masks[key]
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor) -> torch.FloatTensor:
+        generated = input_ids[:, self.prefix_length:].tolist()
+        states = torch.tensor([decode_state(row) for row in generated], device=scores.device)
+        mask = self._state_masks(scores.size(-1), scores.device)[states]
+        return scores.masked_fill(~mask, float("-inf"))
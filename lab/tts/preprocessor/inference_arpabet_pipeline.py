@@ -5,10 +5,48 @@
 영어 단어 → wordninja 분리 → G2P(ARPABET) → ByT5 모델 → 한글 음차
 """
 
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, Optional
 import torch
-from transformers import AutoTokenizer, T5ForConditionalGeneration
-from g2p_en import G2p
-import wordninja
+from transformers import AutoTokenizer, LogitsProcessorList
+from onnx_backend import load_seq2seq_model
+from batching import run_bucketed
+import runtime_profile as rp
+from student_model import STUDENT_BACKEND, load_student
+from speculative import NUM_DRAFT_TOKENS, speculative_generate
+from hangul_constraint import HangulByteLogitsProcessor
+from g2p_fast import FastG2p
+
+
+@lru_cache(maxsize=65536)
+def _wordninja_split(word: str) -> tuple[str, ...]:
+    """wordninja 분리 결과 캐시 (같은 단어가 문장마다 반복되므로)"""
+    # wordninja는 import 시 단어 빈도 모델을 읽으므로 처음 필요할 때 import (G2P 백그라운드 로드에서 미리 import)
+    import wordninja
+    return tuple(wordninja.split(word))
+
+
+def _preload_text_resources():
+    """wordninja 단어 빈도 모델 로드 (import 시 로드됨)"""
+    import wordninja  # noqa: F401
+
+
+# 합성어 파트를 사전에서 찾을 최소 길이 (한 글자 파트는 사전의 알파벳 읽기 대신 모델로)
+MIN_DICT_PART_LENGTH = 2
+
+# 로드 직후 warmup에 쓰는 대표 입력 (짧은 단어 ~ 합성어)
+WARMUP_ARPABETS = [
+    "AE1 P AH0 L",
+    "G UW1 G AH0 L",
+    "S T R AO1 B EH2 R IY0",
+    "M AY1 K R OW0 S AO2 F T",
+    "K AE2 L AH0 F AO1 R N Y AH0",
+    "T R AE0 N S F AO1 R M ER0",
+    "R EH1 D [SEP] W IH1 L OW0 [SEP] K AW1 N T IY0",
+    "AA2 R T AH0 F IH1 SH AH0 L [SEP] IH2 N T EH1 L AH0 JH AH0 N S",
+]
 
 
 class Eng2KorTransliteratorPipeline:
@@ -18,32 +56,130 @@ class Eng2KorTransliteratorPipeline:
         self, 
         model_path: str = "./train/models/byt5-arpabet2kor",
         device: str = None,
-        use_compound_split: bool = True
+        use_compound_split: bool = True,
+        backend: str = "torch",
+        confidence_threshold: float = None,
+        draft_model_path: str = None,
+        runtime_profile=None,
+        speculative: bool = False,
+        num_draft_tokens: int = NUM_DRAFT_TOKENS,
+        hangul_constraint: bool = False,
+        dictionary_lookup: Optional[Callable[[str], Optional[str]]] = None,
+        warmup: bool = True
     ):
         """
         Args:
             model_path: 학습된 모델 경로
             device: 사용할 디바이스 ('cuda', 'cpu', 또는 None으로 자동 선택)
             use_compound_split: 합성어 분리 사용 여부
+            backend: 'torch', 'onnx', 'onnx-int8' (onnx_backend 참고, ONNX는 CPU 전용)
+                'student'면 model_path는 증류한 소형 모델 폴더 (student_model, train/distill_student.py 참고)
+            confidence_threshold: 설정하면 신뢰도 기반 단계적 디코딩 사용 (0~1, 예: 0.9)
+                greedy 결과의 신뢰도(토큰 확률의 기하평균)가 이 값보다 낮은 단어만 beam search로 다시 변환
+            draft_model_path: greedy 단계에 쓸 작은 모델 (예: ./train/models/byt5-small-arpabet2kor)
+                None이면 greedy 단계도 model_path 모델 사용
+            runtime_profile: CPU 런타임 프로파일 이름 또는 옵션 dict (runtime_profile 참고)
+                None이면 bench_runtime_profile.py로 저장한 선택, 없으면 "default"
+            speculative: True면 draft_model_path 모델이 토큰을 제안하고 본 모델이 검증하는
+                speculative decoding 사용 (speculative 참고, torch 백엔드 전용)
+                결과는 본 모델 greedy decoding과 같으며 num_beams는 무시됨
+            num_draft_tokens: speculative decoding에서 한 번에 제안하는 토큰 수
+            hangul_constraint: True면 한글 음절/공백/하이픈이 되는 바이트만 생성 (hangul_constraint 참고)
+            dictionary_lookup: 영어 단어 → 한글 표기 (없으면 None) 조회 함수
+                (예: get_eng2kor_dict().lookup_word, 단위 기호 사전은 제외해야 km → 킬로미터 같은 오독이 없음)
+                합성어/문구의 파트 중 사전에 있는 것은 모델 없이 사전 표기를 사용
+            warmup: True면 로드 직후 실제 요청과 같은 shape(beam 4, 배치)으로 generate를 한 번 실행
         """
-        self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        start = time.perf_counter()
+        self.startup_times = {}
+        self.backend = backend
+        if backend in ("torch", STUDENT_BACKEND):
+            self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        else:
+            self.device = "cpu"
         self.use_compound_split = use_compound_split
+        self.dictionary_lookup = dictionary_lookup
+        # 파트 단위 처리 통계: dict(사전 표기 사용), model(모델 입력으로 보낸 구간)
+        self.segment_counts = Counter()
+        self.logits_processor = (
+            LogitsProcessorList([HangulByteLogitsProcessor()]) if hangul_constraint else None
+        )
         
         print(f"Loading model: {model_path}")
         print(f"Device: {self.device}")
+        print(f"Backend: {self.backend}")
+        
+        self.profile = rp.resolve_profile(runtime_profile)
+        print(f"Runtime profile: {self.profile['name']}")
         
-        # G2P 모델 로드
-        print("Loading G2P model...")
-        self.g2p = G2p()
+        # G2P: CMUdict 우선 조회 + 캐시, 신경망 G2P는 OOV 단어가 처음 나올 때 로드
+        # CMUdict/G2P/wordninja는 모델 로드와 겹치도록 백그라운드 스레드에서 로드
+        self.g2p = FastG2p()
+        self._g2p_thread = self.g2p.preload(background=True, extra=_preload_text_resources)
         
-        # ByT5 모델 로드
-        print("Loading ByT5 model...")
-        self.tokenizer = AutoTokenizer.from_pretrained(model_path)
-        self.model = T5ForConditionalGeneration.from_pretrained(model_path)
-        self.model.to(self.device)
-        self.model.eval()
+        stage = time.perf_counter()
+        if backend == STUDENT_BACKEND:
+            # 증류 모델은 자체 어휘를 사용 (ByT5 토크나이저 없음)
+            print("Loading student model...")
+            self.tokenizer = None
+            self.model = load_student(model_path, self.device)
+            self.model.model = rp.apply_profile(self.model.model, self.profile)
+            if confidence_threshold is not None or draft_model_path is not None:
+                print("경고: student 백엔드는 신뢰도 기반 단계적 디코딩을 지원하지 않습니다.")
+                confidence_threshold, draft_model_path = None, None
+            if self.logits_processor is not None:
+                # 학생 모델은 문자 단위 자체 어휘로 생성하므로 바이트 제약이 적용되지 않음
+                print("경고: student 백엔드는 한글 바이트 제약 디코딩을 지원하지 않습니다. 사용하지 않습니다.")
+                self.logits_processor = None
+        else:
+            # ByT5 모델 로드
+            print("Loading ByT5 model...")
+            self.tokenizer = AutoTokenizer.from_pretrained(model_path)
+            self.model = rp.apply_profile(load_seq2seq_model(model_path, backend, self.device), self.profile)
+        self.startup_times["model"] = time.perf_counter() - stage
+        
+        if speculative and (backend != "torch" or draft_model_path is None):
+            print("경고: speculative decoding은 torch 백엔드와 draft_model_path가 필요합니다. 사용하지 않습니다.")
+            speculative = False
+        if speculative and confidence_threshold is not None:
+            print("경고: speculative decoding과 신뢰도 기반 단계적 디코딩은 함께 쓸 수 없습니다. speculative만 사용합니다.")
+            confidence_threshold = None
+        self.speculative = speculative
+        self.num_draft_tokens = num_draft_tokens
+        self.speculative_counts = Counter()
         
-        print("Pipeline ready!")
+        # 신뢰도 기반 단계적 디코딩 / speculative decoding
+        # (ByT5 토크나이저는 모델 크기와 무관하게 같으므로 공유)
+        self.confidence_threshold = confidence_threshold
+        self.draft_model = None
+        if draft_model_path is not None:
+            print(f"Loading draft model: {draft_model_path}")
+            self.draft_model = rp.apply_profile(
+                load_seq2seq_model(draft_model_path, backend, self.device), self.profile
+            )
+        self.tier_counts = Counter()
+        self.tier_time = Counter()
+        self.escalated_words = 0
+        
+        # 첫 요청에서 커널 선택/컴파일이 일어나지 않도록 대표 입력으로 미리 실행
+        stage = time.perf_counter()
+        if warmup:
+            rp.warmup(
+                lambda batch: self._generate_batch(batch, num_beams=4, max_length=64),
+                WARMUP_ARPABETS,
+                # torch.compile은 shape마다 그래프를 만들므로 여러 shape으로 실행
+                batch_sizes=rp.WARMUP_BATCH_SIZES if self.profile.get("compile") else None
+            )
+        self.startup_times["warmup"] = time.perf_counter() - stage
+        
+        stage = time.perf_counter()
+        self._g2p_thread.join()
+        self.startup_times["g2p_wait"] = time.perf_counter() - stage
+        self.startup_times["total"] = time.perf_counter() - start
+        
+        print(f"Pipeline ready! ({self.startup_times['total']:.2f}s: "
+              f"model {self.startup_times['model']:.2f}s, warmup {self.startup_times['warmup']:.2f}s, "
+              f"g2p wait {self.startup_times['g2p_wait']:.2f}s)")
     
     def split_compound(self, word: str) -> list[str]:
         """합성어를 분리합니다."""
@@ -54,7 +190,7 @@ class Eng2KorTransliteratorPipeline:
         if ' ' in word:
             return word.split()
         
-        parts = wordninja.split(word)
+        parts = list(_wordninja_split(word))
         
         # 너무 짧은 조각 방지
         if any(len(p) < 2 for p in parts):
@@ -74,19 +210,241 @@ class Eng2KorTransliteratorPipeline:
         max_length: int = 64
     ) -> str:
         """ARPABET을 한글로 변환합니다."""
+        if self.backend == STUDENT_BACKEND:
+            return self.model.transliterate_batch([arpabet], num_beams, max_length)[0]
+        if self.speculative:
+            return self.arpabet_to_korean_speculative([arpabet], max_length)[0]
+        
         inputs = self.tokenizer(arpabet, return_tensors="pt").to(self.device)
         
-        with torch.no_grad():
+        with rp.inference_context(self.profile):
             outputs = self.model.generate(
                 **inputs,
                 max_length=max_length,
                 num_beams=num_beams,
-                early_stopping=True
+                early_stopping=True,
+                logits_processor=self.logits_processor
             )
         
         result = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
         return result
     
+    def arpabet_to_korean_batch(
+        self,
+        arpabets: list[str],
+        num_beams: int = 4,
+        max_length: int = 64,
+        batch_size: int = 32,
+        max_tokens: int = None
+    ) -> list[str]:
+        """
+        ARPABET 여러 개를 길이가 비슷한 것끼리 패딩해서 한 번에 generate 합니다. (batching 참고)
+        결과는 arpabets 순서로 반환합니다.
+        """
+        return run_bucketed(
+            arpabets,
+            lambda batch: self._generate_batch(batch, num_beams, max_length),
+            batch_size=batch_size,
+            max_tokens=max_tokens
+        )
+    
+    def _generate_batch(self, batch: list[str], num_beams: int, max_length: int) -> list[str]:
+        if self.backend == STUDENT_BACKEND:
+            return self.model.transliterate_batch(batch, num_beams, max_length)
+        if self.speculative:
+            return self.arpabet_to_korean_speculative(batch, max_length)
+        
+        inputs = self.tokenizer(
+            batch,
+            return_tensors="pt",
+            padding=True
+        ).to(self.device)
+        
+        with rp.inference_context(self.profile):
+            outputs = self.model.generate(
+                **inputs,
+                max_length=max_length,
+                num_beams=num_beams,
+                early_stopping=True,
+                logits_processor=self.logits_processor
+            )
+        
+        return self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
+    
+    def arpabet_to_korean_speculative(self, arpabets: list[str], max_length: int = 64) -> list[str]:
+        """
+        draft 모델 제안 + 본 모델 검증으로 변환합니다. 결과는 본 모델 greedy와 같습니다.
+        (제안을 받아들이는 길이가 입력마다 달라서 한 단어씩 처리)
+        """
+        results = []
+        for arpabet in arpabets:
+            inputs = self.tokenizer(arpabet, return_tensors="pt").to(self.device)
+            with rp.inference_context(self.profile):
+                tokens = speculative_generate(
+                    self.model, self.draft_model, inputs["input_ids"], inputs["attention_mask"],
+                    max_length=max_length, num_draft_tokens=self.num_draft_tokens,
+                    stats=self.speculative_counts, logits_processor=self.logits_processor
+                )
+            results.append(self.tokenizer.decode(tokens, skip_special_tokens=True))
+        return results
+    
+    def speculative_stats(self) -> dict:
+        """제안 토큰 수락률, 본 모델 forward 한 번당 생성 토큰 수"""
+        counts = self.speculative_counts
+        return {
+            **counts,
+            "acceptance_rate": counts["accepted"] / counts["proposed"] if counts["proposed"] else 0.0,
+            "tokens_per_target_call": ((counts["accepted"] + counts["target_calls"]) / counts["target_calls"]
+                                       if counts["target_calls"] else 0.0),
+        }
+    
+    def arpabet_to_korean_scored(
+        self,
+        arpabets: list[str],
+        max_length: int = 64,
+        batch_size: int = 32,
+        model=None
+    ) -> tuple[list[str], list[float]]:
+        """
+        greedy decoding 결과와 시퀀스 신뢰도(생성 토큰 확률의 기하평균)를 반환합니다.
+        """
+        model = model if model is not None else self.model
+        pad_token_id = self.tokenizer.pad_token_id
+        texts, confidences = [], []
+        for i in range(0, len(arpabets), batch_size):
+            batch = arpabets[i:i + batch_size]
+            inputs = self.tokenizer(batch, return_tensors="pt", padding=True).to(self.device)
+            
+            with rp.inference_context(self.profile):
+                outputs = model.generate(
+                    **inputs,
+                    max_length=max_length,
+                    num_beams=1,
+                    do_sample=False,
+                    output_scores=True,
+                    return_dict_in_generate=True,
+                    logits_processor=self.logits_processor
+                )
+                log_probs = model.compute_transition_scores(
+                    outputs.sequences, outputs.scores, normalize_logits=True
+                )
+            
+            # 첫 토큰(decoder start)은 생성된 토큰이 아니고, EOS 이후는 패딩
+            generated = outputs.sequences[:, 1:]
+            mask = generated != pad_token_id
+            log_probs = log_probs.masked_fill(~mask, 0.0)
+            mean_log_probs = log_probs.sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+            
+            confidences.extend(torch.exp(mean_log_probs).tolist())
+            texts.extend(self.tokenizer.batch_decode(outputs.sequences, skip_special_tokens=True))
+        return texts, confidences
+    
+    def arpabet_to_korean_escalating(
+        self,
+        arpabets: list[str],
+        num_beams: int = 4,
+        max_length: int = 64,
+        batch_size: int = 32
+    ) -> list[str]:
+        """
+        1단계: greedy (draft 모델이 있으면 draft 모델)
+        2단계: 신뢰도가 confidence_threshold 미만인 입력만 본 모델 beam search
+        """
+        greedy_tier = "greedy-draft" if self.draft_model is not None else "greedy"
+        
+        start = time.perf_counter()
+        results, confidences = self.arpabet_to_korean_scored(
+            arpabets, max_length, batch_size, model=self.draft_model
+        )
+        self.tier_time[greedy_tier] += time.perf_counter() - start
+        
+        unsure = [i for i, confidence in enumerate(confidences) if confidence < self.confidence_threshold]
+        self.tier_counts[greedy_tier] += len(arpabets) - len(unsure)
+        
+        if unsure:
+            start = time.perf_counter()
+            beams = self.arpabet_to_korean_batch(
+                [arpabets[i] for i in unsure], num_beams, max_length, batch_size
+            )
+            self.tier_time["beam"] += time.perf_counter() - start
+            self.tier_counts["beam"] += len(unsure)
+            for i, korean in zip(unsure, beams):
+                results[i] = korean
+        
+        self.escalated_words += len(arpabets)
+        return results
+    
+    def escalation_stats(self) -> dict:
+        """단계별 사용 횟수/비율, 단어당 평균 지연 시간"""
+        total = self.escalated_words
+        total_time = sum(self.tier_time.values())
+        return {
+            "words": total,
+            "tiers": {
+                tier: {"count": count, "rate": count / total if total else 0.0}
+                for tier, count in self.tier_counts.items()
+            },
+            "tier_time_s": dict(self.tier_time),
+            "avg_latency_ms": total_time / total * 1000 if total else 0.0,
+        }
+    
+    def plan_segments(self, text: str) -> tuple[list[str], list[tuple[str, str]], str]:
+        """
+        합성어 분리 후 파트별로 사전을 먼저 조회해서 변환 구간을 나눕니다.
+        사전에 없는 파트가 연속되면 한 구간으로 묶어 [SEP] 입력으로 함께 생성합니다.
+        
+        Returns:
+            (분리된 파트, 구간 리스트, 구간을 이을 구분자)
+            구간은 ("dict", 한글 표기) 또는 ("model", 모델 입력 ARPABET 문자열)
+            구분자는 입력에 공백이 있었으면 ' ', 아니면 ''
+        """
+        parts = self.split_compound(text)
+        separator = ' ' if ' ' in text else ''
+        
+        segments = []
+        unknown = []
+        for part in parts:
+            reading = (
+                self.dictionary_lookup(part)
+                if self.dictionary_lookup is not None and len(part) >= MIN_DICT_PART_LENGTH else None
+            )
+            if reading is None:
+                unknown.append(part)
+                continue
+            if unknown:
+                segments.append(("model", self._parts_to_arpabet(unknown)))
+                unknown = []
+            segments.append(("dict", reading))
+        if unknown:
+            segments.append(("model", self._parts_to_arpabet(unknown)))
+        
+        for kind, _ in segments:
+            self.segment_counts[kind] += 1
+        return parts, segments, separator
+    
+    def _parts_to_arpabet(self, parts: list[str]) -> str:
+        return ' [SEP] '.join(self.word_to_arpabet(part) for part in parts)
+    
+    @staticmethod
+    def _join_segments(segments: list[tuple[str, str]], separator: str, generated: dict[str, str]) -> str:
+        return separator.join(
+            value if kind == "dict" else generated[value] for kind, value in segments
+        )
+    
+    def _generate_segments(self, arpabets: list[str], num_beams: int, max_length: int,
+                           batch_size: int = 32) -> dict[str, str]:
+        """모델 구간 ARPABET → 한글 (중복 제거)"""
+        arpabets = list(dict.fromkeys(arpabets))
+        if not arpabets:
+            return {}
+        if self.confidence_threshold is not None:
+            koreans = self.arpabet_to_korean_escalating(arpabets, num_beams, max_length, batch_size)
+        elif len(arpabets) == 1:
+            koreans = [self.arpabet_to_korean(arpabets[0], num_beams, max_length)]
+        else:
+            koreans = self.arpabet_to_korean_batch(arpabets, num_beams, max_length, batch_size)
+        return dict(zip(arpabets, koreans))
+    
     def transliterate(
         self, 
         text: str, 
@@ -108,30 +466,22 @@ class Eng2KorTransliteratorPipeline:
         """
         text = text.lower().strip()
         
-        # 1. 합성어 분리
-        parts = self.split_compound(text)
+        # 1~3. 합성어 분리 + 파트별 사전 조회 + (사전에 없는 파트만) G2P
+        parts, segments, separator = self.plan_segments(text)
         
-        # 2. 각 파트를 ARPABET으로 변환
-        arpabet_parts = []
-        for part in parts:
-            arpabet = self.word_to_arpabet(part)
-            arpabet_parts.append(arpabet)
-        
-        # 3. 합성어면 [SEP]로 구분
-        if len(arpabet_parts) > 1:
-            arpabet_text = ' [SEP] '.join(arpabet_parts)
-        else:
-            arpabet_text = arpabet_parts[0]
-        
-        # 4. ARPABET을 한글로 변환
-        korean = self.arpabet_to_korean(arpabet_text, num_beams, max_length)
+        # 4. 사전에 없는 구간만 ARPABET을 한글로 변환
+        arpabet_parts = [value for kind, value in segments if kind == "model"]
+        generated = self._generate_segments(arpabet_parts, num_beams, max_length)
+        korean = self._join_segments(segments, separator, generated)
         
         if return_details:
+            # arpabet_parts/arpabet: 실제로 모델에 넣은 입력 (사전으로 읽은 파트는 제외)
             return {
                 "input": text,
                 "parts": parts,
                 "arpabet_parts": arpabet_parts,
-                "arpabet": arpabet_text,
+                "arpabet": ' [SEP] '.join(arpabet_parts),
+                "segments": segments,
                 "korean": korean,
                 "is_compound": len(parts) > 1
             }
@@ -142,16 +492,42 @@ class Eng2KorTransliteratorPipeline:
         self, 
         texts: list[str], 
         num_beams: int = 4,
-        max_length: int = 64
+        max_length: int = 64,
+        batch_size: int = 32
     ) -> list[str]:
         """
         여러 영어 단어/문구를 일괄 변환합니다.
+        합성어 분리/사전 조회/G2P를 전체 목록에 대해 먼저 수행하고,
+        사전에 없는 구간의 ARPABET 입력만 패딩해서 batch_size 단위로 한 번씩만 generate 합니다.
+        (같은 단어/구간은 한 번만 변환)
+        int8 런타임 프로파일에서는 결과가 배치 구성에 따라 달라져 transliterate와 다를 수 있습니다.
+        
+        Args:
+            texts: 변환할 영어 텍스트 리스트
+            num_beams: 빔 서치 크기
+            max_length: 최대 출력 길이
+            batch_size: 한 번의 generate에 넣을 입력 수
+            
+        Returns:
+            한글 음차 변환 결과 리스트 (texts와 같은 순서)
         """
-        results = []
-        for text in texts:
-            result = self.transliterate(text, num_beams, max_length)
-            results.append(result)
-        return results
+        normalized = [text.lower().strip() for text in texts]
+        unique_texts = list(dict.fromkeys(normalized))
+        
+        # 1~3. 합성어 분리 + 사전 조회 + G2P (전체 목록)
+        plans = {text: self.plan_segments(text) for text in unique_texts}
+        
+        # 4. 사전에 없는 구간만 ARPABET을 한글로 변환 (패딩 배치)
+        generated = self._generate_segments(
+            [value for _, segments, _ in plans.values() for kind, value in segments if kind == "model"],
+            num_beams, max_length, batch_size
+        )
+        
+        results = {
+            text: self._join_segments(segments, separator, generated)
+            for text, (_, segments, separator) in plans.items()
+        }
+        return [results[text] for text in normalized]
 
 
 
@@ -6,28 +6,56 @@ ByT5 한영 음차 변환 추론 스크립트
 """
 
 import torch
-from transformers import AutoTokenizer, T5ForConditionalGeneration
+from transformers import AutoTokenizer, LogitsProcessorList
+from onnx_backend import load_seq2seq_model
+from batching import byte_length, run_bucketed
+import runtime_profile as rp
+from hangul_constraint import HangulByteLogitsProcessor
+
+
+# 로드 직후 warmup에 쓰는 대표 입력 (짧은 단어 ~ 여러 단어 문구)
+WARMUP_TEXTS = ["apple", "google", "brooklyn", "microsoft", "starbucks",
+                "california", "red willow county", "artificial intelligence"]
 
 
 class Eng2KorTransliterator:
     """영어-한글 음차 변환기"""
     
-    def __init__(self, model_path: str = "./train/models/byt5-eng2kor", device: str = None):
+    def __init__(self, model_path: str = "./train/models/byt5-eng2kor", device: str = None,
+                 backend: str = "torch", runtime_profile=None, hangul_constraint: bool = False):
         """
         Args:
             model_path: 학습된 모델 경로
             device: 사용할 디바이스 ('cuda', 'cpu', 또는 None으로 자동 선택)
+            backend: 'torch', 'onnx', 'onnx-int8' (onnx_backend 참고, ONNX는 CPU 전용)
+            runtime_profile: CPU 런타임 프로파일 이름 또는 옵션 dict (runtime_profile 참고)
+            hangul_constraint: True면 한글 음절/공백/하이픈이 되는 바이트만 생성 (hangul_constraint 참고)
         """
-        self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        self.backend = backend
+        if backend == "torch":
+            self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        else:
+            self.device = "cpu"
         self.task_prefix = "transliterate: "
+        self.logits_processor = (
+            LogitsProcessorList([HangulByteLogitsProcessor()]) if hangul_constraint else None
+        )
         
         print(f"모델 로드 중: {model_path}")
         print(f"디바이스: {self.device}")
+        print(f"백엔드: {self.backend}")
+        
+        self.profile = rp.resolve_profile(runtime_profile)
+        print(f"런타임 프로파일: {self.profile['name']}")
         
         self.tokenizer = AutoTokenizer.from_pretrained(model_path)
-        self.model = T5ForConditionalGeneration.from_pretrained(model_path)
-        self.model.to(self.device)
-        self.model.eval()
+        self.model = rp.apply_profile(load_seq2seq_model(model_path, backend, self.device), self.profile)
+        
+        rp.warmup(
+            lambda batch: self._generate_batch(batch, num_beams=4, max_length=64),
+            [f"{self.task_prefix}{text}" for text in WARMUP_TEXTS],
+            batch_sizes=rp.WARMUP_BATCH_SIZES if self.profile.get("compile") else None
+        )
         
         print("모델 로드 완료!")
     
@@ -51,12 +79,13 @@ class Eng2KorTransliterator:
         input_text = f"{self.task_prefix}{text.lower()}"
         inputs = self.tokenizer(input_text, return_tensors="pt").to(self.device)
         
-        with torch.no_grad():
+        with rp.inference_context(self.profile):
             outputs = self.model.generate(
                 **inputs,
                 max_length=max_length,
                 num_beams=num_beams,
-                early_stopping=True
+                early_stopping=True,
+                logits_processor=self.logits_processor
             )
         
         result = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
@@ -67,48 +96,56 @@ class Eng2KorTransliterator:
         texts: list[str], 
         num_beams: int = 4,
         max_length: int = 64,
-        batch_size: int = 32
+        batch_size: int = 32,
+        max_tokens: int = None,
+        sort_by_length: bool = True
     ) -> list[str]:
         """
         여러 영어 단어/문구를 일괄 변환합니다.
+        비슷한 길이의 입력끼리 배치를 만들어 패딩을 줄이고, 결과는 입력 순서로 돌려줍니다. (batching 참고)
         
         Args:
             texts: 변환할 영어 텍스트 리스트
             num_beams: 빔 서치 크기
             max_length: 최대 출력 길이
             batch_size: 배치 크기
+            max_tokens: 배치당 최대 패딩 포함 바이트 수 (None이면 batch_size만 사용)
+            sort_by_length: False면 입력 순서대로 배치 구성
             
         Returns:
             한글 음차 변환 결과 리스트
         """
-        results = []
+        input_texts = [f"{self.task_prefix}{t.lower()}" for t in texts]
+        return run_bucketed(
+            input_texts,
+            lambda batch: self._generate_batch(batch, num_beams, max_length),
+            batch_size=batch_size,
+            max_tokens=max_tokens,
+            sort_by_length=sort_by_length,
+            length_fn=lambda text: min(byte_length(text), 128)
+        )
+    
+    def _generate_batch(self, input_texts: list[str], num_beams: int, max_length: int) -> list[str]:
+        inputs = self.tokenizer(
+            input_texts, 
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=128
+        ).to(self.device)
         
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            input_texts = [f"{self.task_prefix}{t.lower()}" for t in batch]
-            
-            inputs = self.tokenizer(
-                input_texts, 
-                return_tensors="pt",
-                padding=True,
-                truncation=True,
-                max_length=128
-            ).to(self.device)
-            
-            with torch.no_grad():
-                outputs = self.model.generate(
-                    **inputs,
-                    max_length=max_length,
-                    num_beams=num_beams,
-                    early_stopping=True
-                )
-            
-            batch_results = self.tokenizer.batch_decode(
-                outputs, skip_special_tokens=True
+        with rp.inference_context(self.profile):
+            outputs = self.model.generate(
+                **inputs,
+                max_length=max_length,
+                num_beams=num_beams,
+                early_stopping=True,
+                logits_processor=self.logits_processor
             )
-            results.extend(batch_results)
         
-        return results
+        return self.tokenizer.batch_decode(
+            outputs, skip_special_tokens=True
+        )
 
 
 def main():
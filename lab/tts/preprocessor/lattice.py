@@ -0,0 +1,86 @@
+"""
+형태소 분석 결과를 문장 단위로 평탄화한 토큰 격자(lattice)
+
+기존에는 어절별 list[list[Morph]]와 출력용 복사본(chunks)을 따로 만들고,
+토큰마다 get_context로 어절 경계를 넘나드는 index 계산을 했습니다.
+TokenLattice는 문장 전체 토큰을 한 줄로 펴서 병렬 배열로 저장합니다.
+
+    morphs      : Mecab 분석 결과 (표층형, 품사) - Mecab이 만든 tuple을 그대로 사용
+    surfaces    : 표층형
+    tags        : 품사
+    eojeol_ids  : 토큰이 속한 어절 번호
+    starts      : 어절별 첫 토큰 index
+    prev_idx    : 문맥으로 쓸 앞 토큰 index (문장 처음이거나 앞 토큰이 SF면 -1)
+    next_idx    : 문맥으로 쓸 뒤 토큰 index (문장 끝이거나 뒤 토큰이 SF면 -1)
+    outputs     : 토큰별 변환 결과 (trans_bundle이 채움)
+"""
+from array import array
+from typing import Optional
+
+
+Morph = tuple[str, str]
+
+
+def is_sentence_final(pos: str) -> bool:
+    return pos.startswith("SF")
+
+
+class TokenLattice:
+    __slots__ = ("morphs", "surfaces", "tags", "eojeol_ids", "starts",
+                 "prev_idx", "next_idx", "outputs")
+
+    def __init__(self, morphs: list[Morph], eojeol_ids: array):
+        n = len(morphs)
+        self.morphs = morphs
+        self.surfaces = [m[0] for m in morphs]
+        self.tags = [m[1] for m in morphs]
+        self.eojeol_ids = eojeol_ids
+        self.starts = array('i', (k for k in range(n) if k == 0 or eojeol_ids[k] != eojeol_ids[k - 1]))
+        self.outputs: list[Optional[str]] = list(self.surfaces)
+
+        # SF는 품사가 바뀌지 않으므로 문맥 index를 한 번만 계산
+        final = [is_sentence_final(tag) for tag in self.tags]
+        self.prev_idx = array('i', (k - 1 if k > 0 and not final[k - 1] else -1 for k in range(n)))
+        self.next_idx = array('i', (k + 1 if k + 1 < n and not final[k + 1] else -1 for k in range(n)))
+
+    @classmethod
+    def from_analysis(cls, sentence: str, morphs: list[Morph]) -> "TokenLattice":
+        """
+        Mecab 분석 결과를 공백 기준 어절에 배정합니다.
+        현재 어절에 다음 형태소까지 이어붙인 문자열이 원문 어절에 없으면 어절이 끝난 것으로 봄.
+        """
+        words = sentence.split(" ")
+        eojeol_ids = array('i')
+        eojeol = 0
+        joined = ''
+        last = len(morphs) - 1
+        for k, (surface, _) in enumerate(morphs):
+            eojeol_ids.append(eojeol)
+            joined += surface
+            if k < last and joined + morphs[k + 1][0] not in words[eojeol]:
+                eojeol += 1
+                joined = ''
+        return cls(morphs, eojeol_ids)
+
+    def __len__(self) -> int:
+        return len(self.surfaces)
+
+    def replace(self, k: int, surface: str, tag: str):
+        """k번째 토큰을 바꿉니다. (SF로 바꾸거나 SF를 바꾸는 경우는 지원하지 않음)"""
+        self.morphs[k] = (surface, tag)
+        self.surfaces[k] = surface
+        self.tags[k] = tag
+        self.outputs[k] = surface
+
+    def context(self, k: int) -> tuple[Optional[Morph], Optional[Morph]]:
+        """k번째 토큰의 (prev, nxt). 없거나 SF면 None"""
+        p = self.prev_idx[k]
+        q = self.next_idx[k]
+        return (self.morphs[p] if p >= 0 else None,
+                self.morphs[q] if q >= 0 else None)
+
+    def eojeols(self, outputs: Optional[list[str]] = None) -> list[str]:
+        """토큰 출력을 어절 단위로 이어붙입니다."""
+        outputs = self.outputs if outputs is None else outputs
+        ends = list(self.starts[1:]) + [len(outputs)]
+        return [''.join(outputs[a:b]) for a, b in zip(self.starts, ends)]
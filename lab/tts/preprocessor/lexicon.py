@@ -93,7 +93,8 @@ _SINO_DIGITS = {
     9: "구",
 }
 _SINO_SMALL_UNITS = ["", "십", "백", "천"]  # 1, 10, 100, 1000
-_SINO_BIG_UNITS = ["", "만", "억", "조", "경"]  # 10^4, 10^8 ...
+# 10^4, 10^8 ... 10^48 (극 이상은 읽지 않음)
+_SINO_BIG_UNITS = ["", "만", "억", "조", "경", "해", "자", "양", "구", "간", "정", "재", "극"]
 
 _NATIVE_ONES = {
     1: "한",
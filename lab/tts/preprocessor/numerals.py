@@ -0,0 +1,125 @@
+"""
+테이블 기반 숫자 읽기
+
+0~9999 네 자리 묶음의 한자어 읽기를 미리 만들어 두고, 큰 수는 네 자리씩 끊어
+묶음 읽기 + 큰 단위(만, 억, 조, 경, 해, 자, 양, 구, 간, 정, 재, 극)를 이어붙입니다.
+readutils의 read_sino_kor, read_native_kor, read_only_num이 이 모듈을 사용합니다.
+
+기존 동작 유지:
+    - 10000 → "일만" (만 앞의 1을 생략하지 않음), 10 → "십" (십/백/천 앞의 1은 생략)
+    - 고유어 읽기는 1~99만, 100 이상과 음수는 한자어로 읽음
+    - 0은 한자어/고유어 모두 "영"
+    - 읽을 수 있는 단위(극)를 넘는 수는 숫자 문자열 그대로 반환
+"""
+from decimal import Decimal
+from typing import Iterable
+from lexicon import _SINO_DIGITS, _SINO_SMALL_UNITS, _SINO_BIG_UNITS, _NATIVE_ONES, _NATIVE_TENS
+
+
+ZERO = "영"
+MINUS = "마이너스 "
+POINT = "점"
+
+GROUP_SIZE = 10000
+# 읽을 수 있는 가장 큰 수 + 1 (극 단위 묶음까지)
+SINO_LIMIT = GROUP_SIZE ** len(_SINO_BIG_UNITS)
+
+
+def _build_sino_groups() -> tuple[str, ...]:
+    """0~9999 한자어 읽기 (0은 빈 문자열, 십/백/천 앞의 1은 생략)"""
+    places = []
+    for pos, unit in enumerate(_SINO_SMALL_UNITS):
+        place = [""]
+        for digit in range(1, 10):
+            # 예: 10 → "십", 100 → "백", 1000 → "천", 1592 → "천오백구십이"
+            place.append(unit if pos > 0 and digit == 1 else _SINO_DIGITS[digit] + unit)
+        places.append(place)
+    ones, tens, hundreds, thousands = places
+    return tuple(t + h + te + o for t in thousands for h in hundreds for te in tens for o in ones)
+
+
+def _build_native() -> tuple[str, ...]:
+    """0~99 고유어 읽기 (관형사형: 한, 두, 세, 스무 ...)"""
+    readings = [ZERO]
+    for n in range(1, 100):
+        tens, ones = divmod(n, 10)
+        if n == 20:
+            readings.append("스무")
+        else:
+            readings.append(_NATIVE_TENS.get(tens, "") + _NATIVE_ONES.get(ones, ""))
+    return tuple(readings)
+
+
+_SINO_GROUPS = _build_sino_groups()
+_NATIVE = _build_native()
+_DIGIT_TABLE = str.maketrans("0123456789", ZERO + "".join(_SINO_DIGITS[d] for d in range(1, 10)))
+
+
+def sino(n: int) -> str:
+    """한자어 읽기 (예: 1592 → "천오백구십이", 10000 → "일만")"""
+    if n < GROUP_SIZE:
+        if n > 0:
+            return _SINO_GROUPS[n]
+        if n == 0:
+            return ZERO
+        return MINUS + sino(-n)
+    if n >= SINO_LIMIT:
+        return str(n)
+
+    parts = []
+    unit = 0
+    while n:
+        n, group = divmod(n, GROUP_SIZE)
+        if group:
+            parts.append(_SINO_GROUPS[group] + _SINO_BIG_UNITS[unit])
+        unit += 1
+    return "".join(reversed(parts))
+
+
+def native(n: int) -> str:
+    """고유어 읽기 (1~99), 그 외는 한자어 읽기"""
+    if 0 <= n < 100:
+        return _NATIVE[n]
+    return sino(n)
+
+
+def digits(n: int | str) -> str:
+    """자리수별 읽기 (예: 2024 → "이영이사")"""
+    if isinstance(n, int) and n < 0:
+        return MINUS + digits(-n)
+    return str(n).translate(_DIGIT_TABLE)
+
+
+def decimal(value: int | float | str | Decimal) -> str:
+    """
+    소수 읽기: 정수부는 한자어, 소수부는 자리수별 (예: "3.14" → "삼점일사", "-0.5" → "마이너스 영점오")
+    float은 repr 그대로 읽으므로 자리수가 중요하면 문자열이나 Decimal로 넘길 것
+    (float/Decimal은 지수 표기 없이 풀어서 읽음: 1e-05 → "영점영영영영일")
+    """
+    if isinstance(value, float):
+        value = Decimal(repr(value))
+    text = format(value, 'f') if isinstance(value, Decimal) else str(value).strip()
+    sign = ""
+    if text.startswith("-"):
+        sign, text = MINUS, text[1:]
+    integer, _, fraction = text.partition(".")
+    reading = sino(int(integer or "0"))
+    if fraction:
+        reading += POINT + digits(fraction)
+    return sign + reading
+
+
+_READERS = {
+    "sino": sino,
+    "native": native,
+    "digits": digits,
+    "decimal": decimal,
+}
+
+
+def read_batch(values: Iterable, kind: str = "sino") -> list[str]:
+    """
+    여러 수를 한 번에 읽습니다. (bench_numerals처럼 값 목록을 한 번에 읽는 도구용)
+    kind: "sino", "native", "digits", "decimal"
+    """
+    return list(map(_READERS[kind], values))
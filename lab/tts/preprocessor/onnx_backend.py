@@ -0,0 +1,145 @@
+"""
+ByT5 음차 변환 모델의 ONNX Runtime (CPU) 백엔드
+
+PyTorch generate 대신 ONNX Runtime으로 인코더 / 디코더 / past key-value를 쓰는 디코더를 실행합니다.
+optimum의 ORTModelForSeq2SeqLM을 사용하므로 generate()의 greedy/beam search와
+KV cache 재사용이 그대로 동작하고, 기존 transliterate / transliterate_batch 코드를 바꿀 필요가 없습니다.
+
+백엔드:
+    "torch"     : T5ForConditionalGeneration (기존)
+    "onnx"      : ONNX (fp32)
+    "onnx-int8" : ONNX + 동적 int8 양자화 (가중치 int8, 활성값은 실행 시 양자화)
+
+ONNX 모델은 처음 사용할 때 {model_path}-onnx, {model_path}-onnx-int8 폴더로 내보내고 이후에는 재사용합니다.
+
+torch 백엔드는 low_cpu_mem_usage로 로드합니다. 모델 폴더에 model.safetensors가 있으면 가중치를
+memory-map해서 읽으므로 pytorch_model.bin(pickle 전체 읽기 + 복사)보다 빨리 뜹니다.
+기존 .bin 모델은 --safetensors로 한 번 변환해 두세요.
+
+사용 예:
+    pipeline = Eng2KorTransliteratorPipeline(backend="onnx-int8")
+
+    # 미리 내보내기
+    python onnx_backend.py ./train/models/byt5-arpabet2kor --quantize
+
+    # torch 모델을 safetensors로 변환 (빠른 시작)
+    python onnx_backend.py ./train/models/byt5-arpabet2kor --safetensors
+"""
+import argparse
+import shutil
+from pathlib import Path
+
+
+BACKENDS = ("torch", "onnx", "onnx-int8")
+ONNX_PROVIDER = "CPUExecutionProvider"
+# 디코더는 past key-value를 입력으로 받는 그래프를 함께 내보냄
+ONNX_FILES = ("encoder_model.onnx", "decoder_model.onnx", "decoder_with_past_model.onnx")
+SAFETENSORS_FILE = "model.safetensors"
+
+
+def onnx_dir(model_path: str | Path, quantize: bool = False) -> Path:
+    model_path = Path(model_path)
+    suffix = "-onnx-int8" if quantize else "-onnx"
+    return model_path.parent / (model_path.name + suffix)
+
+
+def export_onnx(model_path: str | Path, quantize: bool = False) -> Path:
+    """
+    모델을 ONNX로 내보냅니다. quantize=True면 fp32 ONNX를 만든 뒤 동적 int8 양자화합니다.
+
+    Returns:
+        ONNX 모델 폴더
+    """
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    from transformers import AutoTokenizer
+
+    fp32_dir = onnx_dir(model_path)
+    if not (fp32_dir / ONNX_FILES[0]).exists():
+        print(f"ONNX 내보내기: {model_path} → {fp32_dir}")
+        model = ORTModelForSeq2SeqLM.from_pretrained(str(model_path), export=True, use_cache=True)
+        model.save_pretrained(fp32_dir)
+        AutoTokenizer.from_pretrained(str(model_path)).save_pretrained(fp32_dir)
+
+    if not quantize:
+        return fp32_dir
+
+    int8_dir = onnx_dir(model_path, quantize=True)
+    if (int8_dir / ONNX_FILES[0]).exists():
+        return int8_dir
+
+    from optimum.onnxruntime import ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    print(f"동적 int8 양자화: {fp32_dir} → {int8_dir}")
+    # 대부분의 x86 서버에서 동작하는 AVX2 기준 (VNNI가 있으면 avx512_vnni가 더 빠름)
+    config = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+    for file_name in ONNX_FILES:
+        if not (fp32_dir / file_name).exists():
+            continue
+        quantizer = ORTQuantizer.from_pretrained(fp32_dir, file_name=file_name)
+        quantizer.quantize(save_dir=int8_dir, quantization_config=config)
+        # 양자화 결과는 {이름}_quantized.onnx로 저장되므로 원래 이름으로 맞춤
+        quantized = int8_dir / file_name.replace(".onnx", "_quantized.onnx")
+        if quantized.exists():
+            quantized.replace(int8_dir / file_name)
+
+    # config / tokenizer 파일 복사
+    for path in fp32_dir.iterdir():
+        if path.suffix != ".onnx" and path.is_file() and not (int8_dir / path.name).exists():
+            shutil.copy(path, int8_dir / path.name)
+    return int8_dir
+
+
+def convert_to_safetensors(model_path: str | Path) -> Path:
+    """pytorch_model.bin 모델 폴더에 model.safetensors를 만듭니다. (이미 있으면 그대로)"""
+    model_path = Path(model_path)
+    if (model_path / SAFETENSORS_FILE).exists():
+        return model_path / SAFETENSORS_FILE
+    from transformers import T5ForConditionalGeneration
+    print(f"safetensors 변환: {model_path}")
+    model = T5ForConditionalGeneration.from_pretrained(model_path)
+    model.save_pretrained(model_path, safe_serialization=True)
+    return model_path / SAFETENSORS_FILE
+
+
+def load_seq2seq_model(model_path: str | Path, backend: str = "torch", device: str = "cpu"):
+    """
+    backend에 맞는 seq2seq 모델을 로드합니다. 반환된 모델은 모두 generate()를 지원합니다.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"지원하지 않는 backend: {backend} (가능: {', '.join(BACKENDS)})")
+
+    if backend == "torch":
+        from transformers import T5ForConditionalGeneration
+        # 빈 모델을 먼저 만들지 않고 가중치를 바로 채움 (safetensors면 mmap)
+        model = T5ForConditionalGeneration.from_pretrained(
+            model_path,
+            low_cpu_mem_usage=True,
+            use_safetensors=(Path(model_path) / SAFETENSORS_FILE).exists() or None
+        )
+        model.to(device)
+        model.eval()
+        return model
+
+    if device != "cpu":
+        print(f"경고: ONNX 백엔드는 CPU에서만 사용합니다. (요청: {device})")
+
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    model_dir = export_onnx(model_path, quantize=(backend == "onnx-int8"))
+    return ORTModelForSeq2SeqLM.from_pretrained(model_dir, use_cache=True, provider=ONNX_PROVIDER)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ByT5 모델 ONNX 내보내기")
+    parser.add_argument("model_path")
+    parser.add_argument("--quantize", action="store_true", help="동적 int8 양자화 모델도 생성")
+    parser.add_argument("--safetensors", action="store_true", help="ONNX 대신 torch 모델을 safetensors로 변환")
+    args = parser.parse_args()
+    if args.safetensors:
+        print(f"저장 위치: {convert_to_safetensors(args.model_path)}")
+        return
+    print(f"저장 위치: {export_onnx(args.model_path, quantize=args.quantize)}")
+
+
+if __name__ == "__main__":
+    main()
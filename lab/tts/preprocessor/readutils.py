@@ -5,85 +5,18 @@ import glob
 import os
 import json
 from pathlib import Path
-from lexicon import _SINO_DIGITS, _SINO_SMALL_UNITS, _SINO_BIG_UNITS, _NATIVE_ONES, _NATIVE_TENS
+import numerals
 from lexicon import ENG_NUM_0, ENG_NUM_TENS, ENG_NUM_TEEN, ENG_NUM_READ_PER_DIGIT, ALPHA_READ
 from lexicon import symbols, sym_kor, sym_eng, count_symbols, count_sym_kor, ENGLISH_CONTRACTIONS
 
 
+# 숫자 읽기는 테이블 기반 numerals 모듈에 위임 (기존 함수 이름/동작 유지)
 def read_sino_kor(n: int) -> str:
-    if n == 0:
-        return "영"
-    if n < 0:
-        return "마이너스 " + read_sino_kor(-n)
-
-    # 너무 큰 수는 일단 스트링으로만 (필요하면 확장)
-    if n > 9999999999999999:
-        return str(n)
-
-    parts: list[str] = []
-    group_index = 0  # 만, 억, 조, ...
-
-    while n > 0:
-        group = n % 10000
-        n //= 10000
-
-        if group == 0:
-            group_index += 1
-            continue
-
-        small_parts: list[str] = []
-        pos = 0
-        while group > 0:
-            digit = group % 10
-            group //= 10
-
-            if digit != 0:
-                # 십, 백, 천 단위에서 1은 "일"을 생략
-                # 예: 10 → "십", 100 → "백", 1000 → "천", 1592 → "천오백구십이"
-                if pos > 0 and digit == 1:
-                    small_parts.append(_SINO_SMALL_UNITS[pos])  # "일" 없이 단위만
-                else:
-                    small_parts.append(_SINO_DIGITS[digit] + _SINO_SMALL_UNITS[pos])
-            pos += 1
-
-        group_str = "".join(reversed(small_parts))
-        unit_str = _SINO_BIG_UNITS[group_index]
-        parts.append(group_str + unit_str)
-
-        group_index += 1
-
-    return "".join(reversed(parts))
+    return numerals.sino(n)
 
 
 def read_native_kor(n: int) -> str:
-    if n >= 100:
-        return read_sino_kor(n)
-    
-    if n == 20:
-        return "스무"
-
-    tens = n // 10
-    ones = n % 10
-
-    # 1~9
-    if tens == 0:
-        native = _NATIVE_ONES.get(ones, read_sino_kor(n))
-        return native
-
-    # 10, 20, 30, ... 90 (딱 떨어지는 경우)
-    if ones == 0:
-        tens_str = _NATIVE_TENS.get(tens, read_sino_kor(n))
-        return tens_str
-
-    # 11~19, 21~99 (둘 다 있는 경우)
-    tens_str = _NATIVE_TENS.get(tens, "")
-    ones_str = _NATIVE_ONES.get(ones, "")
-
-    if tens_str and ones_str:
-        return tens_str + ones_str
-
-    # 혹시 매핑밖이면 그냥 한자어 숫자 + 단위
-    return read_sino_kor(n)
+    return numerals.native(n)
 
 
 def read_counter_kor(n: int, nxt: str) -> str:
@@ -94,9 +27,7 @@ def read_counter_kor(n: int, nxt: str) -> str:
 
 
 def read_only_num(n):
-    nums = '영일이삼사오육칠팔구'
-    read = [nums[int(z)] for z in str(n)]
-    return ''.join(read)
+    return numerals.digits(n)
 
 
 def read_num_eng(n: int) -> str:
@@ -148,10 +79,12 @@ def read_count_sym_kor(symbol: str) -> str:
     return count_sym_kor[count_symbols.index(symbol)]
 
 
-def load_base_eng2kor_dict() -> dict[str, str]:
+def load_base_eng2kor_dict(strict: bool = False) -> dict[str, str]:
     json_path = Path(__file__).parent / 'dataset' / 'base_eng2kor_dict.json'
     
     if not json_path.exists():
+        if strict:
+            raise FileNotFoundError(json_path)
         print(f"경고: {json_path} 파일을 찾을 수 없습니다.")
         return {}
     
@@ -160,16 +93,26 @@ def load_base_eng2kor_dict() -> dict[str, str]:
             data_dict = json.load(f)
         return data_dict
     except Exception as e:
+        if strict:
+            raise
         print(f"경고: {json_path} 파일 읽기 실패: {e}")
         return {}
 
 
+# 단위 기호 사전 (km → 킬로미터 등, 단어 사전과 따로 조회할 때 제외)
+SIGN2KOR_DICT_NAME = 'sign2kor_dict.json'
+
+
 # --- 예외 처리용 user dictionary load 
 # base_eng2kor_dict.json을 제외한 dataset 폴더의 모든 .json 파일을 로드
-def load_user_eng2kor_dict() -> dict[str, str]:
+# strict=True면 읽기 실패 시 건너뛰지 않고 예외를 그대로 올림 (hot-reload에서 사용)
+# exclude: 함께 제외할 파일 이름
+def load_user_eng2kor_dict(strict: bool = False, exclude: tuple[str, ...] = ()) -> dict[str, str]:
     dataset_dir = Path(__file__).parent / 'dataset'
     
     if not dataset_dir.exists():
+        if strict:
+            raise FileNotFoundError(dataset_dir)
         print(f"경고: {dataset_dir} 디렉토리를 찾을 수 없습니다.")
         return {}
     
@@ -180,7 +123,7 @@ def load_user_eng2kor_dict() -> dict[str, str]:
     
     for json_path in json_files:
         # base_eng2kor_dict.json은 제외
-        if json_path.name == 'base_eng2kor_dict.json':
+        if json_path.name == 'base_eng2kor_dict.json' or json_path.name in exclude:
             continue
         
         try:
@@ -188,18 +131,65 @@ def load_user_eng2kor_dict() -> dict[str, str]:
                 data_dict = json.load(f)
                 merged_dict.update(data_dict)
         except Exception as e:
+            if strict:
+                raise
             print(f"경고: {json_path} 파일 읽기 실패: {e}")
             continue
     
     return merged_dict
 
 
-def load_eng2kor_dict() -> dict[str, str]:
-    base_dict = load_base_eng2kor_dict()
-    user_dict = load_user_eng2kor_dict()
+def load_eng2kor_dict(strict: bool = False) -> dict[str, str]:
+    base_dict = load_base_eng2kor_dict(strict)
+    user_dict = load_user_eng2kor_dict(strict)
 
     base_dict.update(user_dict)
     return base_dict
+
+
+def load_sign2kor_dict(strict: bool = False) -> dict[str, str]:
+    json_path = Path(__file__).parent / 'dataset' / SIGN2KOR_DICT_NAME
+    if not json_path.exists():
+        return {}
+    try:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        if strict:
+            raise
+        print(f"경고: {json_path} 파일 읽기 실패: {e}")
+        return {}
+
+
+def load_eng2kor_dicts(strict: bool = False) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    (전체 영한 사전, 단위 기호 사전을 뺀 단어 사전)을 파일을 한 번씩만 읽어 만듭니다.
+    단어 사전은 합성어 파트 조회에 사용 (kmart → km + art에서 km을 킬로미터로 읽지 않도록)
+    """
+    word_dict = load_base_eng2kor_dict(strict)
+    word_dict.update(load_user_eng2kor_dict(strict, exclude=(SIGN2KOR_DICT_NAME,)))
+    merged_dict = dict(word_dict)
+    merged_dict.update(load_sign2kor_dict(strict))
+    return merged_dict, word_dict
+
+
+def get_dataset_signature() -> tuple:
+    """
+    dataset 폴더 .json 파일들의 (이름, 수정 시각, 크기) 목록.
+    값이 바뀌면 사전 파일이 추가/수정/삭제된 것으로 판단합니다.
+    """
+    dataset_dir = Path(__file__).parent / 'dataset'
+    if not dataset_dir.exists():
+        return ()
+
+    signature = []
+    for json_path in sorted(dataset_dir.glob('*.json')):
+        try:
+            stat = json_path.stat()
+        except OSError:
+            continue
+        signature.append((json_path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
     
 
 VOWELS = set("aeiou")
@@ -228,52 +218,112 @@ def read_acronym2kor(term: str) -> str:
     return ''.join(result)
 
 
-# 영한 음차 변환 파이프라인 (lazy initialization)
-_transliterator_pipeline = None
+# 영어+숫자 혼합 토큰 (GPT4, B2B, mp3, H2O, Win10, K8s, 5G, 3D)
+_ALNUM_TOKEN_RE = re.compile(r'(?=[A-Za-z0-9]*[A-Za-z])(?=[A-Za-z0-9]*[0-9])[A-Za-z0-9]+')
+_ALNUM_RUN_RE = re.compile(r'[A-Za-z]+|[0-9]+')
+
+
+def check_alnum(term: str) -> bool:
+    return _ALNUM_TOKEN_RE.fullmatch(term) is not None
+
+
+def read_alnum2kor(term: str, lookup=None) -> str:
+    """
+    영어+숫자 혼합 토큰을 영어 덩어리/숫자 덩어리로 나눠 읽습니다. (모델 사용 안 함)
+    - 맨 앞 숫자: 한자어 (5G → 오지, 3D → 삼디)
+    - 그 외 한 자리 숫자: 영어식 (GPT4 → 지피티포, B2B → 비투비, A4 → 에이포)
+    - 그 외 두 자리 이상 숫자: 한자어 (S24 → 에스이십사, COVID19 → 씨오브이아이디십구, Win10 → 윈십)
+    - 한 글자 영어: 알파벳 읽기 (사전의 g → 그램 같은 단위 읽기를 피함)
+    - 두 글자 이상 영어: 사전(lookup)에 있으면 사전 읽기, 없으면 알파벳 읽기
+    """
+    parts = []
+    for i, run in enumerate(_ALNUM_RUN_RE.findall(term)):
+        if run.isdigit():
+            parts.append(read_num_eng(int(run)) if i > 0 and len(run) == 1 else read_sino_kor(int(run)))
+            continue
+        reading = lookup(run) if lookup is not None and len(run) > 1 else None
+        parts.append(reading if reading is not None else read_acronym2kor(run))
+    return ''.join(parts)
 
 
 def read_engbymodel(term: str) -> str:
     """
     영어 단어를 한글 음차로 변환합니다.
     ARPABET 파이프라인 사용: 영어 → G2P → ARPABET → ByT5 → 한글
+    이전에 변환한 단어는 영구 저장소에서 바로 반환합니다 (모델 로드도 하지 않음).
     """
-    global _transliterator_pipeline
-    
-    # 파이프라인이 없으면 로드 (lazy initialization)
-    if _transliterator_pipeline is None:
-        try:
-            from inference_arpabet_pipeline import Eng2KorTransliteratorPipeline
-            from pathlib import Path
-            
-            # 모델 경로 설정 (readutils.py 기준 상대 경로)
-            model_path = Path(__file__).parent / "train" / "models" / "byt5-arpabet2kor"
-            
-            if not model_path.exists():
-                print(f"경고: 모델을 찾을 수 없습니다: {model_path}")
-                return term
-            
-            print(f"영한 음차 변환 파이프라인 로딩 중...")
-            _transliterator_pipeline = Eng2KorTransliteratorPipeline(
-                model_path=str(model_path),
-                use_compound_split=True
-            )
-            
-        except ImportError as e:
-            print(f"경고: 필요한 라이브러리가 설치되어 있지 않습니다: {e}")
-            print("      설치: pip install transformers torch g2p-en wordninja")
-            return term
-        except Exception as e:
-            print(f"경고: 파이프라인 로딩 실패: {e}")
-            return term
+    # 파이프라인은 resources에서 지연 로딩 (순환 import 방지를 위해 함수 안에서 import)
+    from resources import get_transliterator_pipeline, get_transliteration_store
+    from resources import get_transliteration_params, TRANSLITERATION_KWARGS
+
+    store = get_transliteration_store()
+    # 저장소가 꺼져 있으면 키를 만들지 않음 (런타임 프로파일 확인에 torch import가 필요)
+    params = get_transliteration_params() if store is not None else None
+    if store is not None:
+        cached = store.get(term, params)
+        if cached is not None:
+            return cached
+
+    pipeline = get_transliterator_pipeline()
+    if pipeline is None:
+        return term
     
     # 변환 수행
     try:
-        result = _transliterator_pipeline.transliterate(term)
-        return result if result else term
+        result = pipeline.transliterate(term, **TRANSLITERATION_KWARGS)
     except Exception as e:
         print(f"경고: 변환 실패 ({term}): {e}")
         return term
 
+    if not result:
+        return term
+    if store is not None:
+        store.put(term, result, params)
+    return result
+
+
+def read_engbymodel_batch(terms: list[str]) -> list[str]:
+    """
+    read_engbymodel의 일괄 버전. 저장소에 없는 단어만 모아 한 번에 변환합니다.
+    변환에 실패한 단어는 원문 그대로 반환합니다.
+    """
+    from resources import get_transliterator_pipeline, get_transliteration_store
+    from resources import get_transliteration_params, TRANSLITERATION_KWARGS
+
+    store = get_transliteration_store()
+    params = get_transliteration_params() if store is not None else None
+    results = store.get_many(terms, params) if store is not None else {}
+
+    # 저장소 키는 소문자 단어이므로 조회/중복 제거도 소문자로
+    missing = [key for key in dict.fromkeys(term.lower() for term in terms) if key not in results]
+    if missing:
+        pipeline = get_transliterator_pipeline()
+        if pipeline is None:
+            return [results.get(term.lower(), term) for term in terms]
+
+        try:
+            outputs = pipeline.transliterate_batch(missing, **TRANSLITERATION_KWARGS)
+        except Exception as e:
+            print(f"경고: 일괄 변환 실패 ({len(missing)}개), 단어별로 다시 시도합니다: {e}")
+            outputs = [read_engbymodel(term) for term in missing]
+
+        for key, result in zip(missing, outputs):
+            if not result or result == key:
+                continue
+            results[key] = result
+            if store is not None:
+                store.put(key, result, params)
+
+    return [results.get(term.lower(), term) for term in terms]
+
+
+# 줄임말 패턴: 단어 경계 사이의 줄임말 (대소문자 구분)
+# 영어 알파벳과 '로 구성된 줄임말을 찾음 (호출마다 패턴 문자열을 만들지 않도록 미리 컴파일)
+_CONTRACTION_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(cont) for cont in ENGLISH_CONTRACTIONS.keys()) + r')\b',
+    flags=re.IGNORECASE
+)
+
 
 # --- Prior to morphological analysis, pre-correction of exception cases
 def correction_exception(text: str) -> str:
@@ -344,9 +394,6 @@ def correction_exception(text: str) -> str:
         contraction_protected = contraction.replace("'", "_")
         return contraction_protected
     
-    # 줄임말 패턴: 단어 경계 사이의 줄임말 (대소문자 구분)
-    # 영어 알파벳과 '로 구성된 줄임말을 찾음
-    contraction_pattern = r'\b(' + '|'.join(re.escape(cont) for cont in ENGLISH_CONTRACTIONS.keys()) + r')\b'
-    result = re.sub(contraction_pattern, replace_contraction, result, flags=re.IGNORECASE)
+    result = _CONTRACTION_RE.sub(replace_contraction, result)
     
     return result
\ No newline at end of file
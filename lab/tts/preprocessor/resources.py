@@ -0,0 +1,444 @@
+"""
+normalizer가 사용하는 무거운 리소스를 한 곳에서 지연 로딩(lazy initialization)하는 모듈
+
+- 영한 사전 (ENG2KOR_DICT, hot-reload 지원)
+- 형태소 분석기 (Mecab, build_mecab_userdic.py로 만든 사용자 사전이 있으면 함께 사용)
+- 영한 음차 변환 파이프라인 (ByT5)
+- 음차 변환 결과 영구 저장소 (SQLite)
+
+import 시점에는 아무것도 로드하지 않고, 처음 사용할 때 로드합니다.
+서비스 시작 시 warmup()을 백그라운드 스레드로 돌려두면 첫 요청에서 멈추지 않습니다.
+
+사용 예:
+    import resources
+    resources.warmup(background=True)
+    ...
+    if resources.is_ready():
+        ...
+"""
+import os
+import threading
+from pathlib import Path
+from typing import Callable
+from readutils import load_eng2kor_dicts, get_dataset_signature
+from dict_index import Eng2KorIndex
+from translit_store import TransliterationStore, model_fingerprint, format_params
+
+
+# --- 영한 사전 ---
+# 읽는 쪽은 락 없이 _eng2kor_dict 참조만 잡아서 사용하고,
+# reload는 새 색인(Eng2KorIndex)을 완전히 만든 뒤 참조를 한 번에 교체한다.
+_eng2kor_dict = None
+_dict_lock = threading.Lock()
+_dict_reload_callbacks: list[Callable[[], None]] = []
+_dict_watcher = None
+
+# --- 형태소 분석기 ---
+_mecab_instance = None
+_mecab_lock = threading.Lock()
+
+# --- 음차 변환 파이프라인 ---
+_transliterator_pipeline = None
+_transliterator_failed = False
+_transliterator_lock = threading.Lock()
+
+# --- 음차 변환 결과 저장소 ---
+_transliteration_store = None
+_store_failed = False
+_store_lock = threading.Lock()
+
+# --- warmup 상태 ---
+_ready = threading.Event()
+_warmup_thread = None
+# warmup 중 발생한 예외 (실패해도 _ready는 set해서 기다리는 쪽이 멈추지 않게 함)
+_warmup_error = None
+
+MECAB_USER_DIC_PATH = Path(__file__).parent / "mecab_userdic" / "user.dic"
+# 모델 실행 백엔드: torch, onnx, onnx-int8 (GPU가 없는 서버는 onnx-int8 권장, onnx_backend 참고)
+# student: ByT5 대신 증류한 소형 모델 사용 (train/distill_student.py로 학습)
+TRANSLITERATOR_BACKEND = os.environ.get("TRANSLITERATOR_BACKEND", "torch")
+TRANSLITERATOR_MODEL_PATH = Path(__file__).parent / "train" / "models" / (
+    "student-arpabet2kor" if TRANSLITERATOR_BACKEND == "student" else "byt5-arpabet2kor"
+)
+# 신뢰도 기반 단계적 디코딩: 설정하면 greedy 먼저, 신뢰도가 낮은 단어만 beam search
+# (draft 모델이 있으면 greedy 단계에 사용, inference_arpabet_pipeline 참고)
+TRANSLITERATOR_CONFIDENCE_THRESHOLD = (
+    float(os.environ["TRANSLITERATOR_CONFIDENCE_THRESHOLD"])
+    if os.environ.get("TRANSLITERATOR_CONFIDENCE_THRESHOLD") else None
+)
+TRANSLITERATOR_DRAFT_MODEL_PATH = Path(__file__).parent / "train" / "models" / "byt5-small-arpabet2kor"
+# speculative decoding: draft 모델이 제안, 본 모델이 검증 (결과는 본 모델 greedy와 같음, speculative 참고)
+# (draft 모델이 없으면 사용하지 않음)
+TRANSLITERATOR_SPECULATIVE = (
+    os.environ.get("TRANSLITERATOR_SPECULATIVE", "") == "1" and TRANSLITERATOR_DRAFT_MODEL_PATH.exists()
+)
+# CPU 런타임 프로파일 (None이면 runtime_profile.resolve_profile의 기본 선택, shared_model.preload는 스레드 1개로 고정)
+TRANSLITERATOR_RUNTIME_PROFILE = None
+# 한글 음절 바이트 제약 디코딩 (hangul_constraint 참고)
+TRANSLITERATOR_HANGUL_CONSTRAINT = os.environ.get("TRANSLITERATOR_HANGUL_CONSTRAINT", "") == "1"
+# read_engbymodel에서 사용하는 생성 파라미터 (저장소 키에도 포함됨)
+TRANSLITERATION_KWARGS = {"num_beams": 4, "max_length": 64}
+TRANSLITERATION_STORE_PATH = Path(__file__).parent / "cache" / "transliterations.sqlite3"
+TRANSLITERATION_STORE_MAX_ENTRIES = 200_000
+
+
+def get_eng2kor_dict() -> Eng2KorIndex:
+    """
+    현재 영한 사전 snapshot을 반환합니다. 처음 호출 시 로드합니다.
+    대소문자 규칙에 따라 조회하는 읽기 전용 Mapping (dict_index 참고)
+    """
+    global _eng2kor_dict
+    eng2kor_dict = _eng2kor_dict
+    if eng2kor_dict is not None:
+        return eng2kor_dict
+
+    with _dict_lock:
+        if _eng2kor_dict is None:
+            _eng2kor_dict = Eng2KorIndex(*load_eng2kor_dicts())
+        return _eng2kor_dict
+
+
+def register_dict_reload_callback(callback: Callable[[], None]):
+    """사전이 교체될 때 호출될 콜백(의존 캐시 무효화 등)을 등록합니다."""
+    _dict_reload_callbacks.append(callback)
+
+
+def reload_eng2kor_dict() -> bool:
+    """
+    dataset 폴더의 사전들을 다시 읽어 영한 사전을 교체합니다.
+    읽기 도중 실패하면(저장 중인 파일 등) 기존 사전을 그대로 유지합니다.
+
+    Returns:
+        교체 성공 여부
+    """
+    global _eng2kor_dict
+
+    with _dict_lock:
+        try:
+            new_dict = Eng2KorIndex(*load_eng2kor_dicts(strict=True))
+        except Exception as e:
+            print(f"경고: 사전 reload 실패, 기존 사전 유지: {e}")
+            return False
+
+        # 참조 교체는 원자적이므로 읽는 쪽은 이전 또는 새 사전 중 하나만 보게 됨
+        _eng2kor_dict = new_dict
+        for callback in list(_dict_reload_callbacks):
+            callback()
+    return True
+
+
+class DictWatcher(threading.Thread):
+    """dataset 폴더의 변경을 주기적으로 확인해서 사전을 reload하는 백그라운드 스레드"""
+    def __init__(self, interval: float = 2.0):
+        super().__init__(name="eng2kor-dict-watcher", daemon=True)
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._signature = get_dataset_signature()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            signature = get_dataset_signature()
+            if signature == self._signature:
+                continue
+            # 실패해도 signature는 갱신: 파일이 다시 수정될 때 재시도
+            self._signature = signature
+            if reload_eng2kor_dict():
+                print("사전 reload 완료")
+
+    def stop(self):
+        self._stop_event.set()
+
+
+def start_dict_watcher(interval: float = 2.0) -> DictWatcher:
+    """사전 변경 감시 스레드를 시작합니다. 이미 실행 중이면 기존 스레드를 반환합니다."""
+    global _dict_watcher
+    if _dict_watcher is None or not _dict_watcher.is_alive():
+        _dict_watcher = DictWatcher(interval)
+        _dict_watcher.start()
+    return _dict_watcher
+
+
+def stop_dict_watcher():
+    global _dict_watcher
+    if _dict_watcher is not None:
+        _dict_watcher.stop()
+        _dict_watcher = None
+
+
+class MecabWrapper:
+    """mecab_ko.Tagger를 konlpy.Mecab과 호환되도록 래핑하는 클래스"""
+    def __init__(self, user_dic: str | Path | None = None):
+        from mecab_ko import Tagger
+        self.tagger = Tagger(f'-u "{user_dic}"' if user_dic else '')
+
+    def pos(self, text):
+        """형태소 분석 결과를 (형태소, 품사) 튜플 리스트로 반환"""
+        result = self.tagger.parse(text)
+        pos_list = []
+        for line in result.strip().split('\n'):
+            if line == 'EOS':
+                break
+            if '\t' in line:
+                parts = line.split('\t')
+                if len(parts) >= 2:
+                    word = parts[0]
+                    features = parts[1].split(',')
+                    pos_tag = features[0] if features else 'UNKNOWN'
+                    pos_list.append((word, pos_tag))
+        return pos_list
+
+
+def get_mecab():
+    """Mecab 인스턴스를 가져오는 함수 (lazy initialization)"""
+    global _mecab_instance
+    if _mecab_instance is not None:
+        return _mecab_instance
+
+    with _mecab_lock:
+        if _mecab_instance is None:
+            try:
+                # 사용자 사전은 mecab_ko로만 지정 가능
+                if MECAB_USER_DIC_PATH.exists():
+                    _mecab_instance = MecabWrapper(MECAB_USER_DIC_PATH)
+                    return _mecab_instance
+                # 먼저 konlpy를 시도
+                try:
+                    from konlpy.tag import Mecab
+                    _mecab_instance = Mecab()
+                except:
+                    # konlpy가 실패하면 mecab_ko 직접 사용
+                    _mecab_instance = MecabWrapper()
+            except Exception as e:
+                raise RuntimeError(
+                    f"Mecab 초기화 실패: {e}\n"
+                    "mecab-ko-dic이 설치되어 있는지 확인하세요."
+                )
+    return _mecab_instance
+
+
+def get_transliterator_pipeline():
+    """
+    영한 음차 변환 파이프라인을 가져옵니다 (lazy initialization).
+    로드에 실패하면 None을 반환하고, 이후 호출에서는 다시 시도하지 않습니다.
+    """
+    global _transliterator_pipeline, _transliterator_failed
+    if _transliterator_pipeline is not None or _transliterator_failed:
+        return _transliterator_pipeline
+
+    with _transliterator_lock:
+        if _transliterator_pipeline is not None or _transliterator_failed:
+            return _transliterator_pipeline
+
+        try:
+            from inference_arpabet_pipeline import Eng2KorTransliteratorPipeline
+
+            if not TRANSLITERATOR_MODEL_PATH.exists():
+                print(f"경고: 모델을 찾을 수 없습니다: {TRANSLITERATOR_MODEL_PATH}")
+                _transliterator_failed = True
+                return None
+
+            print(f"영한 음차 변환 파이프라인 로딩 중...")
+            _transliterator_pipeline = Eng2KorTransliteratorPipeline(
+                model_path=str(TRANSLITERATOR_MODEL_PATH),
+                use_compound_split=True,
+                backend=TRANSLITERATOR_BACKEND,
+                confidence_threshold=TRANSLITERATOR_CONFIDENCE_THRESHOLD,
+                draft_model_path=(
+                    str(TRANSLITERATOR_DRAFT_MODEL_PATH)
+                    if (TRANSLITERATOR_CONFIDENCE_THRESHOLD is not None or TRANSLITERATOR_SPECULATIVE)
+                    and TRANSLITERATOR_DRAFT_MODEL_PATH.exists() else None
+                ),
+                speculative=TRANSLITERATOR_SPECULATIVE,
+                hangul_constraint=TRANSLITERATOR_HANGUL_CONSTRAINT,
+                runtime_profile=TRANSLITERATOR_RUNTIME_PROFILE,
+                # 합성어 파트 중 단어 사전(단위 기호 제외)에 있는 것은 모델 없이 사전 표기 사용 (reload된 사전도 바로 반영)
+                dictionary_lookup=lambda term: get_eng2kor_dict().lookup_word(term)
+            )
+
+        except ImportError as e:
+            print(f"경고: 필요한 라이브러리가 설치되어 있지 않습니다: {e}")
+            print("      설치: pip install transformers torch g2p-en wordninja")
+            _transliterator_failed = True
+        except Exception as e:
+            print(f"경고: 파이프라인 로딩 실패: {e}")
+            _transliterator_failed = True
+
+    return _transliterator_pipeline
+
+
+def get_transliteration_store():
+    """
+    음차 변환 결과 저장소를 가져옵니다 (lazy initialization).
+    모델이 없거나 열기에 실패하면 None을 반환합니다.
+    """
+    global _transliteration_store, _store_failed
+    if _transliteration_store is not None or _store_failed:
+        return _transliteration_store
+
+    with _store_lock:
+        if _transliteration_store is not None or _store_failed:
+            return _transliteration_store
+
+        if not TRANSLITERATOR_MODEL_PATH.exists():
+            _store_failed = True
+            return None
+
+        try:
+            _transliteration_store = TransliterationStore(
+                TRANSLITERATION_STORE_PATH,
+                model_id=model_fingerprint(TRANSLITERATOR_MODEL_PATH),
+                max_entries=TRANSLITERATION_STORE_MAX_ENTRIES,
+            )
+        except Exception as e:
+            print(f"경고: 음차 변환 저장소 열기 실패: {e}")
+            _store_failed = True
+
+    return _transliteration_store
+
+
+def disable_transliterator():
+    """
+    모델 fallback과 결과 저장소를 끕니다. 이후 read_engbymodel은 입력을 그대로 반환합니다.
+    (golden corpus처럼 설치 환경과 무관한 결정적 출력이 필요할 때 사용)
+    """
+    global _transliterator_failed, _store_failed
+    with _transliterator_lock:
+        _transliterator_failed = True
+    with _store_lock:
+        _store_failed = True
+
+
+_runtime_profile_name = None
+
+
+def get_runtime_profile_name() -> str:
+    """
+    파이프라인이 사용할 런타임 프로파일 이름 (한 번만 확인, torch가 없으면 default)
+    cache/runtime_profile.json에서 조용히 선택될 수 있으므로 저장소 키에 포함합니다.
+    """
+    global _runtime_profile_name
+    if _runtime_profile_name is None:
+        try:
+            import runtime_profile as rp
+            _runtime_profile_name = rp.resolve_profile(TRANSLITERATOR_RUNTIME_PROFILE)["name"]
+        except ImportError:
+            _runtime_profile_name = "default"
+    return _runtime_profile_name
+
+
+def get_transliteration_params() -> str:
+    """저장소 키로 쓰는 생성 파라미터 문자열"""
+    params = dict(compound_split=True, compound_dict=True, **TRANSLITERATION_KWARGS)
+    # 양자화 모델은 결과가 조금 다를 수 있으므로 torch 외 백엔드는 키에 포함 (기존 저장 결과 유지)
+    if TRANSLITERATOR_BACKEND != "torch":
+        params["backend"] = TRANSLITERATOR_BACKEND
+    # int8/bf16 프로파일도 결과가 달라질 수 있음 (ONNX 백엔드에는 프로파일이 적용되지 않음)
+    if TRANSLITERATOR_BACKEND in ("torch", "student"):
+        profile_name = get_runtime_profile_name()
+        if profile_name != "default":
+            params["runtime_profile"] = profile_name
+    if TRANSLITERATOR_CONFIDENCE_THRESHOLD is not None:
+        params["confidence_threshold"] = TRANSLITERATOR_CONFIDENCE_THRESHOLD
+    # speculative decoding 결과는 beam search가 아닌 greedy
+    if TRANSLITERATOR_SPECULATIVE:
+        params["decoding"] = "speculative-greedy"
+    if TRANSLITERATOR_HANGUL_CONSTRAINT and TRANSLITERATOR_BACKEND != "student":
+        params["hangul_constraint"] = True
+    return format_params(**params)
+
+
+def warmup(background: bool = False, load_model: bool = True):
+    """
+    사전, Mecab, 음차 변환 모델을 미리 로드합니다.
+
+    Args:
+        background: True면 데몬 스레드에서 실행하고 스레드를 바로 반환
+        load_model: 음차 변환 모델까지 로드할지 여부
+
+    Returns:
+        background=True면 warmup 스레드, 아니면 None
+
+    로드에 실패해도 준비 대기는 끝내고, 예외를 기록해서 wait_until_ready에서 다시 던집니다.
+    """
+    global _warmup_thread, _warmup_error
+
+    if background:
+        if _warmup_thread is None or not _warmup_thread.is_alive():
+            _warmup_thread = threading.Thread(
+                target=_warmup_in_background,
+                args=(load_model,),
+                name="normalizer-warmup",
+                daemon=True,
+            )
+            _warmup_thread.start()
+        return _warmup_thread
+
+    # 이전 warmup이 실패했으면 다시 시도
+    if _warmup_error is not None:
+        _warmup_error = None
+        _ready.clear()
+
+    try:
+        get_eng2kor_dict()
+        get_transliteration_store()
+
+        # Mecab은 첫 분석에서 사전을 메모리에 올리므로 한 번 돌려둠
+        get_mecab().pos("준비 중입니다")
+
+        if load_model:
+            pipeline = get_transliterator_pipeline()
+            if pipeline is not None:
+                pipeline.transliterate("warmup")
+    except Exception as e:
+        _warmup_error = e
+        raise
+    finally:
+        _ready.set()
+    return None
+
+
+def _warmup_in_background(load_model: bool):
+    try:
+        warmup(load_model=load_model)
+    except Exception as e:
+        # 예외는 _warmup_error에 기록되어 wait_until_ready에서 다시 던짐
+        print(f"경고: warmup 실패: {e}")
+
+
+def is_ready() -> bool:
+    """warmup이 성공적으로 끝났는지 여부"""
+    return _ready.is_set() and _warmup_error is None
+
+
+def wait_until_ready(timeout: float | None = None) -> bool:
+    """
+    warmup이 끝날 때까지 대기합니다. timeout 안에 끝났는지 반환합니다.
+    warmup이 실패했으면 RuntimeError를 던집니다.
+    """
+    finished = _ready.wait(timeout)
+    if finished and _warmup_error is not None:
+        raise RuntimeError(f"warmup 실패: {_warmup_error}") from _warmup_error
+    return finished
+
+
+def _reset_after_fork():
+    """
+    fork된 자식 프로세스에서 부모의 스레드/연결에 묶인 상태를 버립니다.
+    (저장소 writer 스레드, SQLite 연결, 사전 감시 스레드는 자식에 없음)
+    사전/Mecab/모델은 부모가 로드한 것을 그대로 공유합니다. (shared_model 참고)
+    """
+    global _transliteration_store, _store_lock, _dict_watcher
+    global _dict_lock, _mecab_lock, _transliterator_lock, _warmup_thread
+    # 연결만 버리고 다음 호출에서 자식이 새로 엶 (disable_transliterator로 꺼진 저장소는 그대로 꺼 둠)
+    _transliteration_store = None
+    _dict_watcher = None
+    _warmup_thread = None
+    # fork 시점에 다른 스레드가 잡고 있던 락은 자식에서 영원히 풀리지 않으므로 새로 만듦
+    _store_lock = threading.Lock()
+    _dict_lock = threading.Lock()
+    _mecab_lock = threading.Lock()
+    _transliterator_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,183 @@
+"""
+CPU 추론 런타임 프로파일 (torch 백엔드)
+
+음차 변환 모델은 기본적으로 fp32 eager 모드, torch가 정한 스레드 수로 실행됩니다.
+런타임 프로파일은 모델 로드 직후 다음을 적용합니다.
+
+    threads  : intra-op 스레드 수 (None이면 torch 기본값), inter-op 스레드 수
+    bf16     : bfloat16 autocast (CPU가 bf16을 지원할 때만, 아니면 무시)
+    quantize : Linear 레이어 동적 int8 양자화 (quantize_dynamic)
+    compile  : 인코더 torch.compile
+
+추론은 torch.no_grad 대신 torch.inference_mode로 실행하고,
+로드 직후 대표적인 입력 길이/배치 크기로 warmup generate를 돌려 첫 요청의 지연을 없앱니다.
+
+default 외 프로파일은 출력이 fp32와 조금 다를 수 있으므로 결과 저장소 키에 프로파일 이름이 들어갑니다.
+특히 int8은 동적 양자화가 배치마다 활성값 scale을 정하므로 같은 단어도 배치 구성에 따라 결과가 달라질 수 있어,
+단어별 변환과 배치 변환의 결과가 같다는 보장(transliterate_batch 참고)이 깨집니다.
+
+호스트에 가장 빠른 프로파일은 bench_runtime_profile.py로 고르고 cache/runtime_profile.json에 저장합니다.
+runtime_profile=None이면 저장된 선택(같은 호스트일 때만)을, 없으면 "default"를 사용합니다.
+환경 변수 TRANSLITERATOR_RUNTIME_PROFILE로 이름을 지정할 수도 있습니다.
+
+사용 예:
+    pipeline = Eng2KorTransliteratorPipeline(runtime_profile="int8")
+"""
+import contextlib
+import json
+import os
+import platform
+from functools import lru_cache
+from pathlib import Path
+import torch
+
+
+PROFILE_PATH = Path(__file__).parent / "cache" / "runtime_profile.json"
+
+PROFILES = {
+    # 기존 동작 (fp32 eager, torch 기본 스레드)
+    "default": {},
+    "threads": {"threads": "auto"},
+    "bf16": {"threads": "auto", "bf16": True},
+    # int8: 배치 구성에 따라 결과가 달라질 수 있음 (단어별/배치 결과 불일치 가능)
+    "int8": {"threads": "auto", "quantize": True},
+    "compile": {"threads": "auto", "compile": True},
+    "int8-compile": {"threads": "auto", "quantize": True, "compile": True},
+}
+
+# warmup에 쓰는 배치 크기 (batch 1 요청, 배치 요청)
+WARMUP_BATCH_SIZES = (1, 8)
+
+
+def available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def host_signature() -> dict:
+    """저장된 프로파일이 같은 호스트/환경에서 고른 것인지 확인하는 데 사용"""
+    return {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": available_cpus(),
+        "torch": torch.__version__,
+    }
+
+
+@lru_cache(maxsize=None)
+def supports_bf16() -> bool:
+    """CPU에 bf16 연산 명령(AVX512-BF16 / AMX)이 있는지"""
+    try:
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except (AttributeError, RuntimeError):
+        pass
+    try:
+        with open("/proc/cpuinfo", 'r') as f:
+            flags = f.read()
+        return "avx512_bf16" in flags or "amx_bf16" in flags
+    except OSError:
+        return False
+
+
+def resolve_profile(runtime_profile=None) -> dict:
+    """
+    프로파일 이름/dict/None을 옵션 dict로 바꿉니다. ("name" 키 포함)
+    """
+    if isinstance(runtime_profile, dict):
+        return {"name": "custom", **runtime_profile}
+    name = runtime_profile or os.environ.get("TRANSLITERATOR_RUNTIME_PROFILE") or load_profile()
+    if name not in PROFILES:
+        print(f"경고: 알 수 없는 런타임 프로파일 {name}, default를 사용합니다. (가능: {', '.join(PROFILES)})")
+        name = "default"
+    return {"name": name, **PROFILES[name]}
+
+
+def load_profile() -> str:
+    """저장된 프로파일 이름 (다른 호스트에서 고른 것이면 default)"""
+    if not PROFILE_PATH.exists():
+        return "default"
+    try:
+        with open(PROFILE_PATH, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"경고: 런타임 프로파일 파일을 읽을 수 없습니다 ({e})")
+        return "default"
+    if saved.get("host") != host_signature():
+        return "default"
+    return saved.get("profile", "default")
+
+
+def save_profile(name: str, results: dict = None):
+    PROFILE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(PROFILE_PATH, 'w', encoding='utf-8') as f:
+        json.dump({"profile": name, "host": host_signature(), "results": results or {}},
+                  f, ensure_ascii=False, indent=2)
+
+
+def apply_threads(profile: dict):
+    threads = profile.get("threads")
+    if threads is None:
+        return
+    intra = available_cpus() if threads == "auto" else int(threads)
+    torch.set_num_threads(intra)
+    try:
+        # 병렬 작업이 한 번이라도 실행된 뒤에는 바꿀 수 없음
+        torch.set_num_interop_threads(profile.get("interop_threads", 1))
+    except RuntimeError:
+        pass
+
+
+def apply_profile(model, profile: dict):
+    """
+    torch 모델에 프로파일을 적용한 모델을 반환합니다. (CPU 전용, 다른 백엔드 모델은 그대로 반환)
+    """
+    if not isinstance(model, torch.nn.Module) or next(model.parameters()).device.type != "cpu":
+        return model
+
+    apply_threads(profile)
+
+    if profile.get("bf16") and not use_bf16(profile):
+        print("경고: 이 CPU는 bf16을 지원하지 않거나 양자화와 함께 사용할 수 없어 bf16 옵션을 무시합니다.")
+
+    if profile.get("quantize"):
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    if profile.get("compile"):
+        if hasattr(torch, "compile"):
+            # 입력 길이가 매번 달라지므로 dynamic shape으로 컴파일
+            model.encoder = torch.compile(model.encoder, dynamic=True)
+        else:
+            print("경고: torch.compile을 지원하지 않는 torch 버전입니다. compile 옵션을 무시합니다.")
+
+    return model
+
+
+def use_bf16(profile: dict) -> bool:
+    # 양자화된 Linear는 bf16 입력을 받지 않음
+    return bool(profile.get("bf16")) and not profile.get("quantize") and supports_bf16()
+
+
+def inference_context(profile: dict):
+    """generate를 감쌀 context (inference_mode + 필요하면 bf16 autocast)"""
+    stack = contextlib.ExitStack()
+    stack.enter_context(torch.inference_mode())
+    if use_bf16(profile):
+        stack.enter_context(torch.autocast("cpu", dtype=torch.bfloat16))
+    return stack
+
+
+def warmup(generate_batch, samples: list[str], batch_sizes: tuple = None):
+    """
+    대표 입력(짧은 것 ~ 긴 것)으로 generate_batch를 미리 실행합니다.
+    (oneDNN 커널 선택, torch.compile 그래프 생성이 첫 요청에서 일어나지 않도록)
+    batch_sizes가 None이면 samples 전체를 한 배치로 한 번만 실행합니다.
+    """
+    if batch_sizes is None:
+        generate_batch(samples)
+        return
+    samples = sorted(samples, key=len)
+    for batch_size in batch_sizes:
+        for batch in (samples[:batch_size], samples[-batch_size:]):
+            generate_batch(batch)
@@ -0,0 +1,112 @@
+"""
+여러 워커 프로세스가 음차 변환 모델 하나를 공유하는 로딩 방식 (fork 전 로드)
+
+normalizer 워커마다 ByT5 가중치를 따로 로드하면 워커 8~16개에서 같은 가중치가 수 GB씩 중복됩니다.
+부모 프로세스에서 preload()로 한 번만 로드한 뒤 fork하면 자식은 같은 물리 페이지를 읽기 전용으로 참조합니다.
+
+    - 가중치 텐서는 share_memory_()로 공유 메모리에 두고 requires_grad=False,
+      추론은 inference_mode로만 하므로 어느 프로세스도 가중치를 쓰지 않음 (copy-on-write 복사 없음)
+    - 사전, Mecab, G2P 표도 부모에서 로드해서 함께 공유
+    - gc.freeze()로 부모가 만든 객체를 GC 대상에서 빼서, 자식의 GC가 객체 헤더(참조 횟수/GC 링크)를
+      건드려 페이지가 복사되는 것을 줄임
+    - 저장소(SQLite)/사전 감시 스레드는 자식에서 새로 만듦 (resources._reset_after_fork)
+
+torch / student 백엔드 전용입니다. ONNX Runtime 세션은 fork 후 자식에서 안전하게 쓸 수 없으므로
+ONNX 백엔드는 워커마다 따로 로드해야 합니다.
+
+워커별 메모리(RSS/PSS/USS) 비교와 동시 사용 시 결과 확인은 measure_shared_model.py 참고.
+
+사용 예:
+    import shared_model
+    shared_model.preload()
+    with shared_model.create_pool(8) as pool:
+        results = pool.map(normalize, sentences)
+"""
+import gc
+import multiprocessing
+import resources
+from student_model import STUDENT_BACKEND
+
+
+def _torch_models(pipeline) -> list:
+    if pipeline.backend == STUDENT_BACKEND:
+        return [pipeline.model.model]
+    if pipeline.backend != "torch":
+        return []
+    return [model for model in (pipeline.model, pipeline.draft_model) if model is not None]
+
+
+def share_model_memory(model):
+    """가중치를 읽기 전용 공유 메모리 텐서로 만듭니다."""
+    for parameter in model.parameters():
+        parameter.requires_grad_(False)
+    model.share_memory()
+    return model
+
+
+def preload(warmup: bool = True):
+    """
+    fork 전에 부모 프로세스에서 사전, Mecab, 음차 변환 모델을 로드하고 공유 준비를 합니다.
+
+    Returns:
+        음차 변환 파이프라인 (로드 실패 시 None)
+    """
+    import torch
+    import runtime_profile as rp
+
+    # GNU OpenMP는 fork 전에 병렬 구간을 실행한 프로세스의 자식에서 멈출 수 있으므로
+    # 부모에서는 스레드 1개로만 실행 (워커 스레드 수는 worker_init에서 설정)
+    # 파이프라인 생성 시 apply_profile이 스레드 수를 다시 정하므로 프로파일도 스레드 1개로 고정
+    torch.set_num_threads(1)
+    profile = rp.resolve_profile(resources.TRANSLITERATOR_RUNTIME_PROFILE)
+    resources.TRANSLITERATOR_RUNTIME_PROFILE = {**profile, "threads": 1}
+
+    if warmup:
+        resources.warmup(load_model=True)
+    pipeline = resources.get_transliterator_pipeline()
+    # preload 전에 이미 로드된 파이프라인이 스레드 수를 바꿨을 수 있음
+    torch.set_num_threads(1)
+
+    if pipeline is not None:
+        models = _torch_models(pipeline)
+        if not models:
+            print(f"경고: {pipeline.backend} 백엔드는 fork 후 공유할 수 없습니다. 워커마다 따로 로드하세요.")
+        for model in models:
+            share_model_memory(model)
+
+    # 지금까지 만든 객체는 자식의 GC가 건드리지 않도록 영구 세대로 이동
+    gc.collect()
+    gc.freeze()
+    return pipeline
+
+
+def worker_init(num_threads: int = 1):
+    """fork된 워커 프로세스 초기화"""
+    import torch
+    torch.set_num_threads(num_threads)
+
+
+def create_pool(processes: int, num_threads: int = 1):
+    """preload()한 상태를 공유하는 fork 워커 풀"""
+    context = multiprocessing.get_context("fork")
+    return context.Pool(processes, initializer=worker_init, initargs=(num_threads,))
+
+
+def memory_usage() -> dict:
+    """
+    현재 프로세스 메모리 (MB, Linux /proc/self/smaps_rollup)
+        rss: 상주 메모리 (공유 페이지 포함)
+        pss: 공유 페이지를 공유하는 프로세스 수로 나눈 값 (프로세스들의 합이 실제 사용량)
+        uss: 이 프로세스만 쓰는 페이지 (Private_Clean + Private_Dirty)
+    """
+    fields = {}
+    with open("/proc/self/smaps_rollup", 'r') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(':')] = int(parts[1])
+    return {
+        "rss": fields.get("Rss", 0) / 1024,
+        "pss": fields.get("Pss", 0) / 1024,
+        "uss": (fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)) / 1024,
+    }
@@ -0,0 +1,102 @@
+"""
+ByT5 speculative decoding (byt5-small 초안 → byt5-base 검증)
+
+작은 모델이 greedy로 토큰 k개를 먼저 제안하고, 큰 모델이 (prefix + 제안) 전체를 한 번의 forward로 검증합니다.
+큰 모델의 greedy 예측과 일치하는 앞부분까지 받아들이고, 처음 어긋난 위치에는 큰 모델의 예측을 씁니다.
+(전부 맞으면 다음 토큰 하나를 덤으로 얻음)
+받아들이는 토큰은 모두 큰 모델의 argmax이므로 결과는 큰 모델 greedy decoding과 같습니다.
+
+두 모델은 같은 ByT5 토크나이저(바이트 단위)를 쓰므로 토큰 id를 그대로 주고받습니다.
+음차 변환 출력은 짧아서(최대 64 토큰) KV cache 없이 매번 디코더 prefix 전체를 다시 계산합니다.
+인코더 출력은 모델별로 한 번만 계산합니다.
+
+logits_processor(예: hangul_constraint.HangulByteLogitsProcessor)를 주면 초안과 검증 logits 모두에
+위치별 prefix로 적용하므로, 결과는 같은 제약을 건 큰 모델 greedy decoding과 같습니다.
+
+사용 예:
+    pipeline = Eng2KorTransliteratorPipeline(
+        draft_model_path="./train/models/byt5-small-arpabet2kor", speculative=True
+    )
+"""
+from collections import Counter
+import torch
+
+
+NUM_DRAFT_TOKENS = 4
+
+
+def _next_token_logits(model, encoder_outputs, attention_mask, tokens: list[int]) -> torch.Tensor:
+    decoder_input_ids = torch.tensor([tokens], device=attention_mask.device)
+    return model(
+        encoder_outputs=encoder_outputs,
+        attention_mask=attention_mask,
+        decoder_input_ids=decoder_input_ids,
+        use_cache=False,
+    ).logits[0]
+
+
+def _process(logits_processor, tokens: list[int], logits: torch.Tensor) -> torch.Tensor:
+    """logits[i]에 prefix tokens[:len(tokens) - len(logits) + i + 1]로 logits_processor 적용"""
+    if logits_processor is None:
+        return logits
+    offset = len(tokens) - len(logits) + 1
+    rows = []
+    for i in range(len(logits)):
+        input_ids = torch.tensor([tokens[:offset + i]], device=logits.device)
+        rows.append(logits_processor(input_ids, logits[i:i + 1]))
+    return torch.cat(rows)
+
+
+def speculative_generate(
+    model,
+    draft_model,
+    input_ids: torch.Tensor,
+    attention_mask: torch.Tensor,
+    max_length: int = 64,
+    num_draft_tokens: int = NUM_DRAFT_TOKENS,
+    stats: Counter = None,
+    logits_processor=None
+) -> list[int]:
+    """
+    입력 하나(batch 1)를 speculative decoding으로 생성합니다.
+    logits_processor는 generate()의 logits_processor와 같은 (input_ids, scores) 호출 규약을 따릅니다.
+
+    Returns:
+        decoder start 토큰으로 시작하는 출력 토큰 id 리스트 (generate() 결과의 한 행과 같은 형식)
+    """
+    stats = stats if stats is not None else Counter()
+    eos_token_id = model.config.eos_token_id
+    tokens = [model.config.decoder_start_token_id]
+
+    encoder_outputs = model.get_encoder()(input_ids=input_ids, attention_mask=attention_mask)
+    draft_encoder_outputs = draft_model.get_encoder()(input_ids=input_ids, attention_mask=attention_mask)
+
+    while len(tokens) < max_length:
+        # 1. 초안: 작은 모델 greedy로 최대 k개 제안
+        proposal = []
+        for _ in range(min(num_draft_tokens, max_length - len(tokens))):
+            prefix = tokens + proposal
+            logits = _next_token_logits(draft_model, draft_encoder_outputs, attention_mask, prefix)
+            token = int(_process(logits_processor, prefix, logits[-1:])[0].argmax())
+            proposal.append(token)
+            if token == eos_token_id:
+                break
+        stats["draft_calls"] += len(proposal)
+
+        # 2. 검증: 큰 모델 한 번의 forward로 제안 위치 각각의 greedy 예측
+        logits = _next_token_logits(model, encoder_outputs, attention_mask, tokens + proposal)
+        predicted = _process(logits_processor, tokens + proposal, logits[len(tokens) - 1:]).argmax(dim=-1).tolist()
+        stats["target_calls"] += 1
+
+        accepted = 0
+        while accepted < len(proposal) and proposal[accepted] == predicted[accepted]:
+            accepted += 1
+        stats["proposed"] += len(proposal)
+        stats["accepted"] += accepted
+
+        # 3. 받아들인 제안 + 큰 모델의 다음 토큰
+        for token in proposal[:accepted] + [predicted[accepted]]:
+            tokens.append(token)
+            if token == eos_token_id or len(tokens) >= max_length:
+                return tokens
+    return tokens
@@ -0,0 +1,222 @@
+"""
+ByT5 교사 모델 출력으로 증류한 소형 ARPABET → 한글 음차 변환 모델 (student 백엔드)
+
+ByT5-base(580M)는 단어 단위 음차 변환에 비해 너무 무겁기 때문에,
+교사 모델이 변환한 결과로 수백만 파라미터의 seq2seq를 CPU에서 학습해 대신 사용합니다.
+학습은 train/distill_student.py, 교사와의 비교는 bench_student.py 참고.
+
+구조:
+    입력: ARPABET 음소 단위 토큰 ("S", "AY1", "[SEP]", ...)
+    출력: 한글 음절(문자) 단위 토큰
+    인코더: 양방향 GRU
+    디코더: GRU + dot-product attention (이전 context를 입력으로 다시 넣음)
+
+모델 폴더:
+    config.json : 모델 크기, 입력/출력 어휘
+    model.pt    : state_dict
+
+사용 예:
+    pipeline = Eng2KorTransliteratorPipeline("./train/models/student-arpabet2kor", backend="student")
+"""
+import json
+from pathlib import Path
+import torch
+from torch import nn
+from torch.nn.utils.rnn import pack_padded_sequence, pad_packed_sequence
+
+
+STUDENT_BACKEND = "student"
+CONFIG_FILE = "config.json"
+WEIGHTS_FILE = "model.pt"
+
+PAD, BOS, EOS, UNK = 0, 1, 2, 3
+SPECIAL_TOKENS = ["<pad>", "<s>", "</s>", "<unk>"]
+
+
+def tokenize_arpabet(arpabet: str) -> list[str]:
+    return arpabet.split()
+
+
+def tokenize_korean(text: str) -> list[str]:
+    return list(text)
+
+
+class Vocab:
+    """토큰 ↔ id (0~3은 특수 토큰)"""
+    def __init__(self, tokens: list[str]):
+        self.itos = SPECIAL_TOKENS + [token for token in tokens if token not in SPECIAL_TOKENS]
+        self.stoi = {token: i for i, token in enumerate(self.itos)}
+
+    @classmethod
+    def build(cls, sequences) -> "Vocab":
+        tokens = set()
+        for sequence in sequences:
+            tokens.update(sequence)
+        return cls(sorted(tokens))
+
+    def __len__(self):
+        return len(self.itos)
+
+    def encode(self, tokens: list[str]) -> list[int]:
+        return [self.stoi.get(token, UNK) for token in tokens] + [EOS]
+
+    def decode(self, ids: list[int]) -> list[str]:
+        tokens = []
+        for i in ids:
+            if i == EOS:
+                break
+            if i >= len(SPECIAL_TOKENS):
+                tokens.append(self.itos[i])
+        return tokens
+
+
+def pad_batch(sequences: list[list[int]], device: str = "cpu") -> tuple[torch.Tensor, torch.Tensor]:
+    """(ids, mask) 패딩 텐서"""
+    length = max(len(sequence) for sequence in sequences)
+    ids = torch.full((len(sequences), length), PAD, dtype=torch.long)
+    for i, sequence in enumerate(sequences):
+        ids[i, :len(sequence)] = torch.tensor(sequence, dtype=torch.long)
+    ids = ids.to(device)
+    return ids, ids != PAD
+
+
+class StudentSeq2Seq(nn.Module):
+    def __init__(self, src_vocab_size: int, tgt_vocab_size: int,
+                 emb_dim: int = 128, hidden_dim: int = 256, dropout: float = 0.1):
+        super().__init__()
+        self.src_embed = nn.Embedding(src_vocab_size, emb_dim, padding_idx=PAD)
+        self.encoder = nn.GRU(emb_dim, hidden_dim, batch_first=True, bidirectional=True)
+        self.bridge = nn.Linear(2 * hidden_dim, hidden_dim)
+        self.attn_key = nn.Linear(2 * hidden_dim, hidden_dim, bias=False)
+        self.tgt_embed = nn.Embedding(tgt_vocab_size, emb_dim, padding_idx=PAD)
+        self.decoder = nn.GRUCell(emb_dim + 2 * hidden_dim, hidden_dim)
+        self.out = nn.Linear(3 * hidden_dim, tgt_vocab_size)
+        self.dropout = nn.Dropout(dropout)
+
+    def encode(self, src: torch.Tensor, src_mask: torch.Tensor):
+        lengths = src_mask.sum(dim=1)
+        packed = pack_padded_sequence(
+            self.dropout(self.src_embed(src)), lengths.cpu(), batch_first=True, enforce_sorted=False
+        )
+        memory, _ = pad_packed_sequence(self.encoder(packed)[0], batch_first=True, total_length=src.size(1))
+        mean = (memory * src_mask.unsqueeze(2)).sum(dim=1) / lengths.unsqueeze(1)
+        hidden = torch.tanh(self.bridge(mean))
+        context = memory.new_zeros(memory.size(0), memory.size(2))
+        return memory, self.attn_key(memory), hidden, context
+
+    def step(self, prev_tokens, hidden, context, memory, keys, src_mask):
+        """디코더 한 스텝: (logits, hidden, context)"""
+        inputs = torch.cat([self.tgt_embed(prev_tokens), context], dim=1)
+        hidden = self.decoder(self.dropout(inputs), hidden)
+        scores = torch.bmm(keys, hidden.unsqueeze(2)).squeeze(2)
+        scores = scores.masked_fill(~src_mask, float("-inf"))
+        attention = torch.softmax(scores, dim=1)
+        context = torch.bmm(attention.unsqueeze(1), memory).squeeze(1)
+        logits = self.out(self.dropout(torch.cat([hidden, context], dim=1)))
+        return logits, hidden, context
+
+    def forward(self, src, src_mask, tgt_in):
+        """teacher forcing: tgt_in [B, T] (BOS로 시작) → logits [B, T, V]"""
+        memory, keys, hidden, context = self.encode(src, src_mask)
+        logits = []
+        for t in range(tgt_in.size(1)):
+            step_logits, hidden, context = self.step(tgt_in[:, t], hidden, context, memory, keys, src_mask)
+            logits.append(step_logits)
+        return torch.stack(logits, dim=1)
+
+    def greedy(self, src, src_mask, max_length: int) -> list[list[int]]:
+        memory, keys, hidden, context = self.encode(src, src_mask)
+        tokens = src.new_full((src.size(0),), BOS)
+        finished = torch.zeros(src.size(0), dtype=torch.bool, device=src.device)
+        outputs = []
+        for _ in range(max_length):
+            logits, hidden, context = self.step(tokens, hidden, context, memory, keys, src_mask)
+            tokens = logits.argmax(dim=1).masked_fill(finished, PAD)
+            outputs.append(tokens)
+            finished |= tokens == EOS
+            if finished.all():
+                break
+        return torch.stack(outputs, dim=1).tolist()
+
+    def beam_search(self, src, src_mask, num_beams: int, max_length: int) -> list[list[int]]:
+        batch_size = src.size(0)
+        memory, keys, hidden, context = self.encode(src, src_mask)
+        # [B * K, ...]로 펼침
+        expand = lambda x: x.repeat_interleave(num_beams, dim=0)
+        memory, keys, hidden, context, src_mask = map(expand, (memory, keys, hidden, context, src_mask))
+
+        scores = torch.full((batch_size, num_beams), float("-inf"), device=src.device)
+        scores[:, 0] = 0.0
+        tokens = src.new_full((batch_size * num_beams,), BOS)
+        finished = torch.zeros(batch_size * num_beams, dtype=torch.bool, device=src.device)
+        lengths = torch.zeros(batch_size * num_beams, device=src.device)
+        sequences = src.new_zeros((batch_size * num_beams, 0))
+        offsets = (torch.arange(batch_size, device=src.device) * num_beams).unsqueeze(1)
+
+        for _ in range(max_length):
+            logits, hidden, context = self.step(tokens, hidden, context, memory, keys, src_mask)
+            log_probs = torch.log_softmax(logits, dim=1)
+            # 끝난 beam은 점수를 유지하고 PAD만 이어 붙임
+            log_probs[finished] = float("-inf")
+            log_probs[finished, PAD] = 0.0
+
+            vocab_size = log_probs.size(1)
+            total = (scores.unsqueeze(2) + log_probs.view(batch_size, num_beams, vocab_size))
+            scores, flat = total.view(batch_size, -1).topk(num_beams, dim=1)
+            origin = (flat // vocab_size + offsets).view(-1)
+            tokens = (flat % vocab_size).view(-1)
+
+            hidden, context = hidden[origin], context[origin]
+            sequences = torch.cat([sequences[origin], tokens.unsqueeze(1)], dim=1)
+            lengths = lengths[origin] + (~finished[origin]).float()
+            finished = finished[origin] | (tokens == EOS)
+            if finished.all():
+                break
+
+        # 길이로 정규화한 점수가 가장 높은 beam
+        normalized = scores.view(-1) / lengths.clamp(min=1)
+        best = normalized.view(batch_size, num_beams).argmax(dim=1) + offsets.squeeze(1)
+        return sequences[best].tolist()
+
+
+class StudentTransliterator:
+    """증류 모델 추론 래퍼 (파이프라인 student 백엔드)"""
+    def __init__(self, model: StudentSeq2Seq, src_vocab: Vocab, tgt_vocab: Vocab, device: str = "cpu"):
+        self.model = model.to(device).eval()
+        self.src_vocab = src_vocab
+        self.tgt_vocab = tgt_vocab
+        self.device = device
+
+    def num_parameters(self) -> int:
+        return sum(p.numel() for p in self.model.parameters())
+
+    def transliterate_batch(self, arpabets: list[str], num_beams: int = 1, max_length: int = 64) -> list[str]:
+        src, src_mask = pad_batch(
+            [self.src_vocab.encode(tokenize_arpabet(arpabet)) for arpabet in arpabets], self.device
+        )
+        with torch.inference_mode():
+            if num_beams > 1:
+                outputs = self.model.beam_search(src, src_mask, num_beams, max_length)
+            else:
+                outputs = self.model.greedy(src, src_mask, max_length)
+        return [''.join(self.tgt_vocab.decode(ids)) for ids in outputs]
+
+
+def save_student(model: StudentSeq2Seq, src_vocab: Vocab, tgt_vocab: Vocab, config: dict, model_dir: str | Path):
+    model_dir = Path(model_dir)
+    model_dir.mkdir(parents=True, exist_ok=True)
+    with open(model_dir / CONFIG_FILE, 'w', encoding='utf-8') as f:
+        json.dump({**config, "src_vocab": src_vocab.itos, "tgt_vocab": tgt_vocab.itos},
+                  f, ensure_ascii=False, indent=2)
+    torch.save(model.state_dict(), model_dir / WEIGHTS_FILE)
+
+
+def load_student(model_dir: str | Path, device: str = "cpu") -> StudentTransliterator:
+    model_dir = Path(model_dir)
+    with open(model_dir / CONFIG_FILE, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    src_vocab = Vocab(config.pop("src_vocab"))
+    tgt_vocab = Vocab(config.pop("tgt_vocab"))
+    model = StudentSeq2Seq(len(src_vocab), len(tgt_vocab), **config)
+    model.load_state_dict(torch.load(model_dir / WEIGHTS_FILE, map_location=device))
+    return StudentTransliterator(model, src_vocab, tgt_vocab, device)
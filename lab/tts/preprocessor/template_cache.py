@@ -0,0 +1,135 @@
+"""
+숫자만 다른 문장("3개 남았습니다", "15개 남았습니다")을 위한 템플릿 단위 분석 캐시
+
+문장의 숫자 연속열을 마스킹한 문자열을 키로, trans_bundle 결과 중
+숫자가 아닌 토큰의 출력과 숫자 토큰의 위치/앞뒤 문맥(prev, nxt)을 저장합니다.
+캐시 hit이면 Mecab 분석과 trans_bundle을 건너뛰고 숫자 읽기(trans_num2kor)만 다시 계산합니다.
+숫자 바로 뒤의 조사("3은", "2는")는 숫자 읽기의 받침에 따라 달라지므로 함께 다시 계산합니다.
+"""
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+from lattice import TokenLattice
+
+
+Morph = tuple[str, str]
+
+_DIGIT_RUN = re.compile(r'\d+')
+# 원문에 나올 일이 없는 문자(Private Use Area)로 숫자 연속열을 마스킹
+_MASK = '\ue000'
+
+
+def mask_digits(sentence: str) -> str:
+    return _DIGIT_RUN.sub(_MASK, sentence)
+
+
+def digit_runs(sentence: str) -> list[str]:
+    return _DIGIT_RUN.findall(sentence)
+
+
+class Template:
+    """
+    trans_bundle 출력 골격 (TokenLattice 기준 평탄화된 토큰 index 사용)
+    outputs: 토큰별 출력 (숫자 자리는 None)
+    starts: 어절별 첫 토큰 index
+    slots: 숫자 자리의 (토큰 index, prev, nxt)
+    particles: 숫자 바로 뒤 조사 자리의 (숫자 자리 index, 토큰 index, 조사 원형)
+    """
+    __slots__ = ("outputs", "starts", "slots", "particles")
+
+    def __init__(self, outputs: list[Optional[str]], starts: list[int],
+                 slots: list[tuple[int, Optional[Morph], Optional[Morph]]],
+                 particles: Optional[list[tuple[int, int, str]]] = None):
+        self.outputs = outputs
+        self.starts = starts
+        self.slots = slots
+        self.particles = particles or []
+
+    def render(self, numbers: list[str],
+               read_number: Callable[[int, Optional[Morph], Optional[Morph]], str],
+               correct_particle: Optional[Callable[[str, str], str]] = None) -> list[str]:
+        """숫자 자리를 채운 어절별 출력"""
+        outputs = self.outputs[:]
+        readings = []
+        for (k, prev, nxt), number in zip(self.slots, numbers):
+            outputs[k] = read_number(int(number), prev, nxt)
+            readings.append(outputs[k])
+        if correct_particle is not None:
+            for slot, k, term in self.particles:
+                outputs[k] = correct_particle(readings[slot], term)
+        ends = self.starts[1:] + [len(outputs)]
+        return [''.join(outputs[a:b]) for a, b in zip(self.starts, ends)]
+
+
+class TemplateCache:
+    """숫자 마스킹 키 기반 LRU 캐시"""
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def get(self, key) -> Optional[Template]:
+        with self._lock:
+            template = self._entries.get(key)
+            if template is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return template
+
+    def put(self, key, template: Template):
+        with self._lock:
+            self._entries[key] = template
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+def build_template(sentence: str, lattice: TokenLattice,
+                   is_particle: Optional[Callable[[Morph], bool]] = None) -> Optional[Template]:
+    """
+    trans_bundle을 마친 lattice로 템플릿을 만듭니다.
+    Mecab이 숫자 연속열을 그대로 하나의 토큰으로 내지 않은 경우 등
+    숫자 자리가 원문 숫자와 1:1로 대응하지 않으면 None (캐시하지 않음).
+    is_particle: 숫자 바로 뒤에 오면 render에서 다시 계산할 조사인지 판정하는 함수
+    """
+    numbers = digit_runs(sentence)
+    outputs = lattice.outputs[:]
+    slots = []
+    particles = []
+    last_slot = None
+    for k, surface in enumerate(lattice.surfaces):
+        if surface.isdecimal():
+            prev, nxt = lattice.context(k)
+            slots.append((k, prev, nxt))
+            outputs[k] = None
+            last_slot = len(slots) - 1
+            continue
+        if last_slot is not None and is_particle is not None and is_particle(lattice.morphs[k]):
+            particles.append((last_slot, k, surface))
+        last_slot = None
+
+    if [lattice.surfaces[k] for k, _, _ in slots] != numbers:
+        return None
+    return Template(outputs, list(lattice.starts), slots, particles)
@@ -7,12 +7,15 @@
 
 import json
 import os
+import sys
 from tqdm import tqdm
-from g2p_en import G2p
 import wordninja
 
-# G2P 모델 초기화
-g2p = G2p()
+# 추론 파이프라인과 같은 G2P(CMUdict 우선 + 캐시)를 사용
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from g2p_fast import get_g2p
+
+g2p = get_g2p()
 
 
 def split_compound_word(word: str) -> list[str]:
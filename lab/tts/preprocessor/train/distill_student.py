@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ByT5 교사 모델 → 소형 seq2seq 학생 모델 증류 스크립트
+
+1. label: 교사 모델(byt5-arpabet2kor)로 큰 단어 목록의 ARPABET을 한글로 변환해 라벨을 만듭니다.
+   - training_arpabet.json의 입력 (test_data_arpabet.json에 있는 입력은 제외)
+   - --words로 준 영어 단어 목록 (한 줄에 한 단어, G2P로 ARPABET 변환)
+   결과는 distill_labels.json (JSON lines)에 이어 쓰므로 중단 후 다시 실행하면 이어서 라벨링합니다.
+2. train: 라벨로 학생 모델(student_model.StudentSeq2Seq, 수백만 파라미터)을 CPU에서 학습합니다.
+   검증 세트 exact match가 가장 높은 모델을 models/student-arpabet2kor에 저장합니다.
+
+교사와의 정확도/지연 시간 비교는 ../bench_student.py 참고.
+
+사용 방법:
+    python distill_student.py label --words ./words.txt
+    python distill_student.py train --epochs 20
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import torch
+from torch import nn
+from tqdm import tqdm
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from batching import bucketed_batches
+from student_model import (
+    BOS, PAD, StudentSeq2Seq, Vocab, pad_batch, save_student, tokenize_arpabet, tokenize_korean,
+)
+
+# ========== 설정 ==========
+TEACHER_MODEL_PATH = "./models/byt5-arpabet2kor"
+DATA_PATH = "./training_arpabet.json"
+TEST_PATH = "./test_data_arpabet.json"
+LABELS_PATH = "./distill_labels.json"
+OUTPUT_DIR = "./models/student-arpabet2kor"
+
+# 교사 라벨링 (resources.TRANSLITERATION_KWARGS와 같은 생성 파라미터)
+TEACHER_NUM_BEAMS = 4
+TEACHER_BATCH_SIZE = 64
+LABEL_CHUNK_SIZE = 2048
+
+# 학생 모델 / 학습 하이퍼파라미터
+EMB_DIM = 128
+HIDDEN_DIM = 256
+DROPOUT = 0.1
+LEARNING_RATE = 2e-3
+BATCH_SIZE = 128
+NUM_EPOCHS = 20
+LABEL_SMOOTHING = 0.1
+MAX_GRAD_NORM = 1.0
+MAX_TARGET_LENGTH = 64
+VAL_RATIO = 0.05
+
+
+def load_test_inputs(path: str) -> set[str]:
+    inputs = set()
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                inputs.add(json.loads(line)["input_text"])
+    return inputs
+
+
+def load_labels(path: str) -> list[dict]:
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def collect_inputs(words_path: str = None) -> list[str]:
+    """라벨링할 ARPABET 입력 목록 (held-out 테스트 입력 제외)"""
+    with open(DATA_PATH, 'r', encoding='utf-8') as f:
+        inputs = [example["input_text"] for example in json.load(f)]
+
+    if words_path:
+        from g2p_fast import word_to_arpabet
+        with open(words_path, 'r', encoding='utf-8') as f:
+            words = [line.strip().lower() for line in f if line.strip()]
+        print(f"G2P: {len(words)} words")
+        inputs.extend(word_to_arpabet(word) for word in tqdm(words, desc="G2P"))
+
+    test_inputs = load_test_inputs(TEST_PATH)
+    return [text for text in dict.fromkeys(inputs) if text and text not in test_inputs]
+
+
+def label(args):
+    from inference_arpabet_pipeline import Eng2KorTransliteratorPipeline
+
+    inputs = collect_inputs(args.words)
+    done = {row["input_text"] for row in load_labels(LABELS_PATH)}
+    todo = [text for text in inputs if text not in done]
+    print(f"Inputs: {len(inputs)}, labelled: {len(done)}, todo: {len(todo)}")
+    if not todo:
+        return
+
+    teacher = Eng2KorTransliteratorPipeline(TEACHER_MODEL_PATH, use_compound_split=False)
+    with open(LABELS_PATH, 'a', encoding='utf-8') as f:
+        for i in tqdm(range(0, len(todo), LABEL_CHUNK_SIZE), desc="Labelling"):
+            chunk = todo[i:i + LABEL_CHUNK_SIZE]
+            outputs = teacher.arpabet_to_korean_batch(
+                chunk, num_beams=TEACHER_NUM_BEAMS, max_length=MAX_TARGET_LENGTH, batch_size=TEACHER_BATCH_SIZE
+            )
+            for text, korean in zip(chunk, outputs):
+                f.write(json.dumps({"input_text": text, "target_text": korean}, ensure_ascii=False) + "\n")
+            f.flush()
+
+
+def make_batches(examples: list[tuple[list[int], list[int]]], batch_size: int, shuffle: bool) -> list[list[int]]:
+    """입력 길이가 비슷한 것끼리 묶은 배치 (배치 순서는 섞음)"""
+    batches = bucketed_batches([len(src) for src, _ in examples], batch_size)
+    if shuffle:
+        random.shuffle(batches)
+    return batches
+
+
+def exact_match(model, examples, tgt_vocab: Vocab, batch_size: int) -> float:
+    model.eval()
+    correct = 0
+    with torch.inference_mode():
+        for batch in make_batches(examples, batch_size, shuffle=False):
+            src, src_mask = pad_batch([examples[i][0] for i in batch])
+            outputs = model.greedy(src, src_mask, MAX_TARGET_LENGTH)
+            for i, ids in zip(batch, outputs):
+                correct += tgt_vocab.decode(ids) == tgt_vocab.decode(examples[i][1])
+    return correct / len(examples)
+
+
+def train(args):
+    torch.manual_seed(42)
+    random.seed(42)
+
+    rows = [row for row in load_labels(LABELS_PATH) if row["target_text"]]
+    if not rows:
+        print("라벨이 없습니다. 먼저 실행하세요: python distill_student.py label")
+        return
+    random.shuffle(rows)
+    print(f"Labels: {len(rows)}")
+
+    src_vocab = Vocab.build(tokenize_arpabet(row["input_text"]) for row in rows)
+    tgt_vocab = Vocab.build(tokenize_korean(row["target_text"]) for row in rows)
+    examples = [
+        (src_vocab.encode(tokenize_arpabet(row["input_text"])),
+         tgt_vocab.encode(tokenize_korean(row["target_text"])))
+        for row in rows
+    ]
+    n_val = max(1, int(len(examples) * VAL_RATIO))
+    val_examples, train_examples = examples[:n_val], examples[n_val:]
+    print(f"Vocab: src {len(src_vocab)}, tgt {len(tgt_vocab)} / Train: {len(train_examples)}, Val: {len(val_examples)}")
+
+    config = {"emb_dim": EMB_DIM, "hidden_dim": HIDDEN_DIM, "dropout": DROPOUT}
+    model = StudentSeq2Seq(len(src_vocab), len(tgt_vocab), **config)
+    print(f"Model parameters: {sum(p.numel() for p in model.parameters()):,}")
+
+    optimizer = torch.optim.Adam(model.parameters(), lr=LEARNING_RATE)
+    scheduler = torch.optim.lr_scheduler.ReduceLROnPlateau(optimizer, mode="max", factor=0.5, patience=1)
+    criterion = nn.CrossEntropyLoss(ignore_index=PAD, label_smoothing=LABEL_SMOOTHING)
+
+    best = -1.0
+    for epoch in range(1, args.epochs + 1):
+        model.train()
+        start = time.perf_counter()
+        total_loss = 0.0
+        batches = make_batches(train_examples, BATCH_SIZE, shuffle=True)
+        for batch in tqdm(batches, desc=f"Epoch {epoch}", leave=False):
+            src, src_mask = pad_batch([train_examples[i][0] for i in batch])
+            tgt, _ = pad_batch([train_examples[i][1] for i in batch])
+            tgt_in = torch.cat([tgt.new_full((tgt.size(0), 1), BOS), tgt[:, :-1]], dim=1)
+
+            logits = model(src, src_mask, tgt_in)
+            loss = criterion(logits.reshape(-1, logits.size(-1)), tgt.reshape(-1))
+
+            optimizer.zero_grad()
+            loss.backward()
+            nn.utils.clip_grad_norm_(model.parameters(), MAX_GRAD_NORM)
+            optimizer.step()
+            total_loss += loss.item()
+
+        accuracy = exact_match(model, val_examples, tgt_vocab, BATCH_SIZE)
+        scheduler.step(accuracy)
+        print(f"Epoch {epoch}: loss {total_loss / len(batches):.4f}, val exact match {accuracy:.2%}, "
+              f"{time.perf_counter() - start:.0f}s")
+
+        if accuracy > best:
+            best = accuracy
+            save_student(model, src_vocab, tgt_vocab, config, OUTPUT_DIR)
+            print(f"  saved: {OUTPUT_DIR}")
+
+    print("=" * 60)
+    print(f"Best val exact match (vs teacher): {best:.2%}")
+    print(f"Model saved to: {OUTPUT_DIR}")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ByT5 → 소형 학생 모델 증류")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    label_parser = subparsers.add_parser("label", help="교사 모델로 라벨 생성")
+    label_parser.add_argument("--words", default=None, help="추가 영어 단어 목록 파일 (한 줄에 한 단어)")
+
+    train_parser = subparsers.add_parser("train", help="학생 모델 학습 (CPU)")
+    train_parser.add_argument("--epochs", type=int, default=NUM_EPOCHS)
+    train_parser.add_argument("--threads", type=int, default=None, help="torch intra-op 스레드 수")
+
+    args = parser.parse_args()
+    if getattr(args, "threads", None):
+        torch.set_num_threads(args.threads)
+
+    if args.command == "label":
+        label(args)
+    else:
+        train(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+음차 변환 마이크로 배칭 서버 (in-process asyncio 컴포넌트)
+
+요청마다 한두 단어씩 pipeline.transliterate를 부르면 모델이 batch 1로만 돌아갑니다.
+TransliterationServer는 요청을 큐에 모았다가
+    - 모인 (중복 제거한) 단어 수가 max_batch_size에 도달하거나
+    - 첫 요청이 들어온 뒤 max_wait_ms가 지나면
+한 번에 pipeline.transliterate_batch(패딩 배치 generate)로 변환합니다.
+모델 호출은 전용 worker 스레드 하나에서 실행하므로 이벤트 루프를 막지 않습니다.
+
+사용 예:
+    server = TransliterationServer(max_batch_size=32, max_wait_ms=5)
+    await server.start()
+    korean = await server.transliterate("strawberry")
+    print(server.stats())
+    await server.stop()
+
+데모 (동시 요청 시뮬레이션):
+    python translit_server.py --requests 1000 --concurrency 64
+"""
+import argparse
+import asyncio
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+
+LATENCY_WINDOW = 10000
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class TransliterationServer:
+    def __init__(self, pipeline=None, max_batch_size: int = 32, max_wait_ms: float = 5.0,
+                 transliterate_kwargs: Optional[dict] = None):
+        """
+        Args:
+            pipeline: transliterate_batch(words, **kwargs)를 가진 파이프라인
+                      (None이면 resources.get_transliterator_pipeline())
+            max_batch_size: 한 번에 변환할 최대 (중복 제거 후) 단어 수
+            max_wait_ms: 첫 요청 이후 배치를 채우기 위해 기다리는 최대 시간
+            transliterate_kwargs: 생성 파라미터 (None이면 resources.TRANSLITERATION_KWARGS)
+        """
+        if transliterate_kwargs is None:
+            from resources import TRANSLITERATION_KWARGS
+            transliterate_kwargs = TRANSLITERATION_KWARGS
+        self.pipeline = pipeline
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.transliterate_kwargs = dict(transliterate_kwargs)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        # 큐에서 꺼냈지만 아직 결과를 받지 못한 요청 (stop()에서 취소)
+        self._in_flight: list[tuple] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.requests = 0
+        self.batches = 0
+        self.deduplicated = 0
+        self.batch_sizes = Counter()
+        self.queue_depths = Counter()
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    async def start(self):
+        if self._batcher is not None:
+            return
+        if self._executor is None:
+            # 모델은 스레드 안전하지 않으므로 worker 하나에서만 실행
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="translit-worker")
+        if self.pipeline is None:
+            from resources import get_transliterator_pipeline
+            loop = asyncio.get_running_loop()
+            self.pipeline = await loop.run_in_executor(self._executor, get_transliterator_pipeline)
+            if self.pipeline is None:
+                raise RuntimeError("음차 변환 파이프라인을 로드할 수 없습니다.")
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._batch_loop())
+
+    async def stop(self):
+        if self._batcher is None:
+            return
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+        self._batcher = None
+        # 모으는 중이거나 변환 중이던 요청과 큐에 남은 요청은 취소
+        pending = self._in_flight
+        self._in_flight = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for _, future, _ in pending:
+            if not future.done():
+                future.cancel()
+        # 실행 중인 배치가 끝날 때까지 이벤트 루프를 막지 않고 기다림 (다시 start() 가능)
+        executor, self._executor = self._executor, None
+        await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+    async def transliterate(self, word: str) -> str:
+        if self._batcher is None:
+            raise RuntimeError("start()를 먼저 호출하세요.")
+        future = asyncio.get_running_loop().create_future()
+        self.requests += 1
+        await self._queue.put((word, future, time.perf_counter()))
+        return await future
+
+    async def transliterate_many(self, words: list[str]) -> list[str]:
+        return list(await asyncio.gather(*(self.transliterate(word) for word in words)))
+
+    async def _collect(self) -> list[tuple]:
+        """첫 요청을 기다린 뒤 max_batch_size 또는 max_wait까지 요청을 모읍니다."""
+        first = await self._queue.get()
+        items = self._in_flight
+        items.append(first)
+        words = {first[0]}
+        deadline = time.perf_counter() + self.max_wait
+
+        while len(words) < self.max_batch_size:
+            # 이미 큐에 있는 요청은 기다리지 않고 가져옴
+            if not self._queue.empty():
+                item = self._queue.get_nowait()
+            else:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            items.append(item)
+            words.add(item[0])
+        return list(items)
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            items = await self._collect()
+            self.queue_depths[self._queue.qsize()] += 1
+
+            # 같은 단어는 한 번만 변환
+            waiting: dict[str, list] = {}
+            for word, future, enqueued in items:
+                waiting.setdefault(word, []).append((future, enqueued))
+            words = list(waiting)
+            self.batches += 1
+            self.batch_sizes[len(words)] += 1
+            self.deduplicated += len(items) - len(words)
+
+            try:
+                results = await loop.run_in_executor(self._executor, self._run_batch, words)
+            except Exception as e:
+                for futures in waiting.values():
+                    for future, _ in futures:
+                        if not future.done():
+                            future.set_exception(e)
+                self._in_flight.clear()
+                continue
+
+            now = time.perf_counter()
+            for word, result in zip(words, results):
+                for future, enqueued in waiting[word]:
+                    if not future.done():
+                        future.set_result(result)
+                        self.latencies.append(now - enqueued)
+            self._in_flight.clear()
+
+    def _run_batch(self, words: list[str]) -> list[str]:
+        return self.pipeline.transliterate_batch(
+            words, batch_size=self.max_batch_size, **self.transliterate_kwargs
+        )
+
+    def stats(self) -> dict:
+        latencies = list(self.latencies)
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "deduplicated": self.deduplicated,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "mean_batch_size": (sum(k * v for k, v in self.batch_sizes.items()) / self.batches
+                                if self.batches else 0.0),
+            "batch_size_histogram": dict(sorted(self.batch_sizes.items())),
+            "queue_depth_histogram": dict(sorted(self.queue_depths.items())),
+            "latency_p50_ms": percentile(latencies, 50) * 1000,
+            "latency_p99_ms": percentile(latencies, 99) * 1000,
+        }
+
+
+async def _simulate(args):
+    from demo_transliterator import TEST_CASES
+    import random
+
+    server = TransliterationServer(max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms)
+    await server.start()
+
+    rng = random.Random(42)
+    words = [rng.choice(TEST_CASES) for _ in range(args.requests)]
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def caller(word):
+        async with semaphore:
+            return await server.transliterate(word)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller(word) for word in words))
+    elapsed = time.perf_counter() - start
+
+    stats = server.stats()
+    await server.stop()
+
+    print("=" * 70)
+    print(f"requests: {args.requests}, concurrency: {args.concurrency}, "
+          f"max_batch_size: {args.max_batch_size}, max_wait_ms: {args.max_wait_ms}")
+    print(f"throughput: {args.requests / elapsed:.1f} words/s ({elapsed:.2f}s)")
+    for key, value in stats.items():
+        print(f"{key:24} {value}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="음차 변환 마이크로 배칭 서버 데모")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    asyncio.run(_simulate(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
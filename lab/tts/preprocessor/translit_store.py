@@ -0,0 +1,208 @@
+"""
+모델 음차 변환 결과를 로컬 디스크(SQLite)에 영구 저장하는 모듈
+
+- 키: (소문자 단어, 모델 식별자, 생성 파라미터)
+- WAL 모드라 여러 프로세스가 동시에 읽을 수 있음
+- 쓰기는 백그라운드 스레드가 모아서 한 트랜잭션으로 처리 (hot path에서는 큐에 넣기만 함)
+- max_entries를 넘으면 오래 전에 저장된 항목부터 삭제
+
+프로세스를 재시작해도 한 번 변환한 단어는 모델을 다시 거치지 않습니다.
+"""
+import atexit
+import hashlib
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transliterations (
+    term TEXT NOT NULL,
+    model TEXT NOT NULL,
+    params TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (term, model, params)
+)
+"""
+_CREATED_INDEX = "CREATE INDEX IF NOT EXISTS idx_transliterations_created ON transliterations (created_at)"
+
+# 쓰기 큐 종료 신호 (flush 신호는 threading.Event)
+_CLOSE = object()
+
+
+def model_fingerprint(model_path: str | Path) -> str:
+    """
+    모델 디렉토리의 식별자를 만듭니다.
+    디렉토리 이름 + 파일들의 (이름, 크기, 수정 시각) 해시라서 재학습/교체되면 값이 바뀝니다.
+    """
+    model_path = Path(model_path)
+    digest = hashlib.sha1()
+    for file_path in sorted(model_path.glob('*')):
+        if not file_path.is_file():
+            continue
+        stat = file_path.stat()
+        digest.update(f"{file_path.name}:{stat.st_size}:{stat.st_mtime_ns};".encode('utf-8'))
+    return f"{model_path.name}-{digest.hexdigest()[:12]}"
+
+
+def format_params(**params) -> str:
+    """생성 파라미터를 키 문자열로 변환 (예: max_length=64,num_beams=4)"""
+    return ','.join(f"{k}={params[k]}" for k in sorted(params))
+
+
+class TransliterationStore:
+    """모델 음차 변환 결과 영구 저장소"""
+    def __init__(
+        self,
+        path: str | Path,
+        model_id: str,
+        max_entries: int = 200_000,
+        flush_size: int = 64,
+        flush_interval: float = 1.0
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            model_id: 모델 식별자 (model_fingerprint 결과 등)
+            max_entries: 최대 저장 개수 (넘으면 오래된 항목부터 삭제)
+            flush_size: 이만큼 쌓이면 바로 기록
+            flush_interval: 쌓인 게 적어도 이 시간(초)마다 기록
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.model_id = model_id
+        self.max_entries = max_entries
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+
+        self._local = threading.local()
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(_SCHEMA)
+        conn.execute(_CREATED_INDEX)
+        conn.commit()
+
+        self._writer = threading.Thread(target=self._write_loop, name="translit-store-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 연결은 스레드 간 공유하지 않으므로 스레드마다 하나씩 생성
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA busy_timeout=30000")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, term: str, params: str = "") -> str | None:
+        row = self._connect().execute(
+            "SELECT result FROM transliterations WHERE term = ? AND model = ? AND params = ?",
+            (term.lower(), self.model_id, params)
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def get_many(self, terms: list[str], params: str = "") -> dict[str, str]:
+        """여러 단어를 한 번에 조회합니다. 반환 dict의 키는 소문자 단어."""
+        keys = sorted({term.lower() for term in terms})
+        found = {}
+        conn = self._connect()
+        # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rows = conn.execute(
+                f"SELECT term, result FROM transliterations "
+                f"WHERE model = ? AND params = ? AND term IN ({placeholders})",
+                (self.model_id, params, *chunk)
+            ).fetchall()
+            found.update(rows)
+        return found
+
+    def put(self, term: str, result: str, params: str = ""):
+        """결과를 쓰기 큐에 넣습니다. 실제 기록은 백그라운드 스레드가 수행."""
+        if self._closed:
+            return
+        self._queue.put((term.lower(), self.model_id, params, result, time.time()))
+
+    def _write_loop(self):
+        pending = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = False
+
+            if item is _CLOSE:
+                # 남은 것 기록 후 종료
+                self._write(pending)
+                return
+            if isinstance(item, threading.Event):
+                # flush() 신호: 지금까지 쌓인 것을 바로 기록
+                self._write(pending)
+                pending = []
+                deadline = None
+                item.set()
+                continue
+            if item:
+                pending.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            if pending and (len(pending) >= self.flush_size or time.monotonic() >= deadline):
+                self._write(pending)
+                pending = []
+                deadline = None
+
+    def _write(self, rows: list[tuple]):
+        if not rows:
+            return
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO transliterations (term, model, params, result, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._evict(conn)
+        except sqlite3.Error as e:
+            print(f"경고: 음차 변환 결과 저장 실패: {e}")
+
+    def _evict(self, conn: sqlite3.Connection):
+        count = conn.execute("SELECT COUNT(*) FROM transliterations").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM transliterations WHERE rowid IN "
+                "(SELECT rowid FROM transliterations ORDER BY created_at LIMIT ?)",
+                (overflow,)
+            )
+
+    def flush(self, timeout: float = 10.0):
+        """큐에 쌓인 결과가 모두 기록될 때까지 대기합니다."""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self, timeout: float = 10.0):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_CLOSE)
+        self._writer.join(timeout)
+
+    def __len__(self) -> int:
+        return self._connect().execute(
+            "SELECT COUNT(*) FROM transliterations WHERE model = ?", (self.model_id,)
+        ).fetchone()[0]